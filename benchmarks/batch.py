@@ -0,0 +1,62 @@
+"""
+Compare the vectorized NumPy evaluator against the per-knight walk
+
+Run from the repository root:
+    python -m benchmarks.batch
+"""
+import time
+import numpy as np
+from src.batch import random_genes, repair_batch
+from src.board import DEFAULT_BOARD
+from src.chromosome import Chromosome
+from src.knight import Knight
+
+
+def check_replay(genes, fitness, samples=200):
+    """
+    Replaying repaired genes with Knight.check_moves must give the same fitness
+    """
+    for row in range(min(samples, len(genes))):
+        knight = Knight(Chromosome(genes[row].tolist()))
+        knight.check_moves()
+        if knight.evaluate_fitness() != fitness[row]:
+            raise AssertionError(f"Row {row}: batched walk is not a valid repair")
+
+
+def main(sizes=(100, 1000, 10000, 100000), serial_limit=10000, seed=42):
+    rng = np.random.default_rng(seed)
+
+    print("=" * 60)
+    print("Batched evaluation benchmark")
+    print("=" * 60)
+    print(f"{'knights':>8} | {'serial (s)':>10} | {'batch (s)':>10} | {'speedup':>8}")
+
+    for size in sizes:
+        genes = random_genes(size, rng=rng)
+
+        serial_time = None
+        if size <= serial_limit:
+            knights = [Knight(Chromosome(row)) for row in genes.tolist()]
+            start = time.perf_counter()
+            for knight in knights:
+                knight.check_moves()
+                knight.evaluate_fitness()
+            serial_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        fitness = repair_batch(genes, DEFAULT_BOARD.neighbours, rng=rng)
+        batch_time = time.perf_counter() - start
+
+        check_replay(genes, fitness)
+
+        if serial_time is None:
+            print(f"{size:8d} | {'-':>10} | {batch_time:10.4f} | {'-':>8}")
+        else:
+            print(f"{size:8d} | {serial_time:10.4f} | {batch_time:10.4f} | "
+                  f"{serial_time / batch_time:7.1f}x")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""
+Scaling of the GA with board size
+
+For every board: generations to a full tour (or best fitness within the
+generation limit), time per generation and time per walked step. With the
+precomputed neighbour tables the per-step cost should stay flat.
+
+Run from the repository root:
+    python -m benchmarks.boards
+"""
+import random
+import time
+from src.board import Board
+from src.population import Population
+
+BOARDS = [(5, 5), (6, 6), (8, 8), (10, 10), (16, 16), (32, 32), (8, 16)]
+
+
+def run(board, population_size, max_generations, seed):
+    """
+    Evolve on one board until solved or out of generations
+
+    Returns:
+        Dictionary with generations, best fitness, seconds per generation
+        and microseconds per walked step
+    """
+    random.seed(seed)
+    population = Population(population_size, board=board, prefix_cache=True)
+
+    steps = 0
+    start = time.perf_counter()
+
+    while True:
+        population.check_population()
+        best, _ = population.evaluate()
+        steps += sum(len(k.path) for k in population.knights)
+
+        if best == board.size or population.generation >= max_generations:
+            break
+        population.create_new_generation()
+
+    elapsed = time.perf_counter() - start
+    return {
+        'generations': population.generation,
+        'best': best,
+        'solved': best == board.size,
+        'generation_ms': elapsed / population.generation * 1e3,
+        'step_us': elapsed / steps * 1e6,
+    }
+
+
+def main(population_size=50, max_generations=300, seed=42):
+    print("=" * 72)
+    print(f"Board scaling benchmark ({population_size} knights, "
+          f"max {max_generations} generations, seed {seed})")
+    print("=" * 72)
+    print(f"{'board':>7} | {'generations':>11} | {'best':>11} | "
+          f"{'ms/generation':>13} | {'us/step':>8}")
+
+    for rows, cols in BOARDS:
+        board = Board(rows, cols)
+        result = run(board, population_size, max_generations, seed)
+        best = f"{result['best']}/{board.size}" + (" *" if result['solved'] else "")
+        print(f"{rows:>3}x{cols:<3} | {result['generations']:11d} | {best:>11} | "
+              f"{result['generation_ms']:13.2f} | {result['step_us']:8.3f}")
+
+    print("* = full tour found")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
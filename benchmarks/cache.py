@@ -0,0 +1,69 @@
+"""
+Measure what the fitness cache saves on duplicate chromosomes
+
+Runs the same seeded evolution without and with the fitness cache (at
+several mutation rates, since low rates converge to more duplicates),
+checks that both give identical results and compares evaluation time.
+
+Run from the repository root:
+    python -m benchmarks.cache
+"""
+import random
+import time
+from src.population import Population
+
+
+def run(fitness_cache, population_size, generations, seed, mutation_rate):
+    """
+    Evolve for a fixed number of generations
+
+    Returns:
+        Tuple (per-generation (best, avg) history, check_population seconds,
+               cache statistics or None)
+    """
+    random.seed(seed)
+    population = Population(population_size, fitness_cache=fitness_cache,
+                            mutation_rate=mutation_rate)
+
+    history = []
+    check_time = 0.0
+
+    for _ in range(generations):
+        start = time.perf_counter()
+        population.check_population()
+        check_time += time.perf_counter() - start
+
+        best, _ = population.evaluate()
+        history.append((best, population.get_statistics()['avg']))
+        population.create_new_generation()
+
+    stats = population.cache.stats() if population.cache is not None else None
+    return history, check_time, stats
+
+
+def main(population_size=200, generations=300, seed=42, cache_bytes=16 * 1024 * 1024):
+    print("=" * 72)
+    print(f"Fitness cache benchmark ({population_size} knights, "
+          f"{generations} generations, seed {seed}, {cache_bytes >> 20} MB cap)")
+    print("=" * 72)
+    print(f"{'mutation':>8} | {'plain s':>8} | {'cached s':>8} | {'speedup':>7} | "
+          f"{'hit rate':>8} | {'entries':>7} | {'evictions':>9}")
+
+    for mutation_rate in (0.001, 0.01, 0.05):
+        plain = run(0, population_size, generations, seed, mutation_rate)
+        cached = run(cache_bytes, population_size, generations, seed, mutation_rate)
+
+        if plain[0] != cached[0]:
+            raise AssertionError("The fitness cache changed the evolution")
+
+        stats = cached[2]
+        print(f"{mutation_rate:8.3f} | {plain[1]:8.3f} | {cached[1]:8.3f} | "
+              f"{plain[1] / cached[1]:6.2f}x | {stats['hit_rate']:8.1%} | "
+              f"{stats['entries']:7d} | {stats['evictions']:9d}")
+
+    print("Times are check_population only; results are identical in both runs")
+    print("=" * 72)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""
+Per-pair Chromosome crossover/mutation vs vectorized operators
+
+Times breeding one whole generation from given parent pairs: the
+Chromosome methods called once per pair vs crossover_batch and
+mutate_batch on the (N, L) gene matrix.
+
+Run from the repository root:
+    python -m benchmarks.operators
+"""
+import random
+import time
+import numpy as np
+from src.chromosome import Chromosome
+from src.operators import CROSSOVER_METHODS, crossover_batch, mutate_batch
+
+SIZES = (1000, 10000, 100000)
+LENGTH = 63
+
+
+def best_time(operation, repeat=3):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(seed=42, rate=0.01):
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+
+    print("=" * 78)
+    print(f"Operator benchmark (one generation, mutation rate {rate}, best of 3)")
+    print("=" * 78)
+    print(f"{'knights':>8} | {'per-pair ms':>11} | " +
+          " | ".join(f"{name + ' ms':>14}" for name in CROSSOVER_METHODS) +
+          f" | {'speedup':>7}")
+
+    for size in SIZES:
+        genes = rng.integers(1, 9, size=(size, LENGTH), dtype=np.uint8)
+        children = np.empty_like(genes)
+        parents = rng.integers(0, size, size=(size // 2, 2))
+
+        buffer, child_buffer = bytearray(genes.tobytes()), bytearray(size * LENGTH)
+        chromosomes = [Chromosome.view(memoryview(buffer)[i * LENGTH:(i + 1) * LENGTH])
+                       for i in range(size)]
+        offspring = [Chromosome.view(memoryview(child_buffer)[i * LENGTH:(i + 1) * LENGTH])
+                     for i in range(size)]
+        pairs = parents.tolist()
+
+        def per_pair():
+            for i, (first, second) in enumerate(pairs):
+                child1, child2 = offspring[2 * i], offspring[2 * i + 1]
+                chromosomes[first].crossover(chromosomes[second], child1, child2)
+                child1.mutation(rate)
+                child2.mutation(rate)
+
+        def batched(method):
+            crossover_batch(genes, parents[:, 0], parents[:, 1], children, method, rng)
+            mutate_batch(children, rate, rng)
+
+        legacy = best_time(per_pair)
+        vectorized = {method: best_time(lambda method=method: batched(method))
+                      for method in CROSSOVER_METHODS}
+
+        print(f"{size:8d} | {legacy * 1e3:11.2f} | " +
+              " | ".join(f"{seconds * 1e3:14.2f}" for seconds in vectorized.values()) +
+              f" | {legacy / vectorized['one_point']:6.1f}x")
+
+    print("Speedup: per-pair single-point vs vectorized one_point")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,55 @@
+"""
+Speedup curve of process-pool evaluation against the serial path
+
+Run from the repository root:
+    python -m benchmarks.parallel [workers]
+"""
+import os
+import random
+import sys
+import time
+from src.chromosome import Chromosome
+from src.knight import Knight
+from src.parallel import ParallelEvaluator
+
+
+def main(workers=None, sizes=(50, 500, 5000, 50000), repeats=3, seed=42):
+    workers = workers or os.cpu_count()
+    random.seed(seed)
+
+    print("=" * 60)
+    print(f"Parallel evaluation benchmark ({workers} workers)")
+    print("=" * 60)
+    print(f"{'knights':>8} | {'serial (s)':>10} | {'pool (s)':>10} | {'speedup':>8}")
+
+    with ParallelEvaluator(workers) as evaluator:
+        # Warm the pool so process start-up is not part of the timings:
+        # one shard per worker slot, so every worker has started
+        shards = evaluator.workers * evaluator.shards_per_worker
+        evaluator.evaluate(bytes(gene for _ in range(shards) for gene in Chromosome().genes))
+
+        for size in sizes:
+            chromosomes = [Chromosome() for _ in range(size)]
+            packed = bytes(gene for c in chromosomes for gene in c.genes)
+
+            serial_time = float('inf')
+            pool_time = float('inf')
+            for _ in range(repeats):
+                knights = [Knight(Chromosome(c.genes)) for c in chromosomes]
+                start = time.perf_counter()
+                for knight in knights:
+                    knight.check_moves()
+                serial_time = min(serial_time, time.perf_counter() - start)
+
+                start = time.perf_counter()
+                evaluator.evaluate(packed)
+                pool_time = min(pool_time, time.perf_counter() - start)
+
+            print(f"{size:8d} | {serial_time:10.4f} | {pool_time:10.4f} | "
+                  f"{serial_time / pool_time:7.2f}x")
+
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else None)
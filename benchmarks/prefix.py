@@ -0,0 +1,72 @@
+"""
+Measure how much walking the crossover prefix cache saves
+
+Runs the same seeded evolution with and without prefix caching, checks
+that both give identical results and compares evaluation work.
+
+Run from the repository root:
+    python -m benchmarks.prefix
+"""
+import random
+import time
+from src.population import Population
+
+
+def run(prefix_cache, population_size, generations, seed):
+    """
+    Evolve for a fixed number of generations
+
+    Returns:
+        Tuple (per-generation (best, avg) history, check_population seconds,
+               genes walked, genes skipped by resuming)
+    """
+    random.seed(seed)
+    population = Population(population_size, prefix_cache=prefix_cache)
+
+    history = []
+    check_time = 0.0
+    walked = skipped = 0
+
+    for _ in range(generations):
+        # Steps each child will skip by resuming from its parent
+        for knight in population.knights:
+            parent = knight.parent
+            if parent is not None and parent.masks is not None:
+                skipped += min(knight.resume_step, len(parent.squares) - 1)
+
+        start = time.perf_counter()
+        population.check_population()
+        check_time += time.perf_counter() - start
+
+        best, _ = population.evaluate()
+        history.append((best, population.get_statistics()['avg']))
+        walked += sum(len(k.path) for k in population.knights)
+
+        population.create_new_generation()
+
+    return history, check_time, walked - skipped, skipped
+
+
+def main(population_size=200, generations=300, seed=42):
+    plain = run(False, population_size, generations, seed)
+    cached = run(True, population_size, generations, seed)
+
+    if plain[0] != cached[0]:
+        raise AssertionError("Prefix caching changed the evolution")
+
+    print("=" * 60)
+    print(f"Prefix cache benchmark ({population_size} knights, "
+          f"{generations} generations, seed {seed})")
+    print("=" * 60)
+    print(f"Final best fitness: {plain[0][-1][0]}/64 (identical in both runs)")
+    print(f"Without cache: {plain[1]:7.3f} s in check_population, "
+          f"{plain[2]} steps walked")
+    print(f"With cache:    {cached[1]:7.3f} s in check_population, "
+          f"{cached[2]} steps walked ({cached[3]} resumed)")
+    print(f"Walk work saved: {cached[3] / (cached[2] + cached[3]) * 100:5.1f}%")
+    print(f"Speedup:         {plain[1] / cached[1]:5.2f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+Headless batch rendering throughput
+
+Renders a batch of 8x8 (Warnsdorff) tours offscreen with src.render on
+one worker and on all CPUs: final-board PNGs only, and with an animated
+GIF per tour when Pillow is installed. Also times one GIF written the
+straightforward way (every frame quantized on its own, Pillow's
+optimize pass) against render_tour's shared palette and own frame
+diffing.
+
+Run from the repository root:
+    python -m benchmarks.render
+"""
+import os
+import tempfile
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.board import Board
+from src.chromosome import Chromosome
+from src.knight import Knight
+from src.render import render_tour, render_tours, tour_knight
+from src.repair import warnsdorff_genes
+from src.visualizer import KnightTourVisualizer
+
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+
+def make_tours(count):
+    """
+    Returns:
+        List of `count` tour records, one per start square (cycling)
+    """
+    tours = []
+    for index in range(count):
+        start = divmod(index % 64, 8)
+        board = Board(8, 8, start)
+        genes = warnsdorff_genes(board.neighbours, board.start_square, board.gene_length)
+        knight = Knight(Chromosome(genes), board)
+        knight.check_moves()
+        tours.append({'board': [8, 8], 'start': list(start),
+                      'path': [list(square) for square in knight.path]})
+    return tours
+
+
+def naive_gif(tour, gif_path):
+    """
+    One GIF the straightforward way: every frame quantized on its own,
+    diffing left to Pillow's optimize pass
+
+    Returns:
+        Seconds taken
+    """
+    start = time.perf_counter()
+    visualizer = KnightTourVisualizer(tour_knight(tour), offscreen=True)
+    visualizer.banner_dismissed = True
+    screen = visualizer.screen
+    frames = []
+    for step in range(len(tour['path'])):
+        if step:
+            visualizer.next_step()
+        visualizer.draw_frame(advance=0)
+        frame = Image.frombytes('RGB', screen.get_size(), pygame.image.tostring(screen, 'RGB'))
+        frames.append(frame.convert('P', palette=Image.ADAPTIVE))
+    frames[0].save(gif_path, save_all=True, append_images=frames[1:], duration=200, loop=0)
+    return time.perf_counter() - start
+
+
+def main(count=32):
+    pygame.init()
+    tours = make_tours(count)
+    cpus = os.cpu_count()
+
+    print("=" * 60)
+    print(f"Headless rendering benchmark ({count} tours, 8x8)")
+    print("=" * 60)
+
+    runs = [('PNG', {})]
+    if Image is not None:
+        runs.append(('PNG + GIF', {'gif': True}))
+    else:
+        print("Pillow not installed: skipping GIFs")
+
+    with tempfile.TemporaryDirectory() as directory:
+        for label, options in runs:
+            for workers in sorted({1, cpus}):
+                out_dir = os.path.join(directory, f"{len(options)}_{workers}")
+                summary = render_tours(tours, out_dir, workers, **options)
+                print(f"{label:>9}, {workers:2d} workers: {summary['seconds']:7.2f} s "
+                      f"({summary['tours_per_second']:7.1f} tours/s)")
+
+        if Image is not None:
+            print("=" * 60)
+            naive = naive_gif(tours[0], os.path.join(directory, 'naive.gif'))
+            start = time.perf_counter()
+            render_tour(tours[0], os.path.join(directory, 'tour.png'),
+                        gif_path=os.path.join(directory, 'tour.gif'))
+            shared = time.perf_counter() - start
+            print(f"One GIF ({len(tours[0]['path'])} frames): {naive:5.2f} s per-frame palettes "
+                  f"+ Pillow optimize, {shared:5.2f} s render_tour ({naive / shared:.1f}x)")
+            print(f"  sizes: {os.path.getsize(os.path.join(directory, 'naive.gif')) // 1024} KB"
+                  f" vs {os.path.getsize(os.path.join(directory, 'tour.gif')) // 1024} KB")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Compare the bitboard repair engine against the original list-scan walk
+
+Run from the repository root:
+    python -m benchmarks.repair
+"""
+import random
+import time
+from src.chromosome import Chromosome
+from src.knight import Knight
+
+
+def legacy_check_moves(knight):
+    """
+    Original Knight.check_moves: validity checked by scanning the path list
+    """
+    knight.position = (0, 0)
+    knight.path = [(0, 0)]
+
+    for i in range(63):
+        current_move = knight.chromosome.genes[i]
+        new_pos = knight.move_forward(current_move)
+
+        if knight.is_valid_position(new_pos):
+            knight.position = new_pos
+            knight.path.append(new_pos)
+            continue
+
+        cycle_forward = random.choice([True, False])
+        found_valid = False
+
+        for attempt in range(8):
+            if cycle_forward:
+                test_move = (current_move % 8) + 1
+            else:
+                test_move = ((current_move - 2) % 8) + 1
+
+            current_move = test_move
+            new_pos = knight.move_forward(test_move)
+
+            if knight.is_valid_position(new_pos):
+                knight.position = new_pos
+                knight.path.append(new_pos)
+                knight.chromosome.genes[i] = test_move
+                found_valid = True
+                break
+
+        if not found_valid:
+            break
+
+
+def time_walk(walk, chromosomes, seed):
+    """
+    Walk fresh copies of the chromosomes with a fixed RNG state
+
+    Returns:
+        Tuple (seconds, list of (genes, path) results)
+    """
+    knights = [Knight(Chromosome(c.genes)) for c in chromosomes]
+    random.seed(seed)
+
+    start = time.perf_counter()
+    for knight in knights:
+        walk(knight)
+    elapsed = time.perf_counter() - start
+
+    return elapsed, [(knight.chromosome.genes, knight.path) for knight in knights]
+
+
+def main(count=5000, seed=42):
+    random.seed(seed)
+    chromosomes = [Chromosome() for _ in range(count)]
+
+    legacy_time, legacy_results = time_walk(legacy_check_moves, chromosomes, seed)
+    bitboard_time, bitboard_results = time_walk(Knight.check_moves, chromosomes, seed)
+
+    # Same RNG state must give the same repaired genes and the same path
+    if legacy_results != bitboard_results:
+        raise AssertionError("Bitboard repair differs from the legacy walk")
+
+    legacy_us = legacy_time / count * 1e6
+    bitboard_us = bitboard_time / count * 1e6
+
+    print("=" * 60)
+    print(f"Repair benchmark ({count} random chromosomes, seed {seed})")
+    print("=" * 60)
+    print(f"Legacy list scan: {legacy_us:8.2f} us/chromosome")
+    print(f"Bitboard:         {bitboard_us:8.2f} us/chromosome")
+    print(f"Speedup:          {legacy_time / bitboard_time:8.2f}x")
+    print("Results identical: yes")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
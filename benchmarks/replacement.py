@@ -0,0 +1,79 @@
+"""
+Compare replacement modes on evaluations to a full tour
+
+Fitness evaluations (knight walks) are the real cost of a run, so every
+configuration gets the same evaluation budget: generational replacement,
+elitism (the best k survive) and steady state (only the worst k are
+replaced per step).
+
+Run from the repository root:
+    python -m benchmarks.replacement
+"""
+import random
+import statistics
+import time
+from src.population import Population
+
+CONFIGS = [
+    ('generational', {}),
+    ('elitism 1', {'elitism': 1}),
+    ('elitism 2', {'elitism': 2}),
+    ('elitism 5', {'elitism': 5}),
+    ('steady state 2', {'steady_state': 2}),
+    ('steady state 10', {'steady_state': 10}),
+    ('steady state 25', {'steady_state': 25}),
+]
+
+
+def evaluations_to_tour(options, seed, population_size, budget):
+    """
+    Returns:
+        Tuple (solved, evaluations, steps, seconds)
+    """
+    random.seed(seed)
+    start = time.perf_counter()
+    population = Population(population_size, prefix_cache=True, **options)
+
+    while True:
+        population.check_population()
+        best, _ = population.evaluate()
+        if best == population.board.size or population.evaluations >= budget:
+            break
+        population.create_new_generation()
+
+    return (best == population.board.size, population.evaluations,
+            population.generation, time.perf_counter() - start)
+
+
+def main(seeds=10, population_size=50, budget=50000):
+    print("=" * 78)
+    print(f"Replacement mode benchmark ({seeds} seeds, {population_size} knights, "
+          f"budget {budget} evaluations)")
+    print("=" * 78)
+    print(f"{'mode':>16} | {'solved':>7} | {'median evals':>12} | {'mean evals':>10} | "
+          f"{'mean steps':>10} | {'mean s':>7}")
+
+    for name, options in CONFIGS:
+        runs = [evaluations_to_tour(options, seed, population_size, budget)
+                for seed in range(seeds)]
+        solved = [run for run in runs if run[0]]
+
+        if solved:
+            evaluations = [run[1] for run in solved]
+            median = f"{statistics.median(evaluations):12.0f}"
+            mean = f"{statistics.mean(evaluations):10.0f}"
+            steps = f"{statistics.mean(run[2] for run in solved):10.1f}"
+            seconds = f"{statistics.mean(run[3] for run in solved):7.2f}"
+        else:
+            median, mean, steps, seconds = (f"{'-':>12}", f"{'-':>10}",
+                                            f"{'-':>10}", f"{'-':>7}")
+
+        print(f"{name:>16} | {len(solved):3d}/{seeds:<3d} | {median} | {mean} | "
+              f"{steps} | {seconds}")
+
+    print("Evaluations, steps and times are over solved runs only")
+    print("=" * 78)
+
+
+if __name__ == "__main__":
+    main()
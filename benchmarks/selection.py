@@ -0,0 +1,68 @@
+"""
+Per-pair tournament selection vs vectorized selection strategies
+
+Times the parent selection for one whole generation (population_size / 2
+pairs) on random fitness values.
+
+Run from the repository root:
+    python -m benchmarks.selection
+"""
+import random
+import time
+from types import SimpleNamespace
+import numpy as np
+from src.selection import SELECTION_STRATEGIES
+
+SIZES = (1000, 10000, 100000)
+
+
+def per_pair_tournament(knights, pairs, size=3):
+    """
+    The Population.tournament_selection loop: one sample and sort per pair
+    """
+    for _ in range(pairs):
+        sample = random.sample(knights, size)
+        sample.sort(key=lambda k: k.fitness, reverse=True)
+
+
+def best_time(operation, repeat=5):
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        operation()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(seed=42):
+    random.seed(seed)
+    rng = np.random.default_rng(seed)
+
+    print("=" * 70)
+    print("Selection benchmark (one generation of parent pairs, best of 5)")
+    print("=" * 70)
+    print(f"{'knights':>8} | {'per-pair ms':>11} | " +
+          " | ".join(f"{name + ' ms':>13}" for name in SELECTION_STRATEGIES) +
+          f" | {'speedup':>7}")
+
+    for size in SIZES:
+        fitness = rng.integers(1, 65, size=size).astype(np.int32)
+        knights = [SimpleNamespace(fitness=value) for value in fitness.tolist()]
+        pairs = size // 2
+
+        legacy = best_time(lambda: per_pair_tournament(knights, pairs))
+        vectorized = {
+            name: best_time(lambda select=select: select(fitness, pairs, rng))
+            for name, select in SELECTION_STRATEGIES.items()
+        }
+
+        print(f"{size:8d} | {legacy * 1e3:11.2f} | " +
+              " | ".join(f"{seconds * 1e3:13.2f}" for seconds in vectorized.values()) +
+              f" | {legacy / vectorized['tournament']:6.1f}x")
+
+    print("Speedup: per-pair tournament vs vectorized tournament")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Solve service vs one `python main.py` process per tour
+
+Solves the same seeded jobs (small boards, so start-up cost shows) by
+launching main.py once per job and by sending them to a warm
+SolveService over a Unix socket.
+
+Run from the repository root:
+    python -m benchmarks.service
+"""
+import asyncio
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from src.service import SolveService, request_tours
+
+JOBS = [{'rows': 6, 'cols': 6, 'start': [0, 0]},
+        {'rows': 5, 'cols': 5, 'start': [2, 2]},
+        {'rows': 8, 'cols': 8, 'start': [0, 0]}]
+
+
+def per_process(jobs, workers):
+    """
+    Returns:
+        Seconds to solve all jobs with `workers` concurrent main.py processes
+    """
+    commands = [[sys.executable, 'main.py', '--format', 'json', '--seed', str(job['seed']),
+                 '--board', f"{job['rows']}x{job['cols']}",
+                 '--start', f"{job['start'][0]},{job['start'][1]}", '-g', '5000']
+                for job in jobs]
+
+    start = time.perf_counter()
+    running = []
+    for command in commands:
+        if len(running) >= workers:
+            running.pop(0).wait()
+        running.append(subprocess.Popen(command, stdout=subprocess.DEVNULL))
+    for process in running:
+        process.wait()
+    return time.perf_counter() - start
+
+
+async def through_service(service, jobs, address):
+    """
+    Returns:
+        Tuple (seconds to solve all jobs, number solved)
+    """
+    server = await asyncio.start_unix_server(service.handle_connection, address)
+    async with server:
+        requests = [dict(job, op='solve', id=index, max_generations=5000)
+                    for index, job in enumerate(jobs)]
+        start = time.perf_counter()
+        results = await request_tours(address, requests)
+        elapsed = time.perf_counter() - start
+        await asyncio.sleep(0.1)  # let the server see the client hang up
+    solved = sum(result['status'] == 'solved' for result in results.values())
+    return elapsed, solved
+
+
+def main(count=24, workers=None):
+    workers = workers or min(4, os.cpu_count())
+    jobs = [dict(JOBS[index % len(JOBS)], seed=index) for index in range(count)]
+
+    start = time.perf_counter()
+    service = SolveService(workers)
+    warmup = time.perf_counter() - start
+
+    with tempfile.TemporaryDirectory() as directory:
+        served, solved = asyncio.run(
+            through_service(service, jobs, os.path.join(directory, 'service.sock'))
+        )
+    service.close()
+    launched = per_process(jobs, workers)
+
+    print("=" * 60)
+    print(f"Solve service benchmark ({count} jobs, {workers} workers)")
+    print("=" * 60)
+    print(f"One process per job: {launched:7.2f} s  ({count / launched:6.1f} tours/s)")
+    print(f"Warm service:        {served:7.2f} s  ({count / served:6.1f} tours/s), "
+          f"{solved}/{count} solved")
+    print(f"Service start-up (paid once): {warmup:5.2f} s")
+    print(f"Speedup: {launched / served:5.2f}x")
+    print("=" * 60)
+
+
+if __name__ == "__main__":
+    main()
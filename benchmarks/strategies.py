@@ -0,0 +1,73 @@
+"""
+Compare repair strategies and Warnsdorff seeding on time to a full tour
+
+Run from the repository root:
+    python -m benchmarks.strategies
+"""
+import random
+import statistics
+import time
+from src.board import Board
+from src.population import Population
+
+CONFIGS = [
+    ('cycle', 0.0),
+    ('cycle', 0.1),
+    ('warnsdorff', 0.0),
+    ('warnsdorff', 0.1),
+]
+
+
+def time_to_tour(board, repair, warnsdorff_seed, seed, population_size, max_generations):
+    """
+    Returns:
+        Tuple (solved, generations, seconds)
+    """
+    random.seed(seed)
+    start = time.perf_counter()
+    population = Population(population_size, board=board, repair=repair,
+                            warnsdorff_seed=warnsdorff_seed, prefix_cache=True)
+
+    while True:
+        population.check_population()
+        best, _ = population.evaluate()
+        if best == board.size or population.generation >= max_generations:
+            break
+        population.create_new_generation()
+
+    return best == board.size, population.generation, time.perf_counter() - start
+
+
+def main(boards=((8, 8), (16, 16)), seeds=20, population_size=50, max_generations=500):
+    print("=" * 76)
+    print(f"Repair strategy benchmark ({seeds} seeds, {population_size} knights, "
+          f"max {max_generations} generations)")
+    print("=" * 76)
+    print(f"{'board':>7} | {'repair':>10} | {'seeded':>6} | {'solved':>7} | "
+          f"{'median s':>9} | {'mean s':>8} | {'mean gens':>9}")
+
+    for rows, cols in boards:
+        board = Board(rows, cols)
+        for repair, warnsdorff_seed in CONFIGS:
+            runs = [time_to_tour(board, repair, warnsdorff_seed, seed,
+                                 population_size, max_generations)
+                    for seed in range(seeds)]
+            solved = [run for run in runs if run[0]]
+
+            if solved:
+                times = [run[2] for run in solved]
+                median = f"{statistics.median(times):9.3f}"
+                mean = f"{statistics.mean(times):8.3f}"
+                generations = f"{statistics.mean(run[1] for run in solved):9.1f}"
+            else:
+                median, mean, generations = f"{'-':>9}", f"{'-':>8}", f"{'-':>9}"
+
+            print(f"{rows:>3}x{cols:<3} | {repair:>10} | {warnsdorff_seed:6.0%} | "
+                  f"{len(solved):3d}/{seeds:<3d} | {median} | {mean} | {generations}")
+
+    print("Times are wall-clock to the first full tour, over solved runs only")
+    print("=" * 76)
+
+
+if __name__ == "__main__":
+    main()
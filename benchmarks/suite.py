@@ -0,0 +1,237 @@
+"""
+Reproducible benchmark suite for the GA core
+
+Times the hot operations with fixed seeds and writes the numbers to
+JSON; `compare` flags regressions between two result files.
+
+Run from the repository root:
+    python -m benchmarks.suite run -o results.json
+    python -m benchmarks.suite compare baseline.json results.json
+"""
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from src.chromosome import Chromosome
+from src.knight import Knight
+from src.population import Population
+
+SIZES = (50, 200, 1000)
+
+# Metrics where a higher value is better (everything else: lower is better)
+HIGHER_IS_BETTER = {'ops_per_sec'}
+
+# Metrics checked for regressions (tail latencies are reported, not flagged)
+CHECKED = {'ops_per_sec', 'p50_ms', 'p90_ms', 'peak_kb'}
+
+
+def ops_per_sec(operation, min_time=0.1, repeat=3):
+    """
+    Call operation() repeatedly for at least min_time seconds
+
+    Returns:
+        Best calls per second over `repeat` rounds (least disturbed by noise)
+    """
+    best = 0.0
+    for _ in range(repeat):
+        calls = 0
+        start = time.perf_counter()
+        elapsed = 0.0
+        while elapsed < min_time:
+            for _ in range(100):
+                operation()
+            calls += 100
+            elapsed = time.perf_counter() - start
+        best = max(best, calls / elapsed)
+    return best
+
+
+def percentiles(samples):
+    """
+    Latency summary of a list of durations in seconds (reported in ms)
+    """
+    ordered = sorted(samples)
+
+    def pick(fraction):
+        return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))] * 1e3
+
+    return {
+        'p50_ms': pick(0.50),
+        'p90_ms': pick(0.90),
+        'p99_ms': pick(0.99),
+        'max_ms': ordered[-1] * 1e3,
+    }
+
+
+def bench_chromosome(seed):
+    random.seed(seed)
+    parent1, parent2 = Chromosome(), Chromosome()
+    child1, child2 = Chromosome(), Chromosome()
+
+    return {
+        'chromosome.crossover': {
+            'ops_per_sec': ops_per_sec(lambda: parent1.crossover(parent2, child1, child2)),
+        },
+        'chromosome.mutation': {
+            'ops_per_sec': ops_per_sec(child1.mutation),
+        },
+    }
+
+
+def bench_check_moves(seed, count=2000):
+    """
+    Walk fresh random chromosomes (genes are restored before every pass)
+    """
+    random.seed(seed)
+    templates = [bytes(Chromosome().genes) for _ in range(count)]
+    knights = [Knight(Chromosome(genes)) for genes in templates]
+
+    passes = 0
+    walking = 0.0
+    while walking < 0.5:
+        for knight, genes in zip(knights, templates):
+            knight.chromosome.genes[:] = genes
+        start = time.perf_counter()
+        for knight in knights:
+            knight.check_moves()
+        walking += time.perf_counter() - start
+        passes += 1
+
+    return {'knight.check_moves': {'ops_per_sec': passes * count / walking}}
+
+
+def bench_population(size, seed, generations=30):
+    """
+    Time every phase of a generation and whole generations
+    """
+    random.seed(seed)
+    population = Population(size)
+    phases = {'check_population': [], 'evaluate': [],
+              'create_new_generation': [], 'generation': []}
+
+    for _ in range(generations):
+        start = time.perf_counter()
+        population.check_population()
+        checked = time.perf_counter()
+        population.evaluate()
+        evaluated = time.perf_counter()
+        population.create_new_generation()
+        created = time.perf_counter()
+
+        phases['check_population'].append(checked - start)
+        phases['evaluate'].append(evaluated - checked)
+        phases['create_new_generation'].append(created - evaluated)
+        phases['generation'].append(created - start)
+
+    results = {}
+    for phase, samples in phases.items():
+        summary = percentiles(samples)
+        summary['ops_per_sec'] = len(samples) / sum(samples)
+        results[f"population.{phase}/{size}"] = summary
+
+    # Cheap operations: throughput over many calls on an evaluated population
+    population.check_population()
+    population.evaluate()
+    results[f"population.evaluate/{size}"]['ops_per_sec'] = ops_per_sec(population.evaluate)
+    results[f"population.tournament_selection/{size}"] = {
+        'ops_per_sec': ops_per_sec(population.tournament_selection),
+    }
+
+    # Peak memory of one full generation, measured separately (tracemalloc
+    # slows everything down)
+    tracemalloc.start()
+    population.check_population()
+    population.evaluate()
+    population.create_new_generation()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    results[f"population.generation/{size}"]['peak_kb'] = peak / 1024
+
+    return results
+
+
+def run(args):
+    results = {}
+    results.update(bench_chromosome(args.seed))
+    results.update(bench_check_moves(args.seed))
+    for size in args.sizes:
+        results.update(bench_population(size, args.seed))
+
+    report = {
+        'meta': {
+            'timestamp': datetime.now(timezone.utc).isoformat(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': args.seed,
+            'sizes': list(args.sizes),
+        },
+        'results': results,
+    }
+
+    for name, metrics in results.items():
+        values = ", ".join(f"{key}={value:.4g}" for key, value in metrics.items())
+        print(f"{name:42s} {values}")
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+def compare(args):
+    with open(args.baseline) as f:
+        baseline = json.load(f)['results']
+    with open(args.current) as f:
+        current = json.load(f)['results']
+
+    regressions = 0
+    for name in sorted(set(baseline) & set(current)):
+        for metric, old in baseline[name].items():
+            new = current[name].get(metric)
+            if new is None or not old:
+                continue
+
+            change = (new - old) / old
+            worse = -change if metric in HIGHER_IS_BETTER else change
+            flag = "REGRESSION" if metric in CHECKED and worse > args.threshold else ""
+            regressions += bool(flag)
+            print(f"{name:42s} {metric:12s} {old:12.4g} -> {new:12.4g} "
+                  f"({change:+7.1%}) {flag}")
+
+    missing = set(baseline) ^ set(current)
+    if missing:
+        print(f"\nOnly in one file: {', '.join(sorted(missing))}")
+
+    print(f"\n{regressions} regression(s) beyond {args.threshold:.0%}")
+    return 1 if regressions else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GA core benchmark suite")
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run_parser = commands.add_parser('run', help="run the benchmarks")
+    run_parser.add_argument('-o', '--output', help="write results to this JSON file")
+    run_parser.add_argument('--seed', type=int, default=42)
+    run_parser.add_argument('--sizes', type=int, nargs='+', default=SIZES,
+                            help="population sizes to benchmark")
+
+    compare_parser = commands.add_parser('compare', help="compare two result files")
+    compare_parser.add_argument('baseline')
+    compare_parser.add_argument('current')
+    compare_parser.add_argument('--threshold', type=float, default=0.10,
+                                help="relative change counted as a regression")
+
+    args = parser.parse_args()
+    if args.command == 'run':
+        run(args)
+    else:
+        sys.exit(compare(args))
+
+
+if __name__ == "__main__":
+    main()
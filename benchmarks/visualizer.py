@@ -0,0 +1,119 @@
+"""
+Full per-frame redraw vs cached layers in the visualizer
+
+Times one frame of KnightTourVisualizer halfway through a (Warnsdorff)
+tour on several board sizes, offscreen (SDL dummy video driver):
+redrawing the title bar, board and info panel every frame (the old run
+loop) vs draw_frame, which blits the cached layers and draws only the
+knight. Also times a step change, rebuilding the whole step layer
+(visited squares with their move numbers) vs the incremental update
+after one step, and a frame under the completion banner (reused
+fonts, overlay and glow surfaces), and measures the CPU use of an idle
+window for the 60 FPS loop and the event-driven loop.
+
+Run from the repository root:
+    python -m benchmarks.visualizer
+"""
+import os
+import random
+import time
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+import pygame
+from src.board import Board
+from src.chromosome import Chromosome
+from src.knight import Knight
+from src.repair import warnsdorff_genes
+from src.visualizer import KnightTourVisualizer
+
+BOARDS = ((8, 8), (16, 16), (32, 32), (64, 64))
+
+
+def full_redraw(visualizer):
+    """The old run loop's drawing: everything, every frame"""
+    visualizer.screen.fill(visualizer.BACKGROUND)
+    visualizer.draw_title_bar()
+    visualizer.draw_board()
+    visualizer.draw_knight()
+    visualizer.draw_info_panel()
+
+
+def one_step(visualizer):
+    """Incremental step layer update after a single step forward"""
+    visualizer.step_layer_key = visualizer.current_step - 1
+    visualizer.update_step_layer()
+
+
+def ms_per_frame(draw, visualizer, frames=200):
+    start = time.perf_counter()
+    for _ in range(frames):
+        draw(visualizer)
+    return (time.perf_counter() - start) / frames * 1e3
+
+
+def idle_cpu(knight, seconds=3, **options):
+    """
+    Returns:
+        CPU use (% of one core) of a visualizer window left alone
+    """
+    visualizer = KnightTourVisualizer(knight)
+    pygame.time.set_timer(pygame.QUIT, int(seconds * 1000), 1)
+    cpu, wall = time.process_time(), time.perf_counter()
+    visualizer.run(**options)
+    return 100 * (time.process_time() - cpu) / (time.perf_counter() - wall)
+
+
+def main(seed=42):
+    random.seed(seed)
+
+    print("=" * 70)
+    print("Visualizer benchmark (ms per frame, halfway through the tour)")
+    print("=" * 70)
+    print(f"{'board':>7} | {'path':>5} | {'full redraw':>11} | {'layered':>8} | "
+          f"{'speedup':>7} | {'rebuild':>7} | {'one step':>8}")
+
+    for rows, cols in BOARDS:
+        board = Board(rows, cols)
+        genes = warnsdorff_genes(board.neighbours, board.start_square, board.gene_length)
+        knight = Knight(Chromosome(genes), board)
+        knight.check_moves()
+        visualizer = KnightTourVisualizer(knight)
+        for _ in range(len(knight.path) // 2):
+            visualizer.next_step()
+
+        full = ms_per_frame(full_redraw, visualizer)
+        layered = ms_per_frame(KnightTourVisualizer.draw_frame, visualizer)
+        rebuild = ms_per_frame(KnightTourVisualizer.build_step_layer, visualizer)
+        step = ms_per_frame(one_step, visualizer)
+        print(f"{rows:>3}x{cols:<3} | {len(knight.path):5d} | {full:11.3f} | "
+              f"{layered:8.3f} | {full / layered:6.1f}x | {rebuild:7.3f} | {step:8.3f}")
+
+    print("=" * 70)
+
+    knight = Knight(board=Board(8, 8))
+    knight.check_moves()
+
+    # Last step: the completion banner is drawn over every frame
+    visualizer = KnightTourVisualizer(knight)
+    for _ in range(len(knight.path) - 1):
+        visualizer.next_step()
+    banner = ms_per_frame(KnightTourVisualizer.draw_frame, visualizer)
+    visualizer.has_knight_image = False
+    glyph = ms_per_frame(KnightTourVisualizer.draw_frame, visualizer)
+    stats = visualizer.assets.stats()
+    print(f"Completion banner frame (8x8): {banner:.3f} ms, "
+          f"{glyph:.3f} ms with the fallback knight glyph")
+    print(f"Assets: {stats['entries']} cached, {stats['hits']} hits, "
+          f"{stats['misses']} misses ({stats['hit_rate']:.1%} hit rate)")
+    print("=" * 70)
+
+    print("Idle window CPU (8x8, % of one core)")
+    print(f"  60 FPS loop:                   {idle_cpu(knight, event_driven=False):5.1f}%")
+    print(f"  event-driven, effects 30 FPS:  {idle_cpu(knight, effects_fps=30):5.1f}%")
+    print(f"  event-driven, still knight:    {idle_cpu(knight, effects_fps=0):5.1f}%")
+    print("=" * 70)
+
+
+if __name__ == "__main__":
+    main()
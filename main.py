@@ -1,87 +1,241 @@
-import random
+import argparse
+import contextlib
+import io
+import json
+import os
+import time
+from src.board import Board
+from src.checkpoint import load_checkpoint, save_checkpoint
+from src.console import print_board
 from src.population import Population
-from src.visualizer import visualize_solution, print_board
 
-def main():
+def parse_board(text):
+    """
+    Parse a board size given as ROWSxCOLS (e.g. 8x8) or a single number
+    """
+    rows, _, cols = text.lower().partition('x')
+    try:
+        return int(rows), int(cols or rows)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid board size: {text!r} (use ROWSxCOLS)")
+
+def parse_square(text):
+    """
+    Parse a square given as ROW,COL (e.g. 0,0)
+    """
+    try:
+        row, col = (int(value) for value in text.split(','))
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid square: {text!r} (use ROW,COL)")
+    return row, col
+
+def parse_args(argv=None):
+    """
+    Command line options
+    """
+    parser = argparse.ArgumentParser(description="Knight's Tour - Genetic Algorithm")
+    parser.add_argument('-p', '--population-size', type=int,
+                        help="number of knights per generation (default 50)")
+    parser.add_argument('-g', '--generations', '--max-generations', type=int, default=1000,
+                        dest='generations', help="safety limit on the number of generations")
+    parser.add_argument('--seed', type=int, help="random seed for a reproducible run")
+    parser.add_argument('--board', type=parse_board,
+                        help="board size as ROWSxCOLS (default 8x8)")
+    parser.add_argument('--start', type=parse_square,
+                        help="starting square as ROW,COL (default 0,0)")
+    parser.add_argument('--mutation-rate', type=float,
+                        help="per-gene mutation probability (default 0.01)")
+    parser.add_argument('--format', choices=('text', 'summary', 'json'), default='text',
+                        help="text: header and one line per generation; summary: "
+                             "final result only; json: final result as one JSON object")
+    parser.add_argument('--print-every', type=int, default=1,
+                        help="with --format text, print every N-th generation")
+    parser.add_argument('--visualize', action='store_true',
+                        help="open the pygame window with the result at the end")
+    parser.add_argument('--checkpoint', help="periodically save the run to this file")
+    parser.add_argument('--checkpoint-every', type=int, default=50,
+                        help="generations between checkpoints")
+    parser.add_argument('--resume', action='store_true',
+                        help="continue the run saved in --checkpoint")
+    parser.add_argument('--stats', help="stream per-generation statistics to this JSONL file")
+    parser.add_argument('--stats-every', type=int, default=1,
+                        help="record every N-th generation in --stats")
+    args = parser.parse_args(argv)
+    
+    if args.resume and not (args.checkpoint and os.path.exists(args.checkpoint)):
+        parser.error("--resume needs an existing --checkpoint file")
+    
+    # A resumed run is the checkpoint's population: these can't change it
+    run_options = {'population_size': ('-p/--population-size', 50),
+                   'board': ('--board', (8, 8)),
+                   'start': ('--start', (0, 0)),
+                   'seed': ('--seed', None),
+                   'mutation_rate': ('--mutation-rate', 0.01)}
+    if args.resume:
+        given = [flag for name, (flag, _) in run_options.items()
+                 if getattr(args, name) is not None]
+        if given:
+            parser.error(f"{', '.join(given)} can't be combined with --resume "
+                         f"(the checkpoint's settings are used)")
+    for name, (_, default) in run_options.items():
+        if getattr(args, name) is None:
+            setattr(args, name, default)
+    
+    # Numbers the run would only trip over later, with a traceback
+    if args.population_size < 3:
+        parser.error("--population-size must be at least 3 (the tournament size)")
+    if args.generations < 0:
+        parser.error("--generations can't be negative")
+    if not 0 <= args.mutation_rate <= 1:
+        parser.error("--mutation-rate must be between 0 and 1")
+    for flag in ('print_every', 'checkpoint_every', 'stats_every'):
+        if getattr(args, flag) < 1:
+            parser.error(f"--{flag.replace('_', '-')} must be at least 1")
+    
+    rows, cols = args.board
+    if rows < 1 or cols < 1 or rows * cols < 3:
+        parser.error(f"--board {rows}x{cols} is too small (at least 3 squares are needed)")
+    if not (0 <= args.start[0] < rows and 0 <= args.start[1] < cols):
+        parser.error(f"--start {args.start} is outside the {rows}x{cols} board")
+    return args
+
+def main(argv=None):
     """
     Main function to run the genetic algorithm
     """
-    # Set random seed for reproducibility (optional, remove for true randomness)
-    # random.seed(42)
+    args = parse_args(argv)
+    text = args.format == 'text'
+    log = print if text else (lambda *_, **__: None)
+    
+    # Only the final result in summary format (a single JSON document in
+    # json format)
+    quiet = contextlib.redirect_stdout(io.StringIO()) if not text else contextlib.nullcontext()
     
     # Parameters
-    population_size = 50
-    max_generations = 1000  # Safety limit
-    
-    print("=" * 60)
-    print("Knight's Tour - Genetic Algorithm")
-    print("=" * 60)
-    print(f"Population size: {population_size}")
-    print(f"Target: Visit all 64 squares")
-    print("=" * 60)
-    print()
-    
-    # Create initial population
-    population = Population(population_size)
-    
-    # Main evolution loop
-    while True:
-        # Validate all knight moves
-        population.check_population()
-        
-        # Evaluate fitness of all knights
-        max_fitness, best_solution = population.evaluate()
-        
-        # Get statistics
-        stats = population.get_statistics()
-        
-        # Print progress
-        print(f"Generation {population.generation:4d} | "
-              f"Best: {max_fitness:2d}/64 | "
-              f"Avg: {stats['avg']:5.2f} | "
-              f"Min: {stats['min']:2d}")
-        
-        # Check if solution found
-        if max_fitness == 64:
-            print()
-            print("=" * 60)
-            print("🎉 SOLUTION FOUND! 🎉")
-            print("=" * 60)
-            print(f"Generation: {population.generation}")
-            print(f"Fitness: {max_fitness}/64")
-            print(f"Path length: {len(best_solution.path)}")
-            print()
-            print("First 10 moves:", best_solution.path[:10])
-            print("Last 10 moves:", best_solution.path[-10:])
-            print()
-            print("Chromosome (first 20 genes):", best_solution.chromosome.genes[:20])
-            print("=" * 60)
-            print()
-            
+    population_size = args.population_size
+    max_generations = args.generations  # Safety limit
+    board = Board(*args.board, start=args.start)
+    
+    # Best/avg/min fitness of every generation so far
+    history = []
+    
+    if args.resume:
+        with quiet:
+            population, history = load_checkpoint(args.checkpoint)
+        population_size = population.population_size
+        board = population.board
+    
+    goal = board.size  # A full tour visits every square
+    
+    log("=" * 60)
+    log("Knight's Tour - Genetic Algorithm")
+    log("=" * 60)
+    log(f"Population size: {population_size}")
+    log(f"Board: {board.rows}x{board.cols}, starting at {board.start}")
+    log(f"Target: Visit all {goal} squares")
+    log("=" * 60)
+    log()
+    
+    start_time = time.perf_counter()
+    
+    if args.resume:
+        log(f"Resumed from {args.checkpoint} at generation {population.generation}")
+    else:
+        # Create initial population
+        with quiet:
+            # Reproducible run: the population's own streams are seeded
+            population = Population(population_size, board=board,
+                                    mutation_rate=args.mutation_rate, seed=args.seed)
+    
+    # Streaming statistics (histogram, gene entropy, best path, timing)
+    sink = None
+    if args.stats:
+        from src.stats import StatsSink
+        sink = StatsSink(args.stats, every=args.stats_every)
+    
+    def checkpoint(population):
+        if args.checkpoint and population.generation % args.checkpoint_every == 0:
+            save_checkpoint(population, args.checkpoint, history)
+    
+    # Main evolution loop (the sink is closed, i.e. flushed, even if it fails)
+    with sink if sink is not None else contextlib.nullcontext():
+        sinks = [sink] if sink is not None else []
+        for max_fitness, best_solution in population.evolve(
+                max_generations, goal, sinks=sinks, on_new_generation=checkpoint):
+            stats = population.get_statistics()
+            history.append((max_fitness, stats['avg'], stats['min']))
             
-            # Show graphical board
-            print("Displaying visualization...")
-            visualize_solution(best_solution)
-            break
-        
-        # Safety check - stop if taking too long
-        if population.generation >= max_generations:
-            print()
-            print("=" * 60)
-            print(f"⚠️ Reached maximum generations ({max_generations})")
-            print(f"Best fitness achieved: {max_fitness}/64")
-            print("=" * 60)
-            print()
+            solved = max_fitness == goal
+            done = solved or population.generation >= max_generations
             
-            # Show best solution found so far
-            print("Best solution found:")
-            print_board(best_solution)
-            print()
-            visualize_solution(best_solution)
-            break
-        
-        # Create next generation
+            # Print progress
+            if text and (done or population.generation % args.print_every == 0):
+                print(f"Generation {population.generation:4d} | "
+                      f"Best: {max_fitness:2d}/{goal} | "
+                      f"Avg: {stats['avg']:5.2f} | "
+                      f"Min: {stats['min']:2d}")
+    
+    elapsed = time.perf_counter() - start_time
+    generation = population.generation
+    
+    # Save the next generation so a later --resume with a higher
+    # --generations carries on
+    if not solved and args.checkpoint:
         population.create_new_generation()
+        save_checkpoint(population, args.checkpoint, history)
+        log(f"Checkpoint saved to {args.checkpoint}")
+    
+    if args.format == 'json':
+        result = {
+            'solved': solved,
+            'generation': generation,
+            'best_fitness': max_fitness,
+            'goal': goal,
+            'board': [board.rows, board.cols],
+            'start': list(board.start),
+            'population_size': population_size,
+            'seed': args.seed,
+            'elapsed_s': elapsed,
+            'path': [list(square) for square in best_solution.path],
+            'genes': list(best_solution.chromosome.genes),
+        }
+        if args.resume:
+            del result['seed']  # the checkpoint keeps the stream, not the seed
+        print(json.dumps(result))
+    elif solved:
+        print()
+        print("=" * 60)
+        print("🎉 SOLUTION FOUND! 🎉")
+        print("=" * 60)
+        print(f"Generation: {generation}")
+        print(f"Fitness: {max_fitness}/{goal}")
+        print(f"Path length: {len(best_solution.path)}")
+        print()
+        print("First 10 moves:", best_solution.path[:10])
+        print("Last 10 moves:", best_solution.path[-10:])
+        print()
+        print("Chromosome (first 20 genes):", list(best_solution.chromosome.genes[:20]))
+        print("=" * 60)
+        print()
+    else:
+        print()
+        print("=" * 60)
+        print(f"⚠️ Reached maximum generations ({max_generations})")
+        print(f"Best fitness achieved: {max_fitness}/{goal}")
+        print("=" * 60)
+        print()
+        
+        # Show best solution found so far
+        print("Best solution found:")
+        print_board(best_solution)
+    
+    population.close()
+    
+    # The pygame window is only imported and opened when asked for
+    if args.visualize:
+        from src.visualizer import visualize_solution
+        log("Displaying visualization...")
+        visualize_solution(best_solution)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
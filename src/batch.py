@@ -0,0 +1,94 @@
+import numpy as np
+
+
+def random_genes(population_size, length=63, rng=None):
+    """
+    Generate a matrix of random genes
+
+    Args:
+        population_size: Number of rows (individuals)
+        length: Number of genes per individual
+        rng: numpy Generator (default: fresh unseeded one)
+
+    Returns:
+        (population_size, length) uint8 array of moves (1-8)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    return rng.integers(1, 9, size=(population_size, length), dtype=np.uint8)
+
+
+def repair_batch(genes, neighbours, start=0, rng=None, counts=None):
+    """
+    Walk and repair every row of a gene matrix in lockstep
+
+    Vectorized version of repair_moves: at each step all still-walking
+    rows take their gene at once. Rows whose move is invalid draw a
+    forward/backward cycle direction and take the first valid of the 8
+    cycled moves. Rows with no valid move stop walking.
+
+    Args:
+        genes: (N, L) uint8 array of moves (1-8), repaired in place
+        neighbours: Table from build_neighbour_table
+        start: Starting square index
+        rng: numpy Generator for the cycle directions
+        counts: Optional [repairs, fallbacks] list; adds the number of
+                invalid genes met and of alternative directions tried
+
+    Returns:
+        (N,) int32 fitness vector (number of squares visited)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    table = np.asarray(neighbours, dtype=np.int32)
+    count, length = genes.shape
+
+    position = np.full(count, start, dtype=np.int32)
+    squares = table.shape[0]
+    visited = np.zeros(count * squares, dtype=bool)  # flat (N, squares) mask
+    visited[np.arange(count) * squares + start] = True
+    alive = np.arange(count)
+    fitness = np.ones(count, dtype=np.int32)
+
+    # Attempt k of the fallback cycle moves k steps away from the gene
+    offsets = np.arange(1, 9, dtype=np.int32)
+
+    for i in range(length):
+        if alive.size == 0:
+            break
+
+        move = genes[alive, i].astype(np.int32)
+        target = table[position[alive], move]
+        valid = target >= 0
+        base = alive * squares
+        valid[valid] = ~visited[base[valid] + target[valid]]
+
+        invalid = np.flatnonzero(~valid)
+        if invalid.size:
+            rows = alive[invalid]
+
+            # Randomly choose cycle direction (forward or backward)
+            step = np.where(rng.random(invalid.size) < 0.5, 1, -1)
+            moves = (move[invalid, None] - 1 + step[:, None] * offsets) % 8 + 1
+            targets = table[position[rows, None], moves]
+
+            ok = targets >= 0
+            ok &= ~visited[base[invalid, None] + np.maximum(targets, 0)]
+            found = ok.any(axis=1)
+            first = ok.argmax(axis=1)
+            picked = np.arange(invalid.size)
+
+            genes[rows[found], i] = moves[picked, first][found]
+
+            if counts is not None:
+                counts[0] += int(invalid.size)
+                counts[1] += int(np.where(found, first + 1, 8).sum())
+            target[invalid] = targets[picked, first]
+            valid[invalid] = found
+
+        # Advance rows that moved, drop rows that hit a dead end
+        moved = alive[valid]
+        position[moved] = target[valid]
+        visited[base[valid] + target[valid]] = True
+        fitness[moved] += 1
+        alive = moved
+
+    return fitness
@@ -0,0 +1,79 @@
+from functools import lru_cache
+from .repair import build_neighbour_table
+
+# The 8 possible L-shaped knight moves
+# Direction: (row_change, col_change)
+MOVES = {
+    1: (1, -2),   # up-right
+    2: (2, -1),   # right-up
+    3: (2, 1),    # right-down
+    4: (1, 2),    # down-right
+    5: (-1, 2),   # down-left
+    6: (-2, 1),   # left-down
+    7: (-2, -1),  # left-up
+    8: (-1, -2)   # up-left
+}
+
+
+@lru_cache(maxsize=None)
+def move_tables(rows, cols):
+    """
+    Precomputed tables for one board size (built once per size)
+
+    Returns:
+        Tuple (neighbours, squares): the flat neighbour table from
+        build_neighbour_table and the (row, col) of every square index
+    """
+    neighbours = build_neighbour_table(MOVES, rows, cols)
+    squares = [(row, col) for row in range(rows) for col in range(cols)]
+    return neighbours, squares
+
+
+class Board:
+    """
+    Board dimensions and starting square of a tour
+
+    Squares are numbered row * cols + col. A full tour visits all
+    rows * cols squares, so a chromosome needs rows * cols - 1 genes.
+    """
+
+    def __init__(self, rows=8, cols=8, start=(0, 0)):
+        """
+        Args:
+            rows: Number of rows
+            cols: Number of columns
+            start: Starting (row, col) of the knight
+        """
+        if rows < 1 or cols < 1:
+            raise ValueError(f"Invalid board size: {rows}x{cols}")
+        if not (0 <= start[0] < rows and 0 <= start[1] < cols):
+            raise ValueError(f"Start square {start} is outside the board")
+
+        self.rows = rows
+        self.cols = cols
+        self.start = tuple(start)
+        self.size = rows * cols
+        self.gene_length = self.size - 1
+        self.start_square = start[0] * cols + start[1]
+        self.neighbours, self.squares = move_tables(rows, cols)
+
+    def __reduce__(self):
+        # Pickle only the dimensions; tables are rebuilt (and cached) on load
+        return (Board, (self.rows, self.cols, self.start))
+
+    def __eq__(self, other):
+        return (isinstance(other, Board) and
+                (self.rows, self.cols, self.start) == (other.rows, other.cols, other.start))
+
+    def __hash__(self):
+        return hash((self.rows, self.cols, self.start))
+
+    def __str__(self):
+        return f"Board({self.rows}x{self.cols}, start={self.start})"
+
+    def __repr__(self):
+        return self.__str__()
+
+
+# Standard 8x8 chessboard starting in the top-left corner
+DEFAULT_BOARD = Board()
@@ -0,0 +1,94 @@
+import sys
+from collections import OrderedDict
+
+
+class FitnessCache:
+    """
+    Bounded LRU cache of walk outcomes, keyed by packed gene bytes
+
+    Values are (repaired genes, visited squares) tuples; the fitness is
+    the number of squares. Both are flat buffers (bytes and array('H')),
+    which keeps the cache invisible to the cyclic garbage collector.
+    The cache is capped by an estimate of the bytes its keys and values
+    occupy; least recently used entries are evicted first.
+    """
+
+    def __init__(self, max_bytes=16 * 1024 * 1024):
+        """
+        Args:
+            max_bytes: Size cap for keys and values (estimated with
+                       sys.getsizeof)
+        """
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        """
+        Look up a walk outcome (marks it as recently used)
+
+        Returns:
+            (repaired genes, squares) tuple, or None on a miss
+        """
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self.entries.move_to_end(key)
+        return entry[0]
+
+    def put(self, key, repaired, squares):
+        """
+        Store a walk outcome, evicting old entries beyond the size cap
+
+        Args:
+            key: Packed genes (bytes) the outcome belongs to
+            repaired: Packed repaired genes (bytes)
+            squares: array('H') of visited square indices
+        """
+        if key in self.entries:
+            self.entries.move_to_end(key)
+            return
+
+        size = sys.getsizeof(key) + sys.getsizeof(squares)
+        if repaired is not key:
+            size += sys.getsizeof(repaired)
+        if size > self.max_bytes:
+            return
+
+        self.entries[key] = ((repaired, squares), size)
+        self.bytes += size
+
+        while self.bytes > self.max_bytes:
+            _, (_, evicted) = self.entries.popitem(last=False)
+            self.bytes -= evicted
+            self.evictions += 1
+
+    def clear(self):
+        """Drop all entries (counters are kept)"""
+        self.entries.clear()
+        self.bytes = 0
+
+    def stats(self):
+        """
+        Returns:
+            Dictionary with hits, misses, evictions, hit_rate, entries
+            and bytes
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.entries),
+            'bytes': self.bytes,
+        }
+
+    def __len__(self):
+        return len(self.entries)
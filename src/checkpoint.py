@@ -0,0 +1,211 @@
+"""
+Binary checkpoints of a Population
+
+A checkpoint is taken between generations (after create_new_generation,
+before the next check_population). It holds everything the following
+generations depend on: the packed genes, the generation counter, the
+population's random state (and its NumPy generator's, if any), which
+knights survive already evaluated (elitism / steady state) and the stats
+history of the run. Loading it and carrying on reproduces the
+uninterrupted run exactly.
+
+Layout (little endian):
+    header      struct HEADER (see below)
+    repair      repair strategy name, ASCII
+    selection   vectorized selection strategy name, ASCII (empty = per-pair
+                tournament)
+    crossover   vectorized crossover method name, ASCII (empty = per-pair
+                Chromosome operators)
+    genes       population_size * gene_length bytes
+    evaluated   population_size bytes, 1 for knights that are not walked
+                again (survivors)
+    rng         625 x uint32 Mersenne Twister state, uint8 has_gauss,
+                float64 gauss_next
+    history     history_length x 3 float64 (best, avg, min)
+    np_state    JSON of the NumPy bit generator state (batch mode and
+                vectorized selection only)
+    crc         uint32 CRC-32 of everything above
+"""
+import json
+import os
+import struct
+import zlib
+from array import array
+from .board import Board
+
+MAGIC = b'KTGA'
+VERSION = 4
+
+# magic, version, rows, cols, start row, start col, population size,
+# generation, flags, repair / selection / crossover name lengths, mutation
+# rate, tournament size, elitism, steady state, evaluations so far, history
+# length, NumPy state length
+HEADER = struct.Struct('<4sHHHHHIIBBBBdHIIQII')
+
+FLAG_BATCH = 1
+FLAG_PREFIX_CACHE = 2
+
+RNG_WORDS = 625
+GAUSS = struct.Struct('<Bd')
+CRC = struct.Struct('<I')
+
+
+def pack_checkpoint(population, history=()):
+    """
+    Serialize a population between generations
+
+    Args:
+        population: Population to save
+        history: Sequence of (best, avg, min) tuples, one per generation
+
+    Returns:
+        Checkpoint bytes
+    """
+    board = population.board
+    repair = population.repair.encode('ascii')
+    selection = (population.selection or '').encode('ascii')
+    crossover = (population.crossover or '').encode('ascii')
+    flags = ((FLAG_BATCH if population.batch else 0)
+             | (FLAG_PREFIX_CACHE if population.prefix_cache else 0))
+
+    np_state = b''
+    if population.np_rng is not None:
+        np_state = json.dumps(population.np_rng.bit_generator.state).encode('ascii')
+
+    version, words, gauss_next = population.rng.getstate()
+    history_values = array('d', [value for stats in history for value in stats])
+
+    data = bytearray(HEADER.pack(
+        MAGIC, VERSION, board.rows, board.cols, board.start[0], board.start[1],
+        population.population_size, population.generation, flags, len(repair),
+        len(selection), len(crossover), population.mutation_rate, population.tournament_size,
+        population.elitism, population.steady_state, population.evaluations,
+        len(history), len(np_state)
+    ))
+    data += repair
+    data += selection
+    data += crossover
+    data += population.genes
+    data += bytes(knight.evaluated for knight in population.knights)
+    data += array('I', words).tobytes()
+    data += GAUSS.pack(gauss_next is not None, gauss_next or 0.0)
+    data += history_values.tobytes()
+    data += np_state
+    data += CRC.pack(zlib.crc32(data))
+    return bytes(data)
+
+
+def save_checkpoint(population, path, history=()):
+    """
+    Atomically write a checkpoint file
+
+    The data goes to a temporary file next to `path`, is flushed to disk
+    and then renamed over `path`, so a crash mid-write leaves the previous
+    checkpoint intact.
+
+    Args:
+        population: Population to save (between generations)
+        path: Checkpoint file path
+        history: Sequence of (best, avg, min) tuples, one per generation
+    """
+    data = pack_checkpoint(population, history)
+    temporary = f"{path}.tmp"
+
+    with open(temporary, 'wb') as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temporary, path)
+
+
+def load_checkpoint(path, **options):
+    """
+    Rebuild a population from a checkpoint file
+
+    The population gets its own random stream, restored to the saved
+    state, so the run continues exactly where the checkpoint was taken
+    (whether the saved run used a seed or the global random module).
+
+    Args:
+        path: Checkpoint file path
+        **options: Runtime-only Population arguments (workers,
+                   profile_log, profile_every)
+
+    Returns:
+        Tuple (population, history)
+
+    Raises:
+        ValueError: If the file is not a valid checkpoint
+    """
+    from .population import Population
+
+    with open(path, 'rb') as f:
+        data = f.read()
+
+    if len(data) < HEADER.size + CRC.size or data[:4] != MAGIC:
+        raise ValueError(f"{path} is not a checkpoint file")
+    (crc,) = CRC.unpack_from(data, len(data) - CRC.size)
+    if zlib.crc32(data[:-CRC.size]) != crc:
+        raise ValueError(f"{path} is corrupted (CRC mismatch)")
+
+    (_, version, rows, cols, start_row, start_col, population_size, generation,
+     flags, repair_length, selection_length, crossover_length, mutation_rate,
+     tournament_size, elitism, steady_state, evaluations, history_length,
+     np_state_length) = HEADER.unpack_from(data)
+    if version != VERSION:
+        raise ValueError(f"Unsupported checkpoint version {version}")
+
+    offset = HEADER.size
+    repair = data[offset:offset + repair_length].decode('ascii')
+    offset += repair_length
+    selection = data[offset:offset + selection_length].decode('ascii') or None
+    offset += selection_length
+    crossover = data[offset:offset + crossover_length].decode('ascii') or None
+    offset += crossover_length
+
+    board = Board(rows, cols, (start_row, start_col))
+    gene_bytes = population_size * board.gene_length
+    genes = data[offset:offset + gene_bytes]
+    offset += gene_bytes
+    evaluated = data[offset:offset + population_size]
+    offset += population_size
+
+    words = array('I')
+    words.frombytes(data[offset:offset + RNG_WORDS * words.itemsize])
+    offset += RNG_WORDS * words.itemsize
+    has_gauss, gauss_next = GAUSS.unpack_from(data, offset)
+    offset += GAUSS.size
+
+    history_values = array('d')
+    history_values.frombytes(data[offset:offset + history_length * 3 * history_values.itemsize])
+    offset += history_length * 3 * history_values.itemsize
+    history = [(int(best), avg, int(worst)) for best, avg, worst in zip(
+        history_values[0::3], history_values[1::3], history_values[2::3])]
+
+    np_state = data[offset:offset + np_state_length]
+
+    population = Population(
+        population_size, batch=bool(flags & FLAG_BATCH),
+        prefix_cache=bool(flags & FLAG_PREFIX_CACHE), board=board, repair=repair,
+        mutation_rate=mutation_rate, tournament_size=tournament_size,
+        elitism=elitism, steady_state=steady_state, selection=selection,
+        crossover=crossover, seed=0, **options
+    )
+    population.genes[:] = genes
+    population.generation = generation
+    population.evaluations = evaluations
+    if np_state:
+        population.np_rng.bit_generator.state = json.loads(np_state)
+
+    # Survivors' genes are already repaired: walking them again rebuilds
+    # their paths and fitness exactly
+    for knight, flag in zip(population.knights, evaluated):
+        if flag:
+            knight.check_moves()
+            knight.evaluate_fitness()
+
+    # Restore the random state last: building the population and walking
+    # the survivors consumed it
+    population.rng.setstate((3, tuple(words), gauss_next if has_gauss else None))
+
+    return population, history
@@ -2,60 +2,116 @@ import random
 
 class Chromosome:
     """
-    Represents a sequence of 63 knight moves (genes)
+    Represents a sequence of knight moves (genes), 63 on a standard board
     Each gene is a number from 1-8 representing a direction
+
+    Genes are stored as bytes: either an owned bytearray or a memoryview
+    into a population-wide buffer (see Chromosome.view)
     """
-    
-    def __init__(self, genes=None):
+
+    __slots__ = ('genes',)
+
+    LENGTH = 63
+
+    def __init__(self, genes=None, length=LENGTH, rng=random):
         """
         Initialize chromosome with genes
-        
+
         Args:
-            genes: List of 63 moves (1-8). If None, generates random genes
+            genes: Sequence of moves (1-8). If None, generates random genes
+            length: Number of random genes to generate (board squares - 1)
+            rng: Random source for the genes (random.Random or the random
+                 module)
         """
         if genes is not None:
-            self.genes = genes[:]  # Copy the list
+            self.genes = bytearray(genes)  # Copy the genes
         else:
-            # Generate 63 random moves (1-8)
-            self.genes = [random.randint(1, 8) for _ in range(63)]
-    
-    def crossover(self, partner):
+            # Generate random moves (1-8)
+            self.genes = bytearray(rng.randint(1, 8) for _ in range(length))
+
+    @classmethod
+    def view(cls, buffer):
+        """
+        Wrap an existing writable buffer without copying it
+
+        Args:
+            buffer: memoryview (or bytearray) holding the genes
+
+        Returns:
+            Chromosome whose genes are the given buffer
+        """
+        chromosome = cls.__new__(cls)
+        chromosome.genes = buffer
+        return chromosome
+
+    def __reduce__(self):
+        """Pickle (and copy) the genes as owned bytes, never a buffer view"""
+        return Chromosome, (bytes(self.genes),)
+
+    def crossover(self, partner, child1=None, child2=None, crossover_point=None,
+                  rng=random):
         """
         Perform single-point crossover with another chromosome
-        
+
         Args:
             partner: Another Chromosome object
-            
+            child1, child2: Optional preallocated Chromosomes to write the
+                            children into (avoids any allocation)
+            crossover_point: Gene index to cut at. If None, chosen randomly
+            rng: Random source for the crossover point
+
         Returns:
-            Tuple of two new Chromosome objects (children)
+            Tuple of two Chromosome objects (children)
+
+        Raises:
+            ValueError: If the point is drawn at random from fewer than 2 genes
         """
         # Choose random crossover point (not at start or end)
-        crossover_point = random.randint(1, 62)
-        
-        # Create two children by swapping genes at crossover point
-        child1_genes = self.genes[:crossover_point] + partner.genes[crossover_point:]
-        child2_genes = partner.genes[:crossover_point] + self.genes[crossover_point:]
-        
-        # Return two new chromosomes
-        return Chromosome(child1_genes), Chromosome(child2_genes)
-    
-    def mutation(self, rate=0.01):
-        """
-        Apply mutation to genes
+        if crossover_point is None:
+            if len(self.genes) < 2:
+                raise ValueError("Crossover needs at least 2 genes")
+            crossover_point = rng.randint(1, len(self.genes) - 1)
+
+        if child1 is None:
+            child1 = Chromosome(self.genes)
+        if child2 is None:
+            child2 = Chromosome(partner.genes)
+
+        # Write both children by swapping genes at crossover point
+        child1.genes[:crossover_point] = self.genes[:crossover_point]
+        child1.genes[crossover_point:] = partner.genes[crossover_point:]
+        child2.genes[:crossover_point] = partner.genes[:crossover_point]
+        child2.genes[crossover_point:] = self.genes[crossover_point:]
+
+        return child1, child2
+
+    def mutation(self, rate=0.01, rng=random):
+        """
+        Apply mutation to genes (in place)
         Each gene has 'rate' probability to mutate to random value
-        
+
         Args:
             rate: Probability of mutation for each gene (default 1%)
+            rng: Random source for the mutations
+
+        Returns:
+            Index of the first mutated gene (len(genes) if none mutated)
         """
-        for i in range(len(self.genes)):
+        genes = self.genes
+        first = len(genes)
+        draw = rng.random
+        for i in range(len(genes)):
             # Check if this gene should mutate
-            if random.random() < rate:
+            if draw() < rate:
                 # Change to random move (1-8)
-                self.genes[i] = random.randint(1, 8)
-    
+                genes[i] = rng.randint(1, 8)
+                if first > i:
+                    first = i
+        return first
+
     def __str__(self):
         """String representation for debugging"""
-        return f"Chromosome(genes={self.genes[:10]}...)"  # Show first 10 genes
-    
+        return f"Chromosome(genes={list(self.genes[:10])}...)"  # Show first 10 genes
+
     def __repr__(self):
-        return self.__str__()
\ No newline at end of file
+        return self.__str__()
@@ -0,0 +1,26 @@
+def print_board(knight):
+    """
+    Print text representation of the board
+    """
+    rows, cols = knight.board.rows, knight.board.cols
+    board = [[' ' for _ in range(cols)] for _ in range(rows)]
+    
+    for i, (row, col) in enumerate(knight.path):
+        board[row][col] = str(i + 1)
+    
+    print("\n" + "="*70)
+    print("KNIGHT'S TOUR - TEXT REPRESENTATION")
+    print("="*70)
+    print("\n      " + "".join([f"{i:^6d}" for i in range(cols)]))
+    print("     +" + "-----+" * cols)
+    
+    for i, row in enumerate(board):
+        print(f" {i:3d} |", end="")
+        for cell in row:
+            if cell == ' ':
+                print(f"  .  |", end="")
+            else:
+                print(f" {cell:>3s} |", end="")
+        print()
+        print("     +" + "-----+" * cols)
+    print()
@@ -0,0 +1,311 @@
+import multiprocessing as mp
+import queue
+import random
+import traceback
+from .chromosome import Chromosome
+from .knight import Knight
+from .population import Population
+from .rng import spawn_seeds
+
+# How often the driver checks for islands that died without reporting
+POLL_SECONDS = 1.0
+
+# How often an island waiting for migrants checks whether the run stopped
+MIGRANT_POLL_SECONDS = 0.1
+
+
+def migration_target(index, islands, topology, rng=random):
+    """
+    Choose which island receives this island's migrants
+
+    Args:
+        index: Sending island
+        islands: Total number of islands
+        topology: 'ring' (next island) or 'random' (any other island)
+        rng: Random source for the 'random' topology
+
+    Returns:
+        Index of the receiving island
+    """
+    if topology == 'ring':
+        return (index + 1) % islands
+    if topology == 'random':
+        target = rng.randrange(islands - 1)
+        return target + 1 if target >= index else target
+    raise ValueError(f"Invalid topology: {topology}")
+
+
+def migration_schedule(seed, islands, topology):
+    """
+    Targets of every island's migrants, epoch after epoch
+
+    Drawn from the run's schedule seed, so every island derives the same
+    table on its own and knows exactly whose migrants to wait for.
+
+    Args:
+        seed: Schedule seed (shared by all islands)
+        islands: Total number of islands
+        topology: 'ring' or 'random' (see migration_target)
+
+    Yields:
+        List with the receiving island of each island, one per epoch
+    """
+    rng = random.Random(seed)
+    while True:
+        yield [migration_target(index, islands, topology, rng) for index in range(islands)]
+
+
+def receive_migrants(inbox, mailbox, generation, senders, stop_generation):
+    """
+    Wait for the migrants of one epoch
+
+    Migrants sent for a later epoch by islands running ahead are kept in
+    `mailbox` until their epoch comes.
+
+    Args:
+        inbox: This island's queue of (generation, sender, migrants)
+        mailbox: Dictionary generation -> {sender: migrants} of early
+                 arrivals (updated in place)
+        generation: Epoch to receive
+        senders: Islands whose migrants this epoch brings
+        stop_generation: Shared last generation of the run
+
+    Returns:
+        Migrants in sender order, or None if the run stopped at or
+        before this generation (they may never be sent)
+    """
+    while len(mailbox.get(generation, ())) < len(senders):
+        if generation >= stop_generation.value:
+            return None
+        try:
+            sent, sender, migrants = inbox.get(timeout=MIGRANT_POLL_SECONDS)
+        except queue.Empty:
+            continue
+        mailbox.setdefault(sent, {})[sender] = migrants
+
+    arrived = mailbox.pop(generation, {})
+    return [migrant for sender in sorted(arrived) for migrant in arrived[sender]]
+
+
+def stop_at(stop_generation, generation):
+    """Make `generation` the run's last one, unless it already ends sooner"""
+    with stop_generation.get_lock():
+        stop_generation.value = min(stop_generation.value, generation)
+
+
+def island_worker(index, config, inboxes, stats_queue, stop_generation):
+    """
+    Evolve one island (runs inside its own process)
+
+    Every `interval` generations the island sends copies of its top
+    `migrants` knights to another island and replaces its worst knights
+    with the migrants sent to it that epoch. Targets follow a schedule
+    drawn from the run's seed, and an island waits for all of its
+    migrants, so a seeded run does not depend on process timing.
+    """
+    for inbox in inboxes:
+        inbox.cancel_join_thread()  # leftover migrants must not block exit
+
+    # Always report done, with the error on failure, or the driver would
+    # wait for this island forever
+    done = {'island': index, 'done': True, 'best': 0}
+    try:
+        done['best'] = evolve_island(index, config, inboxes, stats_queue, stop_generation)
+    except Exception:
+        done['error'] = traceback.format_exc()
+        stop_at(stop_generation, -1)
+    finally:
+        stats_queue.put(done)
+
+
+def evolve_island(index, config, inboxes, stats_queue, stop_generation):
+    """
+    The body of island_worker
+
+    The run ends after the earliest generation in which any island finds
+    a tour: a solving island lowers `stop_generation` to its generation
+    and the others still evaluate up to it, so the earliest solution is
+    always found whichever island gets there first in wall time.
+
+    Returns:
+        Best fitness of the last generation evaluated
+    """
+    population = Population(config['population_size'], board=config['board'],
+                            seed=config['seeds'][index])
+    goal = population.board.size
+    islands = len(inboxes)
+    schedule = migration_schedule(config['schedule_seed'], islands, config['topology'])
+    mailbox = {}
+    max_fitness = 0
+
+    while population.generation <= stop_generation.value:
+        population.check_population()
+        max_fitness, best = population.evaluate()
+        stats = population.get_statistics()
+
+        record = {
+            'island': index,
+            'generation': population.generation,
+            'best': max_fitness,
+            'avg': stats['avg'],
+            'min': stats['min'],
+        }
+
+        if max_fitness == goal:
+            record['genes'] = list(best.chromosome.genes)
+            stats_queue.put(record)
+            stop_at(stop_generation, population.generation)
+            break
+
+        stats_queue.put(record)
+
+        if islands > 1 and population.generation % config['interval'] == 0:
+            targets = next(schedule)
+            if population.generation >= stop_generation.value:
+                break  # last generation: nobody needs migrants
+
+            ranked = sorted(population.knights, key=lambda k: k.fitness, reverse=True)
+
+            # Send top-k (genes already repaired, fitness still valid)
+            migrants = [(bytes(k.chromosome.genes), k.fitness)
+                        for k in ranked[:config['migrants']]]
+            inboxes[targets[index]].put((population.generation, index, migrants))
+
+            # Replace the worst knights with this epoch's migrants
+            senders = [sender for sender, target in enumerate(targets) if target == index]
+            arrived = receive_migrants(inboxes[index], mailbox, population.generation,
+                                       senders, stop_generation)
+            if arrived is None:
+                break
+
+            for worst, (genes, fitness) in zip(reversed(ranked), arrived):
+                worst.chromosome.genes[:] = genes
+                worst.check_moves()  # refresh the cached walk for the new genes
+                worst.fitness = fitness
+
+        population.create_new_generation()
+
+    return max_fitness
+
+
+def run_islands(islands=4, population_size=50, max_generations=1000,
+                interval=10, migrants=2, topology='ring', seed=None,
+                on_stats=None, board=None):
+    """
+    Run an island-model GA: several populations in separate processes
+    exchanging their best chromosomes every few generations
+
+    Args:
+        islands: Number of islands (processes)
+        population_size: Knights per island
+        max_generations: Generation limit per island
+        interval: Migrate every `interval` generations
+        migrants: Number of top knights sent per migration
+        topology: 'ring' or 'random'
+        seed: Base seed the islands' independent seeds and the migration
+              schedule are spawned from (see spawn_seeds); None for
+              random runs. Seeded runs are reproducible: islands wait
+              for their scheduled migrants every epoch.
+        on_stats: Optional callback receiving every per-island stats record
+        board: Board to solve (default: 8x8 starting at (0, 0))
+
+    Returns:
+        Dictionary with 'success', 'island', 'generation', 'fitness'
+        and, when solved, the solving Knight under 'knight' (the
+        earliest generation's, lowest island first)
+        (a solved tour has fitness equal to the number of board squares)
+
+    Raises:
+        RuntimeError: If an island raised or died (the others are
+                      stopped first), with the islands' tracebacks
+    """
+    # One seed per island plus one for the migration schedule
+    seeds = spawn_seeds(seed, islands + 1)
+    config = {
+        'population_size': population_size,
+        'interval': interval,
+        'migrants': migrants,
+        'topology': topology,
+        'seeds': seeds[:islands],
+        'schedule_seed': seeds[islands],
+        'board': board,
+    }
+
+    inboxes = [mp.Queue() for _ in range(islands)]
+    stats_queue = mp.Queue()
+    stop_generation = mp.Value('q', max_generations)
+
+    processes = [
+        mp.Process(target=island_worker,
+                   args=(i, config, inboxes, stats_queue, stop_generation),
+                   daemon=True)
+        for i in range(islands)
+    ]
+    for process in processes:
+        process.start()
+
+    result = {'success': False, 'island': None, 'generation': None, 'fitness': 0}
+    finished = set()
+    errors = {}
+    lost = set()
+
+    # Stream stats until every island has reported done. An island that
+    # died without reporting (killed, crashed interpreter) is noticed by
+    # polling; it must still be dead one poll later, after anything it
+    # sent on its way out has been read.
+    while len(finished) < islands:
+        try:
+            record = stats_queue.get(timeout=POLL_SECONDS)
+        except queue.Empty:
+            dead = {index for index, process in enumerate(processes)
+                    if index not in finished and process.exitcode is not None}
+            if dead & lost:
+                stop_at(stop_generation, -1)
+                for index in dead & lost:
+                    errors[index] = f"exited with code {processes[index].exitcode}"
+                finished |= dead & lost
+            lost = dead
+            continue
+
+        if record.get('done'):
+            finished.add(record['island'])
+            result['fitness'] = max(result['fitness'], record['best'])
+            if 'error' in record:
+                errors[record['island']] = record['error']
+            continue
+
+        if on_stats is not None:
+            on_stats(record)
+
+        # The earliest solution wins, whichever island reports it first
+        solved_at = (record.get('generation'), record['island'])
+        if 'genes' in record and (not result['success']
+                                  or solved_at < (result['generation'], result['island'])):
+            knight = Knight(Chromosome(record['genes']), board)
+            knight.check_moves()
+            knight.evaluate_fitness()
+            result.update(success=True, island=record['island'],
+                          generation=record['generation'], knight=knight)
+
+    for process in processes:
+        process.join()
+
+    if errors:
+        raise RuntimeError("\n".join(f"Island {index} failed:\n{error}"
+                                     for index, error in sorted(errors.items())))
+    return result
+
+
+if __name__ == "__main__":
+    def print_record(record):
+        print(f"Island {record['island']} | "
+              f"Generation {record['generation']:4d} | "
+              f"Best: {record['best']:2d} | "
+              f"Avg: {record['avg']:5.2f}")
+
+    outcome = run_islands(on_stats=print_record)
+    if outcome['success']:
+        print(f"Solved by island {outcome['island']} "
+              f"in generation {outcome['generation']}")
+    else:
+        print(f"No full tour found (best fitness: {outcome['fitness']})")
@@ -1,44 +1,147 @@
 import random
+from array import array
+from .board import DEFAULT_BOARD, MOVES
 from .chromosome import Chromosome
+from .repair import DETERMINISTIC_REPAIRS, REPAIR_STRATEGIES
 
 class Knight:
     """
     Represents a knight on the chessboard with its movement sequence
     """
     
-    # Define the 8 possible L-shaped knight moves
+    # The 8 possible L-shaped knight moves
     # Direction: (row_change, col_change)
-    MOVES = {
-        1: (1, -2),   # up-right
-        2: (2, -1),   # right-up
-        3: (2, 1),  # right-down
-        4: (1, 2),  # down-right
-        5: (-1, 2),   # down-left
-        6: (-2, 1),   # left-down
-        7: (-2, -1),    # left-up
-        8: (-1, -2)     # up-left
-    }
+    MOVES = MOVES
     
-    def __init__(self, chromosome=None):
+    def __init__(self, chromosome=None, board=None, repair='cycle', rng=random):
         """
         Initialize a knight
         
         Args:
             chromosome: Chromosome object with move sequence. 
                        If None, creates random chromosome
+            board: Board to walk on (default: 8x8 starting at (0, 0))
+            repair: How invalid moves are corrected: 'cycle' (random
+                    forward/backward cycling) or 'warnsdorff'
+            rng: Random source for a random chromosome and the cycle
+                 directions (random.Random or the random module)
         """
+        if repair not in REPAIR_STRATEGIES:
+            raise ValueError(f"Invalid repair strategy: {repair}")
+        
+        self.board = board if board is not None else DEFAULT_BOARD
+        self.repair = repair
+        self.rng = rng
+        
         # Create or assign chromosome
-        self.chromosome = chromosome if chromosome else Chromosome()
+        self.chromosome = (chromosome if chromosome
+                           else Chromosome(length=self.board.gene_length, rng=rng))
         
-        # Starting position (top-left corner)
-        self.position = (0, 0)
+        # Starting position
+        self.position = self.board.start
         
         # Path of visited positions
-        self.path = [(0, 0)]
+        self.path = [self.board.start]
         
         # Fitness score (how many squares visited)
         self.fitness = 0
+        
+        # Prefix cache: square indices and visited masks of the last walk
+        # (masks are only kept when record_masks is set)
+        self.record_masks = False
+        self.squares = None
+        self.masks = None
+        
+        # Parent whose walk the first resume_step genes repeat
+        self.parent = None
+        self.resume_step = 0
+        
+        # True once the current genes have been walked (survivors carried
+        # into the next generation keep it and are not walked again)
+        self.evaluated = False
+
+    def reset(self):
+        """
+        Put the knight back on the starting square (keeps its chromosome)
+        Used when a knight object is reused for a new generation
+        """
+        self.position = self.board.start
+        self.path = [self.board.start]
+        self.fitness = 0
+        self.squares = None
+        self.masks = None
+        self.parent = None
+        self.resume_step = 0
+        self.evaluated = False
     
+    def copy_from(self, other):
+        """
+        Become a copy of another knight, genes and walk included
+        Used to carry survivors into the next generation unchanged
+        
+        Args:
+            other: Knight to copy
+        """
+        self.chromosome.genes[:] = other.chromosome.genes
+        self.position = other.position
+        self.path = list(other.path)
+        self.fitness = other.fitness
+        self.squares = other.squares
+        self.masks = other.masks
+        self.parent = None
+        self.resume_step = 0
+        self.evaluated = other.evaluated
+    
+    def snapshot(self):
+        """
+        Detached copy of this knight: its own genes and path, no walk cache
+        
+        Population knights (and their gene buffers) are recycled every
+        generation; a snapshot stays valid however long it is kept.
+        
+        Returns:
+            New Knight on the same board with the same walk and fitness
+        """
+        knight = Knight(Chromosome(self.chromosome.genes), self.board, self.repair, self.rng)
+        knight.position = self.position
+        knight.path = list(self.path)
+        knight.fitness = self.fitness
+        knight.evaluated = self.evaluated
+        return knight
+    
+    def __getstate__(self):
+        """
+        Pickle state: the random module itself can't be pickled (a
+        random.Random stream can), and a parent is never carried along
+        """
+        state = self.__dict__.copy()
+        if state['rng'] is random:
+            state['rng'] = None
+        state['parent'] = None
+        state['resume_step'] = 0
+        return state
+    
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        if self.rng is None:
+            self.rng = random
+    
+    def inherit(self, parent, step):
+        """
+        Let the next check_moves resume from a parent's cached walk
+        
+        The parent's repaired genes are valid moves along its path, so
+        replaying them never repairs or draws random numbers: resuming
+        gives exactly the same result as walking from the start.
+        
+        Args:
+            parent: Knight whose (repaired) first `step` genes this
+                    knight's chromosome shares
+            step: Number of leading genes shared with the parent
+        """
+        self.parent = parent
+        self.resume_step = step
+
     def move_forward(self, direction):
         """
         Calculate new position after moving in given direction
@@ -81,8 +184,8 @@ class Knight:
         """
         row, col = pos
         
-        # Check if inside 8x8 board
-        if row < 0 or row >= 8 or col < 0 or col >= 8:
+        # Check if inside the board
+        if row < 0 or row >= self.board.rows or col < 0 or col >= self.board.cols:
             return False
         
         # Check if not already visited
@@ -91,65 +194,96 @@ class Knight:
         
         return True
     
-    def check_moves(self):
+    def check_moves(self, counts=None, cache=None):
         """
         Validate and correct the chromosome's move sequence
-        Goes through all 63 moves and corrects invalid ones
+        Goes through all moves (63 on 8x8) and corrects invalid ones
+        
+        Args:
+            counts: Optional [repairs, fallbacks] list the walk adds its
+                    repair counters to (see Profiler)
+            cache: Optional FitnessCache; known genes skip the walk
         """
-        # Reset to starting position
-        self.position = (0, 0)
-        self.path = [(0, 0)]
+        genes = self.chromosome.genes
+        if cache is not None:
+            key = bytes(genes)
+            entry = cache.get(key)
+            if entry is not None:
+                self.restore(*entry)
+                return
         
-        # Go through all 63 genes
-        for i in range(63):
-            current_move = self.chromosome.genes[i]
-            
-            # Try the current move
-            new_pos = self.move_forward(current_move)
-            
-            # If valid, make the move and continue
-            if self.is_valid_position(new_pos):
-                self.position = new_pos
-                self.path.append(new_pos)
-                continue
-            
-            # If invalid, try to find a valid alternative
-            # Randomly choose cycle direction (forward or backward)
-            cycle_forward = random.choice([True, False])
-            
-            found_valid = False
-            
-            # Try all 8 possible moves
-            for attempt in range(8):
-                # Cycle through moves
-                if cycle_forward:
-                    test_move = (current_move % 8) + 1 #cuz we re using indexes form 0 to 7 we need to make them from 1 to 8 
-                else:
-                    test_move = ((current_move - 2) % 8) + 1
-                
-                current_move = test_move
-                
-                # Try this move
-                new_pos = self.move_forward(test_move)
-                
-                if self.is_valid_position(new_pos):
-                    # Found valid move!
-                    self.position = new_pos
-                    self.path.append(new_pos)
-                    self.chromosome.genes[i] = test_move  # Update gene
-                    found_valid = True
-                    break
-            
-            # If no valid move found, stop here
-            if not found_valid:
-                break
+        squares = None
+        masks = [] if self.record_masks else None
+        path = []
+        
+        # Resume from the parent's walk where the genes are still shared
+        parent = self.parent
+        if parent is not None and parent.masks is not None:
+            step = min(self.resume_step, len(parent.squares) - 1)
+            squares = parent.squares[:step + 1]
+            masks = parent.masks[:step + 1]
+            path = parent.path[:step + 1]
+        self.parent = None
+        
+        # Walk the genes on the bitboard, repairing invalid moves in place
+        board = self.board
+        repair_moves = REPAIR_STRATEGIES[self.repair]
+        squares = repair_moves(genes, board.neighbours,
+                               start=board.start_square, rng=self.rng,
+                               squares=squares, masks=masks, counts=counts)
+        self.squares = squares
+        self.masks = masks
+        
+        # Convert the newly walked square indices to (row, col) positions
+        coordinates = board.squares
+        path.extend([coordinates[square] for square in squares[len(path):]])
+        self.path = path
+        self.position = path[-1]
+        self.evaluated = True
+        
+        if cache is not None:
+            # Repaired genes replay without repairs, so their outcome is
+            # always safe to cache; other inputs only for deterministic
+            # strategies
+            repaired = bytes(genes)
+            if repaired == key:
+                repaired = key
+            squares = array('H', squares)
+            cache.put(repaired, repaired, squares)
+            if repaired is not key and self.repair in DETERMINISTIC_REPAIRS:
+                cache.put(key, repaired, squares)
+    
+    def restore(self, repaired, squares):
+        """
+        Take a cached walk outcome instead of walking
+        
+        Args:
+            repaired: Packed repaired genes
+            squares: array('H') of visited square indices
+        """
+        genes = self.chromosome.genes
+        if genes != repaired:
+            genes[:] = repaired
+        
+        path = list(map(self.board.squares.__getitem__, squares))
+        self.path = path
+        self.position = path[-1]
+        self.squares = None
+        self.masks = None
+        self.parent = None
+        self.evaluated = True
+        
+        # A walk that dead-ends draws its cycle direction once at the dead
+        # end; draw it anyway to keep the random stream unchanged
+        if len(squares) < self.board.size and self.repair not in DETERMINISTIC_REPAIRS:
+            self.rng.choice([True, False])
     
     def evaluate_fitness(self):
         """
         Calculate fitness score (number of unique squares visited)
         
         Returns:
-            Fitness value (1-64)
+            Fitness value (1 to board squares, 64 on 8x8)
         """
         self.fitness = len(self.path)
         return self.fitness
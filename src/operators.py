@@ -0,0 +1,116 @@
+"""
+Vectorized crossover and mutation for whole generations
+
+The operators work on the population's (N, L) uint8 gene matrix (a
+NumPy view of its gene buffer) and the parent index arrays from
+selection, so a generation is bred in a few NumPy operations instead of
+one Chromosome.crossover/mutation call per child.
+"""
+import numpy as np
+
+
+def one_point_masks(pairs, length, rng):
+    """
+    Single-point crossover: genes before a random cut (1..length-1) come
+    from the first parent
+
+    Returns:
+        Tuple ((pairs, length) bool mask of genes taken from the first
+               parent, (pairs,) cut points)
+    """
+    points = rng.integers(1, length, size=pairs)
+    mask = np.arange(length) < points[:, None]
+    return mask, points
+
+
+def two_point_masks(pairs, length, rng):
+    """
+    Two-point crossover: the segment between two random cuts comes from
+    the second parent
+
+    Returns:
+        Same as one_point_masks (the first cut is the shared prefix)
+    """
+    cuts = np.sort(rng.integers(1, length, size=(pairs, 2)), axis=1)
+    genes = np.arange(length)
+    mask = (genes < cuts[:, :1]) | (genes >= cuts[:, 1:])
+    return mask, cuts[:, 0]
+
+
+def uniform_masks(pairs, length, rng):
+    """
+    Uniform crossover: every gene comes from either parent with equal
+    chance
+
+    Returns:
+        Same as one_point_masks (the prefix is up to the first gene taken
+        from the second parent)
+    """
+    mask = rng.random((pairs, length), dtype=np.float32) < 0.5
+    prefix = np.where(mask.all(axis=1), length, np.argmin(mask, axis=1))
+    return mask, prefix
+
+
+# Crossover operators (same signature)
+CROSSOVER_METHODS = {
+    'one_point': one_point_masks,
+    'two_point': two_point_masks,
+    'uniform': uniform_masks,
+}
+
+
+def crossover_batch(genes, first, second, out, method='one_point', rng=None):
+    """
+    Breed two children per parent pair into a gene matrix
+
+    Children of pair j are written to rows 2j and 2j + 1 of `out`: the
+    first takes the masked genes from the first parent and the rest from
+    the second, the other one the opposite. A trailing odd row gets only
+    the first child.
+
+    Args:
+        genes: (N, L) uint8 parent gene matrix
+        first, second: (pairs,) parent row indices
+        out: (M, L) uint8 matrix to write the children into, with
+             M = 2 * pairs or 2 * pairs - 1
+        method: Key of CROSSOVER_METHODS
+        rng: numpy Generator (default: fresh unseeded one)
+
+    Returns:
+        (M,) array: number of leading genes every child shares with its
+        first-listed parent (first for even rows, second for odd rows)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    pairs, length = len(first), genes.shape[1]
+    mask, prefix = CROSSOVER_METHODS[method](pairs, length, rng)
+
+    parent1 = genes[first]
+    parent2 = genes[second]
+    children = len(out)
+
+    out[0::2] = np.where(mask, parent1, parent2)[:(children + 1) // 2]
+    out[1::2] = np.where(mask, parent2, parent1)[:children // 2]
+
+    return np.repeat(prefix, 2)[:children]
+
+
+def mutate_batch(genes, rate=0.01, rng=None):
+    """
+    Per-gene mutation of a whole gene matrix (in place)
+    Each gene has `rate` probability to become a random move (1-8)
+
+    Args:
+        genes: (N, L) uint8 gene matrix
+        rate: Probability of mutation for each gene
+        rng: numpy Generator (default: fresh unseeded one)
+
+    Returns:
+        (N,) array: index of the first mutated gene of every row (L if
+        none mutated)
+    """
+    rng = rng if rng is not None else np.random.default_rng()
+    hits = rng.random(genes.shape, dtype=np.float32) < rate
+    genes[hits] = rng.integers(1, 9, size=np.count_nonzero(hits), dtype=np.uint8)
+
+    mutated = hits.any(axis=1)
+    return np.where(mutated, np.argmax(hits, axis=1), genes.shape[1])
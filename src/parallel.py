@@ -0,0 +1,109 @@
+import os
+import random
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from .board import DEFAULT_BOARD
+from .repair import REPAIR_STRATEGIES
+
+
+def repair_shard(packed, board, seed, repair='cycle'):
+    """
+    Repair a shard of packed chromosomes (runs inside a worker process)
+
+    Args:
+        packed: bytes of chromosomes, board.gene_length genes each
+        board: Board the chromosomes walk on
+        seed: Seed for this shard's cycle-direction choices
+        repair: Name of the repair strategy
+
+    Returns:
+        Tuple (repaired genes as bytes, fitness values as array('H'),
+               [repairs, fallbacks] counters)
+    """
+    rng = random.Random(seed)
+    genes = bytearray(packed)
+    view = memoryview(genes)
+    fitness = array('H')
+    length = board.gene_length
+    repair_moves = REPAIR_STRATEGIES[repair]
+    counts = [0, 0]
+
+    for offset in range(0, len(genes), length):
+        squares = repair_moves(view[offset:offset + length], board.neighbours,
+                               start=board.start_square, rng=rng, counts=counts)
+        fitness.append(len(squares))
+
+    return bytes(genes), fitness, counts
+
+
+class ParallelEvaluator:
+    """
+    Persistent pool of worker processes that repair chromosomes in shards
+
+    Chromosomes travel as one packed byte buffer per shard instead of
+    pickled Knight objects, and the same workers are reused every generation.
+    """
+
+    def __init__(self, workers=None, shards_per_worker=4):
+        """
+        Start the worker pool
+
+        Args:
+            workers: Number of worker processes (default: all CPUs)
+            shards_per_worker: Shards sent to each worker per call
+        """
+        self.workers = workers or os.cpu_count()
+        self.shards_per_worker = shards_per_worker
+        self.executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def evaluate(self, packed, board=DEFAULT_BOARD, rng=random, repair='cycle',
+                 counts=None):
+        """
+        Repair all packed chromosomes across the pool
+
+        Args:
+            packed: bytes-like buffer of chromosomes, board.gene_length genes each
+            board: Board the chromosomes walk on
+            rng: Random source for the per-shard seeds
+            repair: Name of the repair strategy
+            counts: Optional [repairs, fallbacks] list to add the workers'
+                    repair counters to
+
+        Returns:
+            Tuple (repaired genes as bytearray, list of fitness values)
+        """
+        length = board.gene_length
+        count = len(packed) // length
+        if not count:
+            return bytearray(), []
+        shards = min(count, self.workers * self.shards_per_worker) or 1
+        per_shard = -(-count // shards)  # ceiling division
+
+        futures = []
+        for first in range(0, count, per_shard):
+            chunk = bytes(packed[first * length:(first + per_shard) * length])
+            futures.append(self.executor.submit(
+                repair_shard, chunk, board, rng.getrandbits(64), repair
+            ))
+
+        repaired = bytearray()
+        fitness = []
+        for future in futures:
+            genes, values, shard_counts = future.result()
+            repaired += genes
+            fitness.extend(values)
+            if counts is not None:
+                counts[0] += shard_counts[0]
+                counts[1] += shard_counts[1]
+
+        return repaired, fitness
+
+    def close(self):
+        """Shut down the worker processes"""
+        self.executor.shutdown()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,52 +1,298 @@
 import random
+from .board import DEFAULT_BOARD
+from .cache import FitnessCache
 from .knight import Knight
 from .chromosome import Chromosome
+from .profiling import Profiler
+from .repair import warnsdorff_genes
 
 class Population:
     """
     Manages a population of knights and evolves them using genetic algorithm
     """
     
-    def __init__(self, population_size):
+    def __init__(self, population_size, batch=False, workers=0, prefix_cache=False,
+                 board=None, repair='cycle', warnsdorff_seed=0.0,
+                 profile_log=None, profile_every=0, mutation_rate=0.01,
+                 tournament_size=3, fitness_cache=0, elitism=0, steady_state=0,
+                 selection=None, crossover=None, seed=None):
         """
         Initialize population with random knights
         
         Args:
             population_size: Number of knights in population (e.g., 50)
+            batch: If True, walk and evaluate all knights at once with NumPy
+            workers: If > 0, repair knights on a persistent pool of this
+                     many worker processes (call close() when done)
+            prefix_cache: If True, children resume their walk from the
+                          parent's cached walk at the crossover point (or
+                          first mutated gene) instead of from the start
+            board: Board to solve (default: 8x8 starting at (0, 0))
+            repair: Repair strategy for invalid moves: 'cycle' or
+                    'warnsdorff' (batch mode supports 'cycle' only)
+            warnsdorff_seed: Fraction of the initial knights whose genes
+                             follow a Warnsdorff tour instead of random moves
+            profile_log: If set, per-generation timings and counters are
+                         appended to this JSONL file (see Profiler)
+            profile_every: Run cProfile on every N-th generation (0 = never)
+            mutation_rate: Per-gene mutation probability for children
+            tournament_size: Knights sampled per tournament selection
+            fitness_cache: If > 0, byte cap of an LRU cache of walk
+                           outcomes keyed by genes, so duplicate
+                           chromosomes skip their walk (serial mode only)
+            elitism: Number of best knights copied unchanged into the
+                     next generation (and not evaluated again)
+            steady_state: If > 0, each new generation only replaces this
+                          many of the worst knights; the others survive
+                          unchanged (cannot be combined with elitism)
+            selection: None for the per-pair tournament_selection, or a
+                       vectorized strategy drawing all parents at once
+                       with NumPy: 'tournament', 'rank' or 'sus'
+            crossover: None for per-pair Chromosome crossover/mutation, or
+                       'one_point', 'two_point' or 'uniform' to breed the
+                       whole generation with vectorized operators (uses
+                       the 'tournament' selection unless one is given)
+            seed: Seed of this population's own random streams (a
+                  random.Random for the genes, operators and repairs and
+                  a NumPy Generator seeded from it). If None, the global
+                  random module is used, so random.seed() still applies
         """
+        if board is not None and board.gene_length < 2:
+            raise ValueError(f"A {board.rows}x{board.cols} board is too small to evolve "
+                             f"(crossover needs at least 3 squares)")
+        if batch and repair != 'cycle':
+            raise ValueError("Batched evaluation only supports the 'cycle' repair")
+        if fitness_cache and (batch or workers > 0):
+            raise ValueError("The fitness cache only supports serial evaluation")
+        if elitism and steady_state:
+            raise ValueError("Use either elitism or steady_state, not both")
+        if not 0 <= elitism < population_size:
+            raise ValueError(f"Invalid elitism: {elitism}")
+        if not 0 <= steady_state <= population_size:
+            raise ValueError(f"Invalid steady_state: {steady_state}")
+        if selection is not None:
+            from .selection import SELECTION_STRATEGIES
+            if selection not in SELECTION_STRATEGIES:
+                raise ValueError(f"Invalid selection strategy: {selection}")
+        if crossover is not None:
+            from .operators import CROSSOVER_METHODS
+            if crossover not in CROSSOVER_METHODS:
+                raise ValueError(f"Invalid crossover method: {crossover}")
+            selection = selection or 'tournament'
+        
         self.population_size = population_size
+        self.board = board if board is not None else DEFAULT_BOARD
+        self.length = self.board.gene_length
         self.generation = 1
+        self.batch = batch
+        self.prefix_cache = prefix_cache
+        self.repair = repair
+        self.mutation_rate = mutation_rate
+        self.tournament_size = tournament_size
+        self.elitism = elitism
+        self.steady_state = steady_state
+        self.selection = selection
+        self.crossover = crossover
+        
+        # Random source of every operator, walk and worker seed
+        self.rng = random.Random(seed) if seed is not None else random
+        
+        # Knights carried over unchanged into every next generation
+        self.survivors = population_size - steady_state if steady_state else elitism
+        
+        # Number of knights walked so far (the real cost of a run)
+        self.evaluations = 0
+        
+        # Per-phase timers and repair counters (cheap, always on)
+        self.profiler = Profiler(profile_log, profile_every)
+        
+        # Walk outcomes of known genes (see FitnessCache)
+        self.cache = FitnessCache(fitness_cache) if fitness_cache else None
+        
+        # Fitness of every knight (filled by check_population in batch and
+        # parallel mode, by evaluate otherwise; None while out of date)
+        self.fitness = None
+        self.np_rng = None
+        
+        if batch or selection is not None:
+            import numpy as np
+            self.np_rng = np.random.default_rng(self.rng.getrandbits(64))
+        
+        # Worker pool for parallel evaluation (started once, reused)
+        self.evaluator = None
+        if workers > 0:
+            from .parallel import ParallelEvaluator
+            self.evaluator = ParallelEvaluator(workers)
+        
+        # All genes live in two preallocated buffers (current and next
+        # generation); every chromosome is a view into one of them
+        self.genes = bytearray(
+            self.rng.randint(1, 8) for _ in range(population_size * self.length)
+        )
+        self.next_genes = bytearray(population_size * self.length)
+        
+        # Seed a fraction of the knights with Warnsdorff-derived genes
+        for i in range(round(population_size * warnsdorff_seed)):
+            self.genes[i * self.length:(i + 1) * self.length] = warnsdorff_genes(
+                self.board.neighbours, self.board.start_square, self.length, self.rng
+            )
         
         # Create initial population of random knights
-        self.knights = [Knight() for _ in range(population_size)]
+        self.knights = self.create_knights(self.genes)
+        self.next_knights = self.create_knights(self.next_genes)
+        
+        if prefix_cache:
+            for knight in self.knights + self.next_knights:
+                knight.record_masks = True
+        
+        # Spare chromosome for the unused second child when size is odd
+        self.spare_chromosome = Chromosome(bytes(self.length))
         
         print(f"Created initial population of {population_size} knights")
     
+    def create_knights(self, buffer):
+        """
+        Create one knight per chromosome slot of a gene buffer
+        
+        Args:
+            buffer: bytearray of population_size * length genes
+            
+        Returns:
+            List of Knight objects whose chromosomes view the buffer
+        """
+        view = memoryview(buffer)
+        length = self.length
+        return [
+            Knight(Chromosome.view(view[i * length:(i + 1) * length]),
+                   self.board, self.repair, self.rng)
+            for i in range(self.population_size)
+        ]
+    
     def check_population(self):
         """
         Validate moves for all knights in population
+        Survivors from the previous generation are already evaluated and
+        are skipped
         """
-        for knight in self.knights:
-            knight.check_moves()
+        with self.profiler.phase('check_population', self.generation):
+            if self.batch:
+                self.check_population_batch()
+            elif self.evaluator is not None:
+                self.check_population_parallel()
+            else:
+                counts = self.profiler.walk_counts
+                cache = self.cache
+                for knight in self.knights:
+                    if not knight.evaluated:
+                        knight.check_moves(counts, cache)
+                        self.evaluations += 1
+    
+    def pending_knights(self):
+        """
+        Returns:
+            Indices of the knights that still need a walk, or None if
+            that is every knight
+        """
+        if not self.survivors:
+            return None
+        return [i for i, knight in enumerate(self.knights) if not knight.evaluated]
+    
+    def check_population_batch(self):
+        """
+        Validate moves for all knights in one vectorized pass
+        
+        The population's gene buffer is viewed as one
+        (population_size, length) uint8 array and repaired in lockstep, in
+        place. self.fitness holds the resulting fitness vector.
+        """
+        import numpy as np
+        from .batch import repair_batch
+        
+        genes = np.frombuffer(self.genes, dtype=np.uint8).reshape(
+            self.population_size, self.length
+        )
+        pending = self.pending_knights()
+        
+        if pending is None:
+            self.fitness = repair_batch(genes, self.board.neighbours,
+                                        start=self.board.start_square, rng=self.np_rng,
+                                        counts=self.profiler.walk_counts)
+            pending = range(self.population_size)
+        else:
+            # Repair only the new knights' rows, then write them back
+            subset = genes[pending]
+            fitness = repair_batch(subset, self.board.neighbours,
+                                   start=self.board.start_square, rng=self.np_rng,
+                                   counts=self.profiler.walk_counts)
+            genes[pending] = subset
+            self.fitness = np.array([knight.fitness for knight in self.knights],
+                                    dtype=fitness.dtype)
+            self.fitness[pending] = fitness
+        
+        fitnesses = self.fitness.tolist()
+        for i in pending:
+            knight = self.knights[i]
+            knight.fitness = fitnesses[i]
+            knight.evaluated = True
+        self.evaluations += len(pending)
+    
+    def check_population_parallel(self):
+        """
+        Validate moves for all knights on the worker pool
+        
+        Genes are sent to the workers as packed bytes; repaired genes and
+        fitness values come back and are written onto the knights.
+        """
+        pending = self.pending_knights()
+        
+        if pending is None:
+            repaired, self.fitness = self.evaluator.evaluate(
+                self.genes, self.board, rng=self.rng, repair=self.repair,
+                counts=self.profiler.walk_counts
+            )
+            self.genes[:] = repaired
+            pending = range(self.population_size)
+        else:
+            # Send only the new knights' genes
+            length = self.length
+            packed = b''.join(self.knights[i].chromosome.genes for i in pending)
+            repaired, fitness = self.evaluator.evaluate(
+                packed, self.board, rng=self.rng, repair=self.repair,
+                counts=self.profiler.walk_counts
+            )
+            self.fitness = [knight.fitness for knight in self.knights]
+            for offset, i in enumerate(pending):
+                self.knights[i].chromosome.genes[:] = repaired[offset * length:(offset + 1) * length]
+                self.fitness[i] = fitness[offset]
+        
+        for i in pending:
+            knight = self.knights[i]
+            knight.fitness = self.fitness[i]
+            knight.evaluated = True
+        self.evaluations += len(pending)
     
     def evaluate(self):
         """
         Evaluate fitness of all knights and find the best one
         
         Returns:
-            Tuple (best_fitness, best_knight)
+            Tuple (best_fitness, best_knight). best_knight is a snapshot
+            (see Knight.snapshot): the population's own knights are
+            recycled by the next generations, the snapshot stays valid
         """
-        best_fitness = 0
-        best_knight = None
+        with self.profiler.phase('evaluate', self.generation):
+            if self.batch or self.evaluator is not None:
+                # Only the best knight needs its path: replaying the
+                # repaired genes reproduces the batched/parallel walk
+                best_index = max(range(self.population_size), key=self.fitness.__getitem__)
+                best_knight = self.knights[best_index]
+                best_knight.check_moves()
+                return best_knight.evaluate_fitness(), best_knight.snapshot()
         
-        for knight in self.knights:
-            fitness = knight.evaluate_fitness()
-            
-            if fitness > best_fitness:
-                best_fitness = fitness
-                best_knight = knight
+            self.fitness = [knight.evaluate_fitness() for knight in self.knights]
+            best_index = max(range(self.population_size), key=self.fitness.__getitem__)
         
-        return best_fitness, best_knight
+            return self.fitness[best_index], self.knights[best_index].snapshot()
     
     def tournament_selection(self, size=3):
         """
@@ -59,7 +305,7 @@ class Population:
             Tuple of 2 Knight objects (parents)
         """
         # Randomly sample 'size' knights from population
-        sample = random.sample(self.knights, size)
+        sample = self.rng.sample(self.knights, size)
         
         # Sort by fitness (highest first)
         sample.sort(key=lambda k: k.fitness, reverse=True)
@@ -67,34 +313,191 @@ class Population:
         # Return top 2 as parents
         return sample[0], sample[1]
     
+    def select_parents(self, pairs):
+        """
+        Draw the parents of all pairs at once with the vectorized
+        selection strategy
+        
+        Args:
+            pairs: Number of parent pairs
+            
+        Returns:
+            List of (index, index) parent pairs into self.knights
+        """
+        import numpy as np
+        from .selection import SELECTION_STRATEGIES
+        
+        fitness = self.fitness
+        if fitness is None:
+            fitness = [k.fitness for k in self.knights]
+        fitness = np.asarray(fitness)
+        select = SELECTION_STRATEGIES[self.selection]
+        return select(fitness, pairs, self.np_rng, self.tournament_size).tolist()
+    
     def create_new_generation(self):
         """
         Create new generation through selection, crossover, and mutation
-        Replaces current population with new offspring
+        Children are written in place into the next-generation buffer,
+        which then becomes the current population
+        """
+        with self.profiler.phase('create_new_generation', self.generation):
+            new_knights = self.next_knights
+            
+            # Elitism / steady state: the best knights survive unchanged
+            # (in the first slots) and keep their evaluation
+            survivors = self.survivors
+            if survivors:
+                best = sorted(self.knights, key=lambda k: k.fitness, reverse=True)
+                for knight, survivor in zip(new_knights, best[:survivors]):
+                    knight.copy_from(survivor)
+        
+            if self.crossover is not None:
+                self.breed_batch(survivors)
+            else:
+                self.breed(survivors)
+        
+        # Swap buffers: the old population becomes next generation's storage
+        self.knights, self.next_knights = self.next_knights, self.knights
+        self.genes, self.next_genes = self.next_genes, self.genes
+        self.fitness = None
+        
+        self.profiler.end_generation(self.generation)
+        self.generation += 1
+    
+    def breed(self, survivors):
         """
-        new_knights = []
+        Fill the next generation's slots after the survivors with children,
+        one Chromosome crossover and mutation per pair
         
-        # Create population_size/2 pairs of children (total = population_size)
-        for _ in range(self.population_size // 2):
+        Args:
+            survivors: Number of leading slots already taken by survivors
+        """
+        new_knights = self.next_knights
+        
+        # Parents for all pairs in one batched draw (vectorized selection)
+        knights = self.knights
+        parents = None
+        if self.selection is not None:
+            parents = iter(self.select_parents((self.population_size - survivors + 1) // 2))
+        
+        # Create pairs of children for the remaining slots
+        for i in range(survivors, self.population_size, 2):
             # Select 2 parents using tournament selection
-            parent1, parent2 = self.tournament_selection()
-            
-            # Crossover: create 2 children
-            child1_chromosome, child2_chromosome = parent1.chromosome.crossover(
-                parent2.chromosome
+            if parents is None:
+                parent1, parent2 = self.tournament_selection(self.tournament_size)
+            else:
+                first, second = next(parents)
+                parent1, parent2 = knights[first], knights[second]
+        
+            child1 = new_knights[i]
+            child2 = new_knights[i + 1] if i + 1 < self.population_size else None
+            child2_chromosome = (child2.chromosome if child2 is not None
+                                 else self.spare_chromosome)
+        
+            # Crossover: write 2 children into their preallocated slots
+            crossover_point = self.rng.randint(1, self.length - 1)
+            parent1.chromosome.crossover(
+                parent2.chromosome, child1.chromosome, child2_chromosome,
+                crossover_point
             )
-            
+        
             # Mutation: mutate both children
-            child1_chromosome.mutation()
-            child2_chromosome.mutation()
+            mutated1 = child1.chromosome.mutation(self.mutation_rate, self.rng)
+            mutated2 = child2_chromosome.mutation(self.mutation_rate, self.rng)
+        
+            child1.reset()
+            if child2 is not None:
+                child2.reset()
+        
+            # Children repeat their parent's walk up to the cut or first mutation
+            if self.prefix_cache:
+                child1.inherit(parent1, min(crossover_point, mutated1))
+                if child2 is not None:
+                    child2.inherit(parent2, min(crossover_point, mutated2))
+    
+    def breed_batch(self, survivors):
+        """
+        Fill the next generation's slots after the survivors with children
+        bred by the vectorized operators on the (N, L) gene matrices
+        
+        Args:
+            survivors: Number of leading slots already taken by survivors
+        """
+        import numpy as np
+        from .operators import crossover_batch, mutate_batch
+        
+        shape = (self.population_size, self.length)
+        genes = np.frombuffer(self.genes, dtype=np.uint8).reshape(shape)
+        children = np.frombuffer(self.next_genes, dtype=np.uint8).reshape(shape)[survivors:]
+        
+        parents = np.asarray(self.select_parents((len(children) + 1) // 2))
+        shared = crossover_batch(genes, parents[:, 0], parents[:, 1], children,
+                                 self.crossover, self.np_rng)
+        mutated = mutate_batch(children, self.mutation_rate, self.np_rng)
+        
+        new_knights = self.next_knights[survivors:]
+        for knight in new_knights:
+            knight.reset()
+        
+        # Children repeat their parent's walk up to the cut or first mutation
+        if self.prefix_cache:
+            knights = self.knights
+            first_parents = parents.reshape(-1)[:len(children)].tolist()
+            steps = np.minimum(shared, mutated).tolist()
+            for knight, parent, step in zip(new_knights, first_parents, steps):
+                knight.inherit(knights[parent], step)
+    
+    def evolve(self, max_generations=1000, goal=None, sinks=(), on_new_generation=None):
+        """
+        Run the evolution loop as a generator
+        
+        Every generation is checked and evaluated, passed to the sinks
+        (e.g. a StatsSink) and yielded before the next one is created.
+        Stops after the goal is reached or max_generations; the last
+        generation is always passed to the sinks with force=True.
+        
+        Args:
+            max_generations: Last generation to run
+            goal: Fitness that ends the run (default: a full tour)
+            sinks: Callables sink(population, best_fitness, best_knight,
+                   force=False)
+            on_new_generation: Optional callable f(population) run right
+                               after each new generation is created,
+                               before it is checked (e.g. to checkpoint
+                               it)
             
-            # Create new knights from children chromosomes
-            new_knights.append(Knight(child1_chromosome))
-            new_knights.append(Knight(child2_chromosome))
+        Yields:
+            Tuple (best_fitness, best_knight) of every generation
+        """
+        goal = goal if goal is not None else self.board.size
         
-        # Replace old population with new generation
-        self.knights = new_knights
-        self.generation += 1
+        while True:
+            self.check_population()
+            best_fitness, best_knight = self.evaluate()
+            
+            done = best_fitness >= goal or self.generation >= max_generations
+            for sink in sinks:
+                sink(self, best_fitness, best_knight, force=done)
+            
+            yield best_fitness, best_knight
+            
+            if done:
+                return
+            self.create_new_generation()
+            if on_new_generation is not None:
+                on_new_generation(self)
+    
+    def close(self):
+        """
+        Shut down the worker pool (if parallel evaluation is enabled) and
+        flush the profiler (records the last, unfinished generation)
+        """
+        if self.evaluator is not None:
+            self.evaluator.close()
+            self.evaluator = None
+        
+        self.profiler.end_generation(self.generation)
+        self.profiler.close()
     
     def get_statistics(self):
         """
@@ -103,13 +506,23 @@ class Population:
         Returns:
             Dictionary with min, max, average fitness
         """
-        fitnesses = [k.fitness for k in self.knights]
+        with self.profiler.phase('get_statistics', self.generation):
+            fitnesses = self.fitness
+            if fitnesses is None:
+                fitnesses = [k.fitness for k in self.knights]
+            elif self.batch:
+                # NumPy fitness vector
+                return {
+                    'min': int(fitnesses.min()),
+                    'max': int(fitnesses.max()),
+                    'avg': float(fitnesses.mean())
+                }
         
-        return {
-            'min': min(fitnesses),
-            'max': max(fitnesses),
-            'avg': sum(fitnesses) / len(fitnesses)
-        }
+            return {
+                'min': min(fitnesses),
+                'max': max(fitnesses),
+                'avg': sum(fitnesses) / len(fitnesses)
+            }
     
     def __str__(self):
         stats = self.get_statistics()
@@ -0,0 +1,137 @@
+import cProfile
+import json
+import pstats
+import sys
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+class Profiler:
+    """
+    Per-generation instrumentation for the evolution loop
+
+    Always on (cheap): wall/CPU time per phase, repair counters from the
+    walks and the net change in allocated memory blocks. The latter
+    (net_allocated_blocks) tracks memory growth, not allocation volume:
+    a generation that allocates and frees millions of short-lived
+    objects still reports about 0. On demand: every
+    `profile_every`-th generation runs under cProfile and tracemalloc;
+    the top functions and the memory the generation allocated (its
+    traced peak above the starting level, short-lived objects included)
+    are added to that generation's record.
+    """
+
+    def __init__(self, log_path=None, profile_every=0, keep=1000):
+        """
+        Args:
+            log_path: If set, every generation record is appended to this
+                      file as one JSON line
+            profile_every: Run cProfile on every N-th generation (0 = never)
+            keep: Number of recent records kept in memory (0 = none)
+        """
+        self.log_path = log_path
+        self.profile_every = profile_every
+        self.keep = keep
+        self.records = []
+
+        # Repair counters filled by the walks: [repairs, fallbacks tried]
+        self.walk_counts = [0, 0]
+        self.phases = {}
+        self.generation_open = False
+        self.blocks = 0
+        self.cprofile = None
+        self.traced = None  # (memory at the start, started tracing) when tracing
+        self.log_file = open(log_path, 'a') if log_path else None
+
+    def start_generation(self, generation):
+        """
+        Reset the counters (called automatically by the first phase)
+        """
+        self.generation_open = True
+        self.phases = {}
+        self.walk_counts[0] = self.walk_counts[1] = 0
+        self.blocks = sys.getallocatedblocks()
+
+        if self.profile_every and generation % self.profile_every == 0:
+            started = not tracemalloc.is_tracing()
+            if started:
+                tracemalloc.start()
+            tracemalloc.reset_peak()
+            self.traced = (tracemalloc.get_traced_memory()[0], started)
+
+            self.cprofile = cProfile.Profile()
+            self.cprofile.enable()
+
+    @contextmanager
+    def phase(self, name, generation):
+        """
+        Time a block as one phase of the given generation
+        """
+        if not self.generation_open:
+            self.start_generation(generation)
+
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            timing = self.phases.setdefault(name, [0.0, 0.0])
+            timing[0] += time.perf_counter() - wall
+            timing[1] += time.process_time() - cpu
+
+    def end_generation(self, generation):
+        """
+        Close the current generation's record (and log it)
+
+        Returns:
+            The record dictionary, or None if nothing was measured
+        """
+        if not self.generation_open:
+            return None
+        self.generation_open = False
+
+        record = {
+            'generation': generation,
+            'phases': {
+                name: {'wall_ms': wall * 1e3, 'cpu_ms': cpu * 1e3}
+                for name, (wall, cpu) in self.phases.items()
+            },
+            'repairs': self.walk_counts[0],
+            'fallbacks_tried': self.walk_counts[1],
+            'net_allocated_blocks': sys.getallocatedblocks() - self.blocks,
+        }
+
+        if self.cprofile is not None:
+            self.cprofile.disable()
+            stats = pstats.Stats(self.cprofile)
+            top = sorted(stats.stats.items(), key=lambda item: item[1][3], reverse=True)
+            record['profile'] = [
+                {'function': f"{path}:{line}({name})", 'calls': calls,
+                 'tottime_ms': tottime * 1e3, 'cumtime_ms': cumtime * 1e3}
+                for (path, line, name), (_, calls, tottime, cumtime, _) in top[:15]
+            ]
+            self.cprofile = None
+
+        if self.traced is not None:
+            # Objects allocated before tracing started are never seen, so
+            # only the peak (of this generation's allocations) is reliable
+            start, started = self.traced
+            record['traced_peak_kb'] = (tracemalloc.get_traced_memory()[1] - start) / 1024
+            if started:
+                tracemalloc.stop()
+            self.traced = None
+
+        self.records.append(record)
+        del self.records[:max(0, len(self.records) - self.keep)]
+
+        if self.log_file is not None:
+            self.log_file.write(json.dumps(record) + "\n")
+
+        return record
+
+    def close(self):
+        """Close the log file"""
+        if self.log_file is not None:
+            self.log_file.close()
+            self.log_file = None
@@ -0,0 +1,310 @@
+"""
+Headless rendering of tours to images
+
+Tours are drawn with the KnightTourVisualizer drawing code on an
+offscreen Surface (SDL dummy video driver, no window). Each tour gets a
+PNG of its final board, and optionally one PNG per step and/or an
+animated GIF (GIFs need Pillow). Many tours are spread over a process
+pool.
+
+Tours are JSON lines as written by `python main.py --format json`
+(only board, start and path are used):
+    python main.py --format json --seed 1 >> tours.jsonl
+
+Run from the repository root:
+    python -m src.render tours.jsonl --out renders --gif --workers 4
+"""
+import argparse
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+# Never open a window (must be set before pygame initializes its video)
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+
+
+def tour_knight(tour):
+    """
+    Knight to draw for a tour record
+
+    Args:
+        tour: Dictionary with 'board' [rows, cols], 'path' [[row, col],
+              ...] and optionally 'start' [row, col] (default: the first
+              square of the path)
+
+    Returns:
+        Knight on that board whose path is the tour's
+
+    Raises:
+        ValueError: If the record has no board or path, or a square is
+                    not on the board
+    """
+    from .board import Board
+    from .chromosome import Chromosome
+    from .knight import Knight
+
+    try:
+        rows, cols = tour['board']
+        path = [tuple(square) for square in tour['path']]
+        start = tuple(tour.get('start') or path[0])
+    except (KeyError, TypeError, ValueError, IndexError):
+        raise ValueError("A tour needs 'board' [rows, cols] and a non-empty 'path'")
+
+    if not (isinstance(rows, int) and isinstance(cols, int)):
+        raise ValueError(f"Invalid board size: {rows}x{cols}")
+    board = Board(rows, cols, start)
+    for square in path:
+        if not (len(square) == 2 and all(isinstance(value, int) for value in square)
+                and 0 <= square[0] < rows and 0 <= square[1] < cols):
+            raise ValueError(f"Square {list(square)} of the path is not on the "
+                             f"{rows}x{cols} board")
+
+    # The path is drawn as given: the (empty) genes are never walked
+    knight = Knight(Chromosome(bytes(board.gene_length)), board)
+    knight.path = path
+    knight.position = path[-1]
+    knight.fitness = len(path)
+    return knight
+
+
+def render_tour(tour, png_path, frames_dir=None, gif_path=None, every=1,
+                frame_ms=200, banner=False):
+    """
+    Render one tour offscreen
+
+    Args:
+        tour: Tour record (see tour_knight)
+        png_path: PNG file for the final board
+        frames_dir: If set, directory for one PNG per step
+                    (step_0001.png, ...)
+        gif_path: If set, animated GIF of the steps (needs Pillow)
+        every: Only draw every N-th step into the frames and the GIF (the
+               last step is always included)
+        frame_ms: Duration of every GIF frame
+        banner: Draw the completion banner on the last step
+
+    Returns:
+        Number of image files written
+    """
+    import pygame
+    from .visualizer import KnightTourVisualizer
+
+    visualizer = KnightTourVisualizer(tour_knight(tour), offscreen=True)
+    visualizer.banner_dismissed = not banner
+    screen = visualizer.screen
+    last = len(visualizer.knight.path) - 1
+
+    # Final board first (one step layer build)
+    for _ in range(last):
+        visualizer.next_step()
+    visualizer.draw_frame(advance=0)
+    pygame.image.save(screen, png_path)
+    written = 1
+    if frames_dir is None and gif_path is None:
+        return written
+
+    if gif_path is not None:
+        import numpy as np
+        from PIL import Image  # optional dependency, GIFs only
+
+        def snapshot():
+            return Image.frombytes('RGB', screen.get_size(),
+                                   pygame.image.tostring(screen, 'RGB'))
+
+        final = snapshot()
+        palette = previous = None
+        frames = []
+    if frames_dir is not None:
+        os.makedirs(frames_dir, exist_ok=True)
+
+    # Then step by step: every step redraws only the squares it touched
+    visualizer.restart()
+    for step in range(last + 1):
+        if step:
+            visualizer.next_step()
+        if step % every and step != last:
+            visualizer.update_step_layer()  # stay incremental between frames
+            continue
+
+        visualizer.draw_frame(advance=0)
+        if frames_dir is not None:
+            pygame.image.save(screen, os.path.join(frames_dir, f"step_{step + 1:04d}.png"))
+            written += 1
+        if gif_path is not None:
+            frame = snapshot()
+            if palette is None:
+                palette = shared_palette(frame, final)
+                transparent = len(palette.getpalette()) // 3
+                colors = palette.getpalette() + [0, 0, 0]
+            indices = np.asarray(frame.quantize(palette=palette, dither=0))
+
+            # Unchanged pixels are transparent: the previous frame shows
+            # through and the runs compress to almost nothing
+            delta = indices.copy()
+            if previous is not None:
+                delta[indices == previous] = transparent
+            previous = indices
+            image = Image.frombytes('P', frame.size, delta.tobytes())
+            image.putpalette(colors)
+            frames.append(image)
+
+    if gif_path is not None:
+        # Frames are already palettized and diffed: Pillow's optimize
+        # pass would only redo that, several times slower
+        frames[0].save(gif_path, save_all=True, append_images=frames[1:],
+                       duration=frame_ms, loop=0, transparency=transparent,
+                       disposal=1, optimize=False)
+        written += 1
+    return written
+
+
+def shared_palette(first, final):
+    """
+    One palette (up to 255 colors) for all frames of a GIF
+
+    The first and the final frame between them show every square color
+    (empty, visited, current) and the text, so mapping each frame onto
+    their palette is close to quantizing it on its own, at a fraction of
+    the cost.
+
+    Args:
+        first: PIL RGB image of the first frame
+        final: PIL RGB image of the final frame
+
+    Returns:
+        Palette ('P' mode) image for Image.quantize(palette=...)
+    """
+    from PIL import Image
+
+    # 255 colors at most: the next index is the GIFs' transparent one
+    both = Image.new('RGB', (first.width + final.width, max(first.height, final.height)))
+    both.paste(first, (0, 0))
+    both.paste(final, (first.width, 0))
+    return both.quantize(colors=255)
+
+
+def init_worker():
+    """Worker start-up: initialize pygame once, before the first tour"""
+    import pygame
+    pygame.init()
+
+
+def render_job(job):
+    """
+    Render one tour of a batch (runs inside a worker process)
+
+    Args:
+        job: Tuple (index, tour, out_dir, options for render_tour)
+
+    Returns:
+        Tuple (index, number of images written, error message or None)
+    """
+    import pygame
+
+    index, tour, out_dir, options = job
+    name = os.path.join(out_dir, f"tour_{index:05d}")
+    options = dict(options)
+    if options.pop('frames', False):
+        options['frames_dir'] = name
+    if options.pop('gif', False):
+        options['gif_path'] = name + '.gif'
+
+    # One bad tour is reported in the summary, it never stops the batch
+    try:
+        return index, render_tour(tour, name + '.png', **options), None
+    except (ValueError, OSError, ImportError, pygame.error) as error:
+        return index, 0, f"{type(error).__name__}: {error}"
+
+
+def render_tours(tours, out_dir, workers=None, frames=False, gif=False, every=1,
+                 frame_ms=200, banner=False):
+    """
+    Render many tours on a process pool
+
+    Tour i is written to out_dir/tour_<i>.png (and tour_<i>/ with its
+    step frames, tour_<i>.gif).
+
+    Args:
+        tours: List of tour records (see tour_knight)
+        out_dir: Output directory (created if needed)
+        workers: Number of worker processes (default: all CPUs)
+        frames: Also write one PNG per step
+        gif: Also write an animated GIF (needs Pillow)
+        every: Only draw every N-th step into the frames and GIFs
+        frame_ms: Duration of every GIF frame
+        banner: Draw the completion banner on the last step
+
+    Returns:
+        Dictionary with tours, images, errors ({index: message}),
+        seconds and tours_per_second
+    """
+    os.makedirs(out_dir, exist_ok=True)
+    workers = workers or os.cpu_count()
+    options = {'frames': frames, 'gif': gif, 'every': every, 'frame_ms': frame_ms,
+               'banner': banner}
+    jobs = [(index, tour, out_dir, options) for index, tour in enumerate(tours)]
+
+    start = time.perf_counter()
+    images = 0
+    errors = {}
+    with ProcessPoolExecutor(max_workers=workers, initializer=init_worker) as executor:
+        chunksize = max(1, len(jobs) // (workers * 8))
+        for index, written, error in executor.map(render_job, jobs, chunksize=chunksize):
+            images += written
+            if error is not None:
+                errors[index] = error
+    seconds = time.perf_counter() - start
+
+    return {
+        'tours': len(jobs) - len(errors),
+        'images': images,
+        'errors': errors,
+        'seconds': seconds,
+        'tours_per_second': (len(jobs) - len(errors)) / seconds if seconds else 0.0,
+    }
+
+
+def load_tours(path):
+    """
+    Returns:
+        List of tour records from a JSON lines file (blank lines skipped)
+    """
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render knight's tours to images (headless)")
+    parser.add_argument('tours', help="JSON lines file of tours (main.py --format json output)")
+    parser.add_argument('--out', default='renders', help="output directory")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: all CPUs)")
+    parser.add_argument('--frames', action='store_true', help="also write one PNG per step")
+    parser.add_argument('--gif', action='store_true',
+                        help="also write an animated GIF per tour (needs Pillow)")
+    parser.add_argument('--every', type=int, default=1,
+                        help="only draw every N-th step into frames and GIFs")
+    parser.add_argument('--frame-ms', type=int, default=200, help="GIF frame duration")
+    parser.add_argument('--banner', action='store_true',
+                        help="draw the completion banner on the last step")
+    args = parser.parse_args()
+
+    if args.gif:
+        try:
+            import PIL  # noqa: F401
+        except ImportError:
+            parser.error("--gif needs Pillow (pip install pillow)")
+
+    tours = load_tours(args.tours)
+    summary = render_tours(tours, args.out, args.workers, frames=args.frames, gif=args.gif,
+                           every=args.every, frame_ms=args.frame_ms, banner=args.banner)
+
+    for index, error in sorted(summary['errors'].items()):
+        print(f"Tour {index}: {error}")
+    print(f"Rendered {summary['tours']} tours ({summary['images']} images) to {args.out} "
+          f"in {summary['seconds']:.2f} s: {summary['tours_per_second']:.1f} tours/s")
+
+
+if __name__ == "__main__":
+    main()
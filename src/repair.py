@@ -0,0 +1,283 @@
+import random
+
+
+def build_neighbour_table(moves, rows=8, cols=8):
+    """
+    Precompute where every direction leads from every square
+
+    Squares are numbered row * cols + col.
+
+    Args:
+        moves: Dict direction (1-8) -> (row_change, col_change)
+        rows: Number of board rows
+        cols: Number of board columns
+
+    Returns:
+        List indexed by square. Each entry is a tuple of 9 targets
+        (index 0 unused) where -1 means the move leaves the board
+    """
+    table = []
+    for row in range(rows):
+        for col in range(cols):
+            targets = [-1] * 9
+            for direction, (dr, dc) in moves.items():
+                new_row, new_col = row + dr, col + dc
+                if 0 <= new_row < rows and 0 <= new_col < cols:
+                    targets[direction] = new_row * cols + new_col
+            table.append(tuple(targets))
+    return table
+
+
+def repair_moves(genes, neighbours, start=0, rng=random, squares=None, masks=None,
+                 counts=None):
+    """
+    Walk the genes from the start square, correcting invalid moves in place
+
+    Same algorithm as the original Knight.check_moves (including the
+    random forward/backward cycle choice), but visited squares are kept
+    as bits of one integer so every validity check is O(1).
+
+    Args:
+        genes: Mutable sequence of moves (1-8), repaired in place
+        neighbours: Table from build_neighbour_table
+        start: Starting square index
+        rng: Random source for the cycle direction
+        squares: Optional walk prefix to resume from (extended in place).
+                 The walk continues at gene len(squares) - 1
+        masks: Optional list of visited masks, one per square of the walk
+               (extended in place). Used to resume without rebuilding
+               the visited mask from squares
+        counts: Optional [repairs, fallbacks] list; adds the number of
+                invalid genes met and of alternative directions tried
+
+    Returns:
+        List of visited square indices, starting with start
+    """
+    if squares is None:
+        squares = [start]
+
+    if masks:
+        visited = masks[-1]
+    else:
+        visited = 0
+        for square in squares:
+            visited |= 1 << square
+        if masks is not None:
+            masks.append(visited)
+
+    record = masks.append if masks is not None else None
+    position = squares[-1]
+    repairs = fallbacks = 0
+
+    for i in range(len(squares) - 1, len(genes)):
+        move = genes[i]
+        targets = neighbours[position]
+        target = targets[move]
+
+        # Valid move: take it and continue
+        if target >= 0 and not visited & (1 << target):
+            squares.append(target)
+            visited |= 1 << target
+            position = target
+            if record:
+                record(visited)
+            continue
+
+        # Invalid: cycle through the other directions
+        cycle_forward = rng.choice([True, False])
+        repairs += 1
+
+        for attempt in range(8):
+            if cycle_forward:
+                move = (move % 8) + 1
+            else:
+                move = ((move - 2) % 8) + 1
+
+            target = targets[move]
+            if target >= 0 and not visited & (1 << target):
+                squares.append(target)
+                visited |= 1 << target
+                position = target
+                if record:
+                    record(visited)
+                genes[i] = move  # Update gene
+                break
+        else:
+            # No valid move found, stop here
+            fallbacks += 8
+            break
+        fallbacks += attempt + 1
+
+    if counts is not None:
+        counts[0] += repairs
+        counts[1] += fallbacks
+
+    return squares
+
+
+# Degree tables per neighbour table, keyed by id(neighbours)
+_degree_tables = {}
+
+
+def degree_tables(neighbours):
+    """
+    Onward-move tables for Warnsdorff's rule (built once per neighbour table)
+
+    Args:
+        neighbours: Table from build_neighbour_table
+
+    Returns:
+        Tuple (degrees, onward): bytearray with the number of on-board
+        moves from every square, and per square the tuple of squares
+        reachable from it
+    """
+    cached = _degree_tables.get(id(neighbours))
+    if cached is not None and cached[0] is neighbours:
+        return cached[1], cached[2]
+
+    onward = [tuple(target for target in targets[1:] if target >= 0)
+              for targets in neighbours]
+    degrees = bytearray(len(targets) for targets in onward)
+    _degree_tables[id(neighbours)] = (neighbours, degrees, onward)
+    return degrees, onward
+
+
+def repair_warnsdorff(genes, neighbours, start=0, rng=random, squares=None, masks=None,
+                      counts=None):
+    """
+    Walk the genes, repairing invalid moves with Warnsdorff's rule
+
+    Valid genes are followed as they are. When a gene is invalid, the
+    replacement is the valid move whose target has the fewest unvisited
+    onward squares (ties go to the first one cycling forward from the
+    gene). The degree of every square is kept up to date incrementally
+    as squares get visited. No random numbers are used, so the outcome
+    is a function of the genes alone.
+
+    Args:
+        Same as repair_moves (rng is accepted but unused)
+
+    Returns:
+        List of visited square indices, starting with start
+    """
+    base_degrees, onward = degree_tables(neighbours)
+    degrees = bytearray(base_degrees)
+
+    if squares is None:
+        squares = [start]
+
+    if masks:
+        visited = masks[-1]
+    else:
+        visited = 0
+        for square in squares:
+            visited |= 1 << square
+        if masks is not None:
+            masks.append(visited)
+
+    # Every visited square removes one onward move from its neighbours
+    for square in squares:
+        for target in onward[square]:
+            degrees[target] -= 1
+
+    record = masks.append if masks is not None else None
+    position = squares[-1]
+    repairs = 0
+
+    for i in range(len(squares) - 1, len(genes)):
+        move = genes[i]
+        targets = neighbours[position]
+        target = targets[move]
+
+        if not (target >= 0 and not visited & (1 << target)):
+            # Invalid: pick the valid move with the fewest onward moves
+            repairs += 1
+            best_move = 0
+            best_degree = 9
+            for _ in range(7):
+                move = (move % 8) + 1
+                candidate = targets[move]
+                if (candidate >= 0 and not visited & (1 << candidate)
+                        and degrees[candidate] < best_degree):
+                    best_move = move
+                    best_degree = degrees[candidate]
+
+            if not best_move:
+                # No valid move found, stop here
+                break
+
+            genes[i] = best_move  # Update gene
+            target = targets[best_move]
+
+        squares.append(target)
+        visited |= 1 << target
+        position = target
+        for neighbour in onward[target]:
+            degrees[neighbour] -= 1
+        if record:
+            record(visited)
+
+    # Every repair looks at all 7 other directions
+    if counts is not None:
+        counts[0] += repairs
+        counts[1] += 7 * repairs
+
+    return squares
+
+
+def warnsdorff_genes(neighbours, start=0, length=63, rng=random):
+    """
+    Build genes that follow a Warnsdorff tour from the start square
+
+    At every step the move to the unvisited square with the fewest
+    onward moves is taken (random tie-break). If the heuristic gets
+    stuck, the remaining genes are random.
+
+    Args:
+        neighbours: Table from build_neighbour_table
+        start: Starting square index
+        length: Number of genes
+        rng: Random source for tie-breaks and filler genes
+
+    Returns:
+        List of length moves (1-8)
+    """
+    degrees, onward = degree_tables(neighbours)
+    degrees = bytearray(degrees)
+    for target in onward[start]:
+        degrees[target] -= 1
+
+    genes = []
+    visited = 1 << start
+    position = start
+
+    while len(genes) < length:
+        targets = neighbours[position]
+        options = [(degrees[target], move) for move, target in enumerate(targets)
+                   if move and target >= 0 and not visited & (1 << target)]
+        if not options:
+            break
+
+        fewest = min(options)[0]
+        move = rng.choice([move for degree, move in options if degree == fewest])
+        genes.append(move)
+
+        position = targets[move]
+        visited |= 1 << position
+        for target in onward[position]:
+            degrees[target] -= 1
+
+    genes.extend(rng.randint(1, 8) for _ in range(length - len(genes)))
+    return genes
+
+
+# Strategies whose outcome is a function of the genes alone (no random
+# numbers drawn), so the outcome for any input genes can be cached
+DETERMINISTIC_REPAIRS = {'warnsdorff'}
+
+
+# Pluggable repair strategies (same signature)
+REPAIR_STRATEGIES = {
+    'cycle': repair_moves,
+    'warnsdorff': repair_warnsdorff,
+}
@@ -0,0 +1,29 @@
+"""
+Random streams for reproducible runs
+
+Every Population draws from its own random.Random (and a NumPy
+Generator seeded from it), so runs never depend on the global random
+module's state. Processes that each run their own population (islands,
+service jobs, success-rate runs) get independent seeds spawned from one
+base seed.
+"""
+import numpy as np
+
+
+def spawn_seeds(seed, count):
+    """
+    Independent child seeds for `count` streams
+
+    Uses NumPy's SeedSequence spawning, so the children are statistically
+    independent (unlike seed, seed + 1, ...) and the same base seed
+    always gives the same children.
+
+    Args:
+        seed: Base seed (int), or None to draw one from OS entropy
+        count: Number of child seeds
+
+    Returns:
+        List of 64-bit int seeds
+    """
+    children = np.random.SeedSequence(seed).spawn(count)
+    return [int(child.generate_state(1, np.uint64)[0]) for child in children]
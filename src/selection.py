@@ -0,0 +1,90 @@
+"""
+Vectorized parent selection for whole generations
+
+Every strategy takes the population's fitness array and draws the
+parents of all pairs in one batched NumPy operation, instead of one
+Python-level sample and sort per pair.
+"""
+import numpy as np
+
+
+def tournament(fitness, pairs, rng, size=3):
+    """
+    Tournament selection for all pairs at once
+
+    Each row samples `size` distinct knights (like random.sample); the
+    two fittest of the row are the parents (ties keep sample order).
+
+    Args:
+        fitness: (N,) fitness array
+        pairs: Number of parent pairs to draw
+        rng: numpy Generator
+        size: Knights per tournament (at least 2)
+
+    Returns:
+        (pairs, 2) array of parent indices
+    """
+    count = len(fitness)
+    if not 2 <= size <= count:
+        raise ValueError(f"Invalid tournament size {size} for {count} knights")
+
+    sample = rng.integers(0, count, size=(pairs, size))
+
+    # Redraw the (rare, for large populations) rows that hit a knight twice
+    while True:
+        ordered = np.sort(sample, axis=1)
+        repeated = (ordered[:, 1:] == ordered[:, :-1]).any(axis=1)
+        redraw = np.count_nonzero(repeated)
+        if not redraw:
+            break
+        sample[repeated] = rng.integers(0, count, size=(redraw, size))
+
+    order = np.argsort(-fitness[sample], axis=1, kind='stable')
+    return np.take_along_axis(sample, order[:, :2], axis=1)
+
+
+def rank(fitness, pairs, rng, size=3):
+    """
+    Linear rank selection: the chance of being picked is proportional to
+    the rank by fitness (worst = 1, best = N), so it does not depend on
+    how far apart the fitness values are
+
+    Args:
+        Same as tournament (size is accepted but unused)
+
+    Returns:
+        (pairs, 2) array of parent indices
+    """
+    order = np.argsort(fitness, kind='stable')
+    cumulative = np.cumsum(np.arange(1, len(fitness) + 1, dtype=np.float64))
+    draws = rng.random(2 * pairs) * cumulative[-1]
+    picked = np.searchsorted(cumulative, draws, side='right')
+    return order[np.minimum(picked, len(fitness) - 1)].reshape(pairs, 2)
+
+
+def sus(fitness, pairs, rng, size=3):
+    """
+    Stochastic universal sampling: fitness-proportional selection with
+    evenly spaced pointers from a single random offset (minimal spread),
+    then shuffled into pairs
+
+    Args:
+        Same as tournament (size is accepted but unused)
+
+    Returns:
+        (pairs, 2) array of parent indices
+    """
+    cumulative = np.cumsum(fitness, dtype=np.float64)
+    step = cumulative[-1] / (2 * pairs)
+    pointers = (rng.random() + np.arange(2 * pairs)) * step
+    picked = np.searchsorted(cumulative, pointers, side='right')
+    picked = np.minimum(picked, len(fitness) - 1)
+    return rng.permutation(picked).reshape(pairs, 2)
+
+
+# Pluggable selection strategies (same signature)
+SELECTION_STRATEGIES = {
+    'tournament': tournament,
+    'rank': rank,
+    'sus': sus,
+}
@@ -0,0 +1,447 @@
+"""
+Long-lived tour-solving service on a warm pool of GA worker processes
+
+Clients connect over a Unix socket (or localhost TCP) and exchange
+newline-delimited JSON. Every request is answered as soon as its job
+finishes, so many solves can be in flight on one connection.
+
+Requests:
+    {"op": "solve", "id": "a", "rows": 8, "cols": 8, "start": [0, 0],
+     "timeout": 30, "population_size": 50, "max_generations": 5000,
+     "seed": 1, "repair": "cycle", "mutation_rate": 0.01}
+        (everything except "op" is optional)
+    {"op": "cancel", "id": "a"}
+    {"op": "status"}
+
+Responses:
+    {"id": "a", "status": "queued"}
+    {"id": "a", "status": "solved" | "unsolved" | "timeout" | "cancelled",
+     "fitness": 64, "goal": 64, "generation": 123, "elapsed_s": 0.9,
+     "path": [[0, 0], [2, 1], ...]}
+    {"id": "a", "status": "error", "error": "..."}
+
+Run from the repository root:
+    python -m src.service --socket /tmp/knights.sock --workers 4
+"""
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from .repair import REPAIR_STRATEGIES
+
+# Options a solve request may set, with their defaults
+SOLVE_DEFAULTS = {
+    'rows': 8,
+    'cols': 8,
+    'start': (0, 0),
+    'population_size': 50,
+    'max_generations': 5000,
+    'timeout': None,
+    'seed': None,
+    'repair': 'cycle',
+    'mutation_rate': 0.01,
+}
+
+# Cancellation flags shared with the workers, one per job slot
+_cancel_flags = None
+
+
+def init_worker(flags):
+    """
+    Worker start-up: keep the shared cancellation flags and pay the
+    import cost once, before the first job arrives
+    """
+    global _cancel_flags
+    _cancel_flags = flags
+
+    from .population import Population  # noqa: F401 (warm import)
+
+
+def solve_job(slot, options, deadline):
+    """
+    Evolve one population until a full tour, the generation limit, the
+    deadline or a cancellation (runs inside a worker process)
+
+    Args:
+        slot: Index of this job's cancellation flag
+        options: Solve options (see SOLVE_DEFAULTS)
+        deadline: time.time() after which the job gives up, or None
+
+    Returns:
+        Result dictionary (status, fitness, goal, generation, elapsed_s,
+        path)
+    """
+    from .board import Board
+    from .population import Population
+    from .rng import spawn_seeds
+
+    start = time.perf_counter()
+
+    # Unseeded jobs get a fresh seed: forked workers share the global
+    # random state, so they would otherwise repeat each other's runs
+    seed = options['seed']
+    if seed is None:
+        seed = spawn_seeds(None, 1)[0]
+
+    board = Board(options['rows'], options['cols'], tuple(options['start']))
+    with contextlib.redirect_stdout(io.StringIO()):
+        population = Population(options['population_size'], board=board,
+                                repair=options['repair'],
+                                mutation_rate=options['mutation_rate'], seed=seed)
+
+    status = 'unsolved'
+    while True:
+        population.check_population()
+        best_fitness, best_knight = population.evaluate()
+
+        if best_fitness == board.size:
+            status = 'solved'
+            break
+        if population.generation >= options['max_generations']:
+            break
+        if _cancel_flags is not None and _cancel_flags[slot]:
+            status = 'cancelled'
+            break
+        if deadline is not None and time.time() >= deadline:
+            status = 'timeout'
+            break
+
+        population.create_new_generation()
+
+    return {
+        'status': status,
+        'fitness': best_fitness,
+        'goal': board.size,
+        'generation': population.generation,
+        'elapsed_s': time.perf_counter() - start,
+        'path': [list(square) for square in best_knight.path],
+    }
+
+
+def is_number(value):
+    """True for ints and floats (JSON numbers), but not booleans"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_integer(value):
+    """True for ints, but not booleans"""
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def is_job_id(job_id):
+    """True for ids a job can be keyed by: a JSON string or number, or None"""
+    return job_id is None or isinstance(job_id, str) or is_number(job_id)
+
+
+def parse_solve(request):
+    """
+    Validate a solve request
+
+    Returns:
+        Options dictionary (SOLVE_DEFAULTS filled in)
+
+    Raises:
+        ValueError: If the id or an option is unknown or invalid
+    """
+    if not is_job_id(request.get('id')):
+        raise ValueError("id must be a string or a number")
+    unknown = set(request) - set(SOLVE_DEFAULTS) - {'op', 'id'}
+    if unknown:
+        raise ValueError(f"Unknown options: {', '.join(sorted(unknown))}")
+
+    options = dict(SOLVE_DEFAULTS)
+    options.update((key, value) for key, value in request.items() if key in SOLVE_DEFAULTS)
+
+    rows, cols = options['rows'], options['cols']
+    if not (is_integer(rows) and is_integer(cols) and rows > 0 and cols > 0):
+        raise ValueError(f"Invalid board size: {rows}x{cols}")
+    if rows * cols < 3:
+        raise ValueError(f"A {rows}x{cols} board is too small (at least 3 squares are needed)")
+    start = options['start']
+    if not (isinstance(start, (list, tuple)) and len(start) == 2
+            and all(is_integer(value) for value in start)):
+        raise ValueError(f"Invalid start square: {start}")
+    row, col = start
+    if not (0 <= row < rows and 0 <= col < cols):
+        raise ValueError(f"Start square {start} is outside the board")
+    # Tournament selection samples 3 knights
+    if not (is_integer(options['population_size']) and options['population_size'] >= 3):
+        raise ValueError("population_size must be an integer of at least 3")
+    if not (is_integer(options['max_generations']) and options['max_generations'] > 0):
+        raise ValueError("max_generations must be a positive integer")
+    timeout = options['timeout']
+    if timeout is not None and not (is_number(timeout) and timeout > 0):
+        raise ValueError("timeout must be a positive number of seconds")
+    if not (is_number(options['mutation_rate']) and 0 <= options['mutation_rate'] <= 1):
+        raise ValueError("mutation_rate must be a number between 0 and 1")
+    if options['seed'] is not None and not is_integer(options['seed']):
+        raise ValueError("seed must be an integer")
+    if not (isinstance(options['repair'], str) and options['repair'] in REPAIR_STRATEGIES):
+        raise ValueError(f"repair must be one of: {', '.join(sorted(REPAIR_STRATEGIES))}")
+    return options
+
+
+class SolveService:
+    """
+    asyncio front end that queues solve jobs onto a warm process pool
+
+    Running jobs are cancelled through a shared flag array (one slot per
+    job in flight) that workers check every generation; queued jobs are
+    simply dropped from the pool's queue.
+    """
+
+    def __init__(self, workers=None, max_jobs=1024):
+        """
+        Start the worker pool
+
+        Args:
+            workers: Number of worker processes (default: all CPUs)
+            max_jobs: Maximum number of queued and running jobs
+        """
+        self.workers = workers or os.cpu_count()
+        self.flags = multiprocessing.Array('b', max_jobs, lock=False)
+        self.free_slots = list(range(max_jobs - 1, -1, -1))
+        self.executor = ProcessPoolExecutor(max_workers=self.workers,
+                                            initializer=init_worker,
+                                            initargs=(self.flags,))
+        self.jobs = {}  # (connection, id) -> (slot, concurrent future)
+        self.next_id = 0
+        self.completed = 0
+
+        # Start every worker now so the first requests don't pay for it
+        for future in [self.executor.submit(os.getpid) for _ in range(self.workers)]:
+            future.result()
+
+    async def handle_connection(self, reader, writer):
+        """
+        Serve one client: read requests, write responses as jobs finish
+        """
+        connection = object()
+        lock = asyncio.Lock()
+
+        async def send(message):
+            async with lock:
+                writer.write(json.dumps(message).encode() + b"\n")
+                await writer.drain()
+
+        tasks = set()
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                try:
+                    request = json.loads(line)
+                    op = request.get('op')
+                except (ValueError, AttributeError):
+                    await send({'status': 'error', 'error': "Invalid JSON request"})
+                    continue
+
+                if op == 'solve':
+                    task = asyncio.ensure_future(self.solve(connection, request, send))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                elif op == 'cancel':
+                    found = (is_job_id(request.get('id'))
+                             and self.cancel(connection, request.get('id')))
+                    if not found:
+                        await send({'id': request.get('id'), 'status': 'error',
+                                    'error': "No such job"})
+                elif op == 'status':
+                    await send(self.status())
+                else:
+                    await send({'status': 'error', 'error': f"Unknown op: {op}"})
+        except ConnectionError:
+            pass
+        finally:
+            # A client that goes away takes its jobs with it
+            for key in [key for key in self.jobs if key[0] is connection]:
+                self.cancel(connection, key[1])
+            for task in list(tasks):
+                with contextlib.suppress(asyncio.CancelledError, ConnectionError):
+                    await task
+            writer.close()
+
+    async def solve(self, connection, request, send):
+        """
+        Queue one solve job and send its result when it finishes
+        """
+        try:
+            options = parse_solve(request)
+        except ValueError as error:
+            job_id = request.get('id')
+            await send({'id': job_id if is_job_id(job_id) else None, 'status': 'error',
+                        'error': str(error)})
+            return
+
+        job_id = request.get('id')
+        if job_id is None:
+            job_id = self.next_id = self.next_id + 1
+        key = (connection, job_id)
+        if key in self.jobs:
+            await send({'id': job_id, 'status': 'error', 'error': "Duplicate job id"})
+            return
+        if not self.free_slots:
+            await send({'id': job_id, 'status': 'error', 'error': "Too many jobs"})
+            return
+
+        timeout = options['timeout']
+        deadline = time.time() + timeout if timeout is not None else None
+
+        # Nothing may fail between taking a slot and the finally below
+        # that gives it back, except the submission itself
+        slot = self.free_slots.pop()
+        self.flags[slot] = 0
+        try:
+            future = self.executor.submit(solve_job, slot, options, deadline)
+        except RuntimeError as error:  # pool broken or shut down
+            self.free_slots.append(slot)
+            await send({'id': job_id, 'status': 'error', 'error': str(error)})
+            return
+        self.jobs[key] = (slot, future)
+
+        # Jobs still waiting in the queue at their deadline are dropped
+        # there; running jobs notice the deadline themselves
+        loop = asyncio.get_running_loop()
+        timer = None
+        if timeout is not None:
+            timer = loop.call_later(timeout, future.cancel)
+
+        try:
+            await send({'id': job_id, 'status': 'queued'})
+            result = await asyncio.wrap_future(future)
+        except asyncio.CancelledError:
+            if not future.cancelled():
+                raise
+            # Dropped from the queue by cancel() or by the timeout timer
+            result = {'status': 'cancelled' if self.flags[slot] else 'timeout'}
+        except Exception as error:  # worker crashed or job raised
+            result = {'status': 'error', 'error': repr(error)}
+        finally:
+            if timer is not None:
+                timer.cancel()
+            if not future.done():  # client gone: nobody wants the result
+                self.flags[slot] = 1
+                future.cancel()
+            del self.jobs[key]
+            self.free_slots.append(slot)
+            self.completed += 1
+
+        result['id'] = job_id
+        await send(result)
+
+    def cancel(self, connection, job_id):
+        """
+        Cancel a queued or running job
+
+        Returns:
+            True if the job exists
+        """
+        job = self.jobs.get((connection, job_id))
+        if job is None:
+            return False
+
+        slot, future = job
+        self.flags[slot] = 1
+        future.cancel()  # no-op once running: the worker sees the flag
+        return True
+
+    def status(self):
+        """
+        Returns:
+            Dictionary with the number of workers and queued/running and
+            completed jobs
+        """
+        return {'status': 'ok', 'workers': self.workers,
+                'jobs': len(self.jobs), 'completed': self.completed}
+
+    async def serve(self, address):
+        """
+        Serve forever on a Unix socket path or a 'host:port' address
+        """
+        host, _, port = address.rpartition(':')
+        if port.isdigit():
+            server = await asyncio.start_server(self.handle_connection, host or '127.0.0.1',
+                                                int(port))
+        else:
+            with contextlib.suppress(FileNotFoundError):
+                os.unlink(address)
+            server = await asyncio.start_unix_server(self.handle_connection, address)
+
+        async with server:
+            await server.serve_forever()
+
+    def close(self):
+        """Cancel all jobs and shut down the worker pool"""
+        for slot, future in self.jobs.values():
+            self.flags[slot] = 1
+            future.cancel()
+        self.executor.shutdown()
+
+
+async def request_tours(address, requests):
+    """
+    Minimal client: send requests and collect the final responses
+
+    Args:
+        address: Unix socket path or 'host:port'
+        requests: List of request dictionaries (solve requests need
+                  distinct ids)
+
+    Returns:
+        Dictionary id -> final response (in completion order)
+    """
+    host, _, port = address.rpartition(':')
+    if port.isdigit():
+        reader, writer = await asyncio.open_connection(host or '127.0.0.1', int(port))
+    else:
+        reader, writer = await asyncio.open_unix_connection(address)
+
+    for request in requests:
+        writer.write(json.dumps(request).encode() + b"\n")
+    await writer.drain()
+
+    pending = {request.get('id') for request in requests if request.get('op') == 'solve'}
+    results = {}
+    while pending:
+        line = await reader.readline()
+        if not line:
+            break
+        response = json.loads(line)
+        if response.get('status') == 'queued':
+            continue
+        results[response.get('id')] = response
+        pending.discard(response.get('id'))
+
+    writer.close()
+    await writer.wait_closed()
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Knight's tour solving service")
+    parser.add_argument('--socket', default='/tmp/knights-tour.sock',
+                        help="Unix socket path, or host:port for TCP")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="worker processes (default: all CPUs)")
+    parser.add_argument('--max-jobs', type=int, default=1024,
+                        help="maximum number of queued and running jobs")
+    args = parser.parse_args()
+
+    service = SolveService(args.workers, args.max_jobs)
+    print(f"Serving on {args.socket} with {service.workers} workers")
+    try:
+        asyncio.run(service.serve(args.socket))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        service.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,163 @@
+import json
+import os
+import time
+import numpy as np
+
+
+class StatsSink:
+    """
+    Streaming per-generation statistics for long runs
+
+    Called once per generation (after evaluate), it records every
+    `every`-th generation: fitness summary and histogram, per-locus gene
+    entropy, the best path and timing. Records are buffered and written
+    as JSON lines to a file that is rotated when it grows too large
+    (path, path.1, path.2, ... like logging's RotatingFileHandler).
+    """
+
+    def __init__(self, path, every=1, buffer=100, max_bytes=64 * 1024 * 1024,
+                 backups=3, entropy=True, best_path=True):
+        """
+        Args:
+            path: JSONL file to write the records to
+            every: Record every N-th generation (sampling)
+            buffer: Number of records kept in memory between writes
+            max_bytes: Rotate the file once it grows beyond this size
+                       (0 = never)
+            backups: Number of rotated files kept
+            entropy: Include the per-locus gene entropy
+            best_path: Include the best knight's path (square indices)
+        """
+        self.path = path
+        self.every = every
+        self.buffer = buffer
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self.entropy = entropy
+        self.best_path = best_path
+
+        self.pending = []
+        self.start = time.perf_counter()
+        self.last_time = self.start
+        self.last_generation = None
+        self.file = open(path, 'a')
+
+    def __call__(self, population, best_fitness, best_knight, force=False):
+        """
+        Record the current generation if it is sampled
+
+        Args:
+            population: Evaluated Population
+            best_fitness: Best fitness of the generation
+            best_knight: Knight with that fitness
+            force: Record even if the generation is not sampled (e.g.
+                   the last one of a run)
+        """
+        if not force and population.generation % self.every:
+            return
+
+        self.pending.append(json.dumps(self.record(population, best_fitness, best_knight)))
+        if len(self.pending) >= self.buffer:
+            self.flush()
+
+    def record(self, population, best_fitness, best_knight):
+        """
+        Build the record of the current generation
+
+        Returns:
+            Dictionary (JSON-serializable)
+        """
+        now = time.perf_counter()
+        generation = population.generation
+        elapsed = generation - self.last_generation if self.last_generation else 1
+        seconds_per_generation = (now - self.last_time) / max(elapsed, 1)
+        self.last_time = now
+        self.last_generation = generation
+
+        fitness = population.fitness
+        if fitness is None:
+            fitness = [k.fitness for k in population.knights]
+        fitness = np.asarray(fitness)
+        counts = np.bincount(fitness)
+        present = np.flatnonzero(counts)
+
+        record = {
+            'generation': generation,
+            'elapsed_s': now - self.start,
+            'seconds_per_generation': seconds_per_generation,
+            'phases_ms': {name: wall * 1e3
+                          for name, (wall, _) in population.profiler.phases.items()},
+            'best': int(best_fitness),
+            'avg': float(fitness.mean()),
+            'min': int(fitness.min()),
+            # Sparse histogram: [fitness, number of knights] pairs
+            'histogram': np.column_stack((present, counts[present])).tolist(),
+        }
+
+        if self.entropy:
+            locus_entropy = gene_entropy(population)
+            record['entropy'] = np.round(locus_entropy, 4).tolist()
+            record['mean_entropy'] = float(locus_entropy.mean())
+
+        if self.best_path:
+            cols = population.board.cols
+            record['best_path'] = [row * cols + col for row, col in best_knight.path]
+
+        return record
+
+    def flush(self):
+        """Write the buffered records (rotating the file if needed)"""
+        if not self.pending:
+            return
+
+        data = "\n".join(self.pending) + "\n"
+        self.pending = []
+        self.file.write(data)
+        self.file.flush()
+
+        if self.max_bytes and self.file.tell() >= self.max_bytes:
+            self.rotate()
+
+    def rotate(self):
+        """Shift path -> path.1 -> path.2 ... and start a new file"""
+        self.file.close()
+        if self.backups:
+            for index in range(self.backups - 1, 0, -1):
+                source = f"{self.path}.{index}"
+                if os.path.exists(source):
+                    os.replace(source, f"{self.path}.{index + 1}")
+            os.replace(self.path, f"{self.path}.1")
+        else:
+            os.remove(self.path)
+        self.file = open(self.path, 'a')
+
+    def close(self):
+        """Flush the buffer and close the file"""
+        if self.file is not None:
+            self.flush()
+            self.file.close()
+            self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def gene_entropy(population):
+    """
+    Diversity of the population's genes per locus
+
+    Returns:
+        (L,) array with the Shannon entropy (bits, 0 to 3) of the moves
+        at every gene position
+    """
+    genes = np.frombuffer(population.genes, dtype=np.uint8).reshape(
+        population.population_size, population.length
+    )
+    counts = np.stack([np.count_nonzero(genes == move, axis=0) for move in range(1, 9)])
+    shares = counts / population.population_size
+    with np.errstate(divide='ignore', invalid='ignore'):
+        terms = np.where(shares > 0, shares * np.log2(shares), 0.0)
+    return np.abs(terms.sum(axis=0))
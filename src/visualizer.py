@@ -2,13 +2,72 @@ import pygame
 import sys
 import time
 import math
+from .console import print_board  # text board (kept importable from here)
+
+class AssetCache:
+    """
+    Fonts and pre-rendered Surfaces reused across frames
+
+    Every asset is built by a callback on its first use and kept until
+    clear() (e.g. after a window resize), so drawing a frame in steady
+    state allocates nothing.
+    """
+
+    def __init__(self):
+        self.assets = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key, build):
+        """
+        Args:
+            key: Hashable name of the asset
+            build: Callable creating the asset on a miss
+
+        Returns:
+            The cached (or newly built) asset
+        """
+        asset = self.assets.get(key)
+        if asset is None:
+            self.misses += 1
+            asset = self.assets[key] = build()
+        else:
+            self.hits += 1
+        return asset
+
+    def clear(self):
+        """Drop every asset (the counters are kept)"""
+        self.assets.clear()
+
+    def stats(self):
+        """
+        Returns:
+            Dictionary with hits, misses, hit_rate and entries
+        """
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'entries': len(self.assets),
+        }
+
+    def __len__(self):
+        return len(self.assets)
+
 
 class KnightTourVisualizer:
     """
     Beautiful animated visualizer for Knight's Tour solution
     """
     
-    def __init__(self, knight):
+    def __init__(self, knight, offscreen=False):
+        """
+        Args:
+            knight: Knight whose path is shown
+            offscreen: Draw on a plain Surface (self.screen) instead of
+                       opening a window, e.g. to save images
+        """
         pygame.init()
     
         try:
@@ -21,27 +80,41 @@ class KnightTourVisualizer:
             self.has_knight_image = False
 
     # Window settings - OPTIMIZED FOR YOUR SCREEN
-        self.CELL_SIZE = 70  # Smaller cells to fit screen
+        self.CELL_SIZE = 70  # Smaller cells to fit screen (for 8x8)
         self.MARGIN = 20
         self.INFO_HEIGHT = 110  # Reduced height
         self.TITLE_HEIGHT = 50
         self.BOARD_SPACING = 15
     
+    # Board dimensions (cells shrink so big boards still fit)
+        self.board = knight.board
+        self.BOARD_ROWS = self.board.rows
+        self.BOARD_COLS = self.board.cols
+        self.CELL_SIZE = max(12, min(self.CELL_SIZE, 560 // max(self.BOARD_ROWS, self.BOARD_COLS)))
+        self.PIECE_SCALE = self.CELL_SIZE / 70  # knight sprite/glow scale
+        if self.has_knight_image and self.PIECE_SCALE < 1:
+            size = max(8, int(42 * self.PIECE_SCALE))
+            self.knight_image = pygame.transform.scale(self.knight_image, (size, size))
+    
     # Calculate window size
-        self.BOARD_SIZE = 8
-        self.WINDOW_WIDTH = self.BOARD_SIZE * self.CELL_SIZE + 2 * self.MARGIN
-        self.WINDOW_HEIGHT = (self.BOARD_SIZE * self.CELL_SIZE + 
+        self.WINDOW_WIDTH = max(self.BOARD_COLS * self.CELL_SIZE + 2 * self.MARGIN, 560)
+        # Left edge of the board: centered when the minimum width is wider
+        self.BOARD_X = (self.WINDOW_WIDTH - self.BOARD_COLS * self.CELL_SIZE) // 2
+        self.WINDOW_HEIGHT = (self.BOARD_ROWS * self.CELL_SIZE + 
                              2 * self.MARGIN + 
                              self.INFO_HEIGHT + 
                              self.TITLE_HEIGHT + 
                              self.BOARD_SPACING)  # Removed extra spacing
     
     # Create window - MAKE IT RESIZABLE so you can adjust!
-        self.screen = pygame.display.set_mode(
-            (self.WINDOW_WIDTH, self.WINDOW_HEIGHT),
-            pygame.RESIZABLE  # ← IMPORTANT! Now you can resize!
-        )
-        pygame.display.set_caption(" Knight's Tour Puzzle")
+        if offscreen:
+            self.screen = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT))
+        else:
+            self.screen = pygame.display.set_mode(
+                (self.WINDOW_WIDTH, self.WINDOW_HEIGHT),
+                pygame.RESIZABLE  # ← IMPORTANT! Now you can resize!
+            )
+            pygame.display.set_caption(" Knight's Tour Puzzle")
     
     # Beautiful color palette 🎨
         self.BACKGROUND = (25, 28, 48)
@@ -67,17 +140,28 @@ class KnightTourVisualizer:
         self.TEXT_SHADOW = (15, 15, 25)
         self.PROGRESS_BAR = (40, 70, 100)
         self.GRID_COLOR = (100, 80, 60)
+        self.BOARD_BACKGROUND = (50, 40, 30)
     
     # Fonts - smaller to fit
         self.font_title = pygame.font.Font(None, 42)
         self.font_info = pygame.font.Font(None, 22)
-        self.font_number = pygame.font.Font(None, 28)
+        self.font_number = pygame.font.Font(None, max(10, self.CELL_SIZE * 2 // 5))
         self.font_instructions = pygame.font.Font(None, 18)
     
     # Knight data
         self.knight = knight
         self.current_step = 0
-        self.visited_squares = {(0, 0)}
+        self.visited_squares = {self.board.start}
+    
+    # Step index of every square on the path (-1 = not on the path), so
+    # move numbers are looked up instead of searched for in the path
+        self.step_grid = [[-1] * self.BOARD_COLS for _ in range(self.BOARD_ROWS)]
+        for step, (row, col) in enumerate(knight.path):
+            if self.step_grid[row][col] < 0:
+                self.step_grid[row][col] = step
+    
+    # Fonts and pre-rendered surfaces (move numbers, glow rings, banner)
+        self.assets = AssetCache()
     
     # Animation
         self.animating = False
@@ -87,6 +171,12 @@ class KnightTourVisualizer:
     # Visual effects
         self.glow_pulse = 0
         self.knight_bounce = 0
+    
+    # Cached layers: the static one (background, title bar, empty board)
+    # and the current step's board and info panel drawn over a copy of it
+        self.static_layer = None
+        self.step_layer = None
+        self.step_layer_key = None
         
     def draw_gradient_rect(self, surface, color1, color2, rect):
         """Draw a smooth vertical gradient"""
@@ -99,19 +189,21 @@ class KnightTourVisualizer:
                            (rect.x, rect.y + i), 
                            (rect.x + rect.width, rect.y + i))
     
-    def draw_text_with_shadow(self, text, font, color, x, y, shadow=True):
+    def draw_text_with_shadow(self, text, font, color, x, y, shadow=True, surface=None):
         """Draw text with shadow for depth"""
+        surface = surface if surface is not None else self.screen
         if shadow:
             shadow_surf = font.render(text, True, self.TEXT_SHADOW)
-            self.screen.blit(shadow_surf, (x + 2, y + 2))
+            surface.blit(shadow_surf, (x + 2, y + 2))
         text_surf = font.render(text, True, color)
-        self.screen.blit(text_surf, (x, y))
+        surface.blit(text_surf, (x, y))
         return text_surf.get_rect(topleft=(x, y))
     
-    def draw_title_bar(self):
+    def draw_title_bar(self, surface=None):
         """Draw beautiful title bar with gradient"""
+        surface = surface if surface is not None else self.screen
         title_rect = pygame.Rect(0, 0, self.WINDOW_WIDTH, self.TITLE_HEIGHT)
-        self.draw_gradient_rect(self.screen, 
+        self.draw_gradient_rect(surface, 
                                self.TITLE_GRADIENT_TOP, 
                                self.TITLE_GRADIENT_BOTTOM, 
                                title_rect)
@@ -121,101 +213,291 @@ class KnightTourVisualizer:
         title_surface = self.font_title.render(title_text, True, self.TEXT_COLOR)
         title_x = (self.WINDOW_WIDTH - title_surface.get_width()) // 2
         self.draw_text_with_shadow(title_text, self.font_title, 
-                                  self.TEXT_COLOR, title_x, 12)
+                                  self.TEXT_COLOR, title_x, 12, surface=surface)
     
-    def draw_board(self):
+    def draw_board(self, surface=None):
         """Draw the beautiful chessboard"""
-        board_x = self.MARGIN
-        board_y = self.MARGIN + self.TITLE_HEIGHT + self.BOARD_SPACING
+        surface = surface if surface is not None else self.screen
         
         # Board background with rounded corners
-        board_rect = pygame.Rect(
+        pygame.draw.rect(surface, self.BOARD_BACKGROUND, self.board_rect(), border_radius=15)
+        
+        # Draw squares
+        for row in range(self.BOARD_ROWS):
+            for col in range(self.BOARD_COLS):
+                self.draw_square(surface, (row, col))
+        
+        self.draw_grid(surface)
+    
+    def board_rect(self):
+        """Rectangle of the board including its frame"""
+        board_x = self.BOARD_X
+        board_y = self.MARGIN + self.TITLE_HEIGHT + self.BOARD_SPACING
+        return pygame.Rect(
             board_x - 5,
             board_y - 5,
-            self.BOARD_SIZE * self.CELL_SIZE + 10,
-            self.BOARD_SIZE * self.CELL_SIZE + 10
+            self.BOARD_COLS * self.CELL_SIZE + 10,
+            self.BOARD_ROWS * self.CELL_SIZE + 10
         )
-        pygame.draw.rect(self.screen, (50, 40, 30), board_rect, border_radius=15)
+    
+    def square_rect(self, pos):
+        """Rectangle of the square at pos = (row, col)"""
+        row, col = pos
+        return pygame.Rect(
+            self.BOARD_X + col * self.CELL_SIZE,
+            self.MARGIN + self.TITLE_HEIGHT + self.BOARD_SPACING + row * self.CELL_SIZE,
+            self.CELL_SIZE,
+            self.CELL_SIZE
+        )
+    
+    def draw_square(self, surface, pos, empty=False):
+        """
+        Draw one square in its current state (with its move number if visited)
         
-        # Draw squares
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                # Determine colors
-                is_light = (row + col) % 2 == 0
-                pos = (row, col)
-                
-                # Choose color based on state
-                if pos == self.knight.path[self.current_step]:
-                    # Current position - GOLD!
-                    color = self.CURRENT_SQUARE
-                elif pos == (0, 0) and self.current_step == 0:
-                    # Starting position
-                    color = self.START_SQUARE
-                elif pos in self.visited_squares:
-                    # Visited - beautiful pastels
-                    color = self.LIGHT_VISITED if is_light else self.DARK_VISITED
-                else:
-                    # Unvisited - classic chess colors
-                    color = self.LIGHT_SQUARE if is_light else self.DARK_SQUARE
-                
-                # Draw square with slight rounded corners
-                square_rect = pygame.Rect(
-                    board_x + col * self.CELL_SIZE,
-                    board_y + row * self.CELL_SIZE,
-                    self.CELL_SIZE,
-                    self.CELL_SIZE
-                )
-                pygame.draw.rect(self.screen, color, square_rect, border_radius=8)
-                
-                # Draw move number if visited
-                if pos in self.visited_squares and pos != self.knight.path[self.current_step]:
-                    try:
-                        move_num = self.knight.path.index(pos) + 1
-                        
-                        # Circle background
-                        center_x = square_rect.centerx
-                        center_y = square_rect.centery
-                        
-                        # Determine text color based on square color 
-                        is_light = (row + col) % 2 == 0
-
-                        if is_light:
-                            text_color = (30, 50, 80)
-                        else:
-                            text_color = (245, 240, 225)
-
-                        # Draw number
-                        num_text = self.font_number.render(str(move_num), True, text_color)
-                        num_rect = num_text.get_rect(center=(center_x, center_y))
-                        self.screen.blit(num_text, num_rect)
-                    except ValueError:
-                        pass
+        Args:
+            surface: Surface to draw on
+            pos: (row, col) of the square
+            empty: Draw it unvisited whatever the current step
+        """
+        row, col = pos
+        is_light = (row + col) % 2 == 0
+        current = self.knight.path[self.current_step]
+        
+        # Choose color based on state
+        if empty:
+            color = self.LIGHT_SQUARE if is_light else self.DARK_SQUARE
+        elif pos == current:
+            # Current position - GOLD!
+            color = self.CURRENT_SQUARE
+        elif pos == self.board.start and self.current_step == 0:
+            # Starting position
+            color = self.START_SQUARE
+        elif pos in self.visited_squares:
+            # Visited - beautiful pastels
+            color = self.LIGHT_VISITED if is_light else self.DARK_VISITED
+        else:
+            # Unvisited - classic chess colors
+            color = self.LIGHT_SQUARE if is_light else self.DARK_SQUARE
+        
+        # Draw square with slight rounded corners (over the board
+        # background, so redrawing a square leaves no old corners)
+        square_rect = self.square_rect(pos)
+        pygame.draw.rect(surface, self.BOARD_BACKGROUND, square_rect)
+        pygame.draw.rect(surface, color, square_rect, border_radius=8)
+        
+        # Draw move number if visited
+        if not empty and pos in self.visited_squares and pos != current:
+            step = self.step_grid[row][col]
+            if step < 0:
+                return
+            
+            # Determine text color based on square color
+            if is_light:
+                text_color = (30, 50, 80)
+            else:
+                text_color = (245, 240, 225)
+            
+            # Draw number
+            num_text = self.number_glyph(step + 1, text_color)
+            num_rect = num_text.get_rect(center=square_rect.center)
+            surface.blit(num_text, num_rect)
+    
+    def number_glyph(self, number, color):
+        """Rendered move number (rendered once per number and color)"""
+        return self.assets.get(('number', number, color),
+                               lambda: self.font_number.render(str(number), True, color))
+    
+    def font(self, size):
+        """Default font of the given size (created once)"""
+        return self.assets.get(('font', size), lambda: pygame.font.Font(None, size))
+    
+    def text(self, text, size, color):
+        """Rendered text (rendered once per text, size and color)"""
+        return self.assets.get(('text', text, size, color),
+                               lambda: self.font(size).render(text, True, color))
+    
+    def glow_rings(self, glow_size):
+        """The knight's three glow rings for one size of the pulse cycle"""
+        def build():
+            rings = []
+            for i in range(3):
+                ring = pygame.Surface((glow_size + i * 10, glow_size + i * 10), 
+                                      pygame.SRCALPHA)
+                glow_color = (255, 215, 0, 60 - i * 15)
+                pygame.draw.circle(ring, glow_color, 
+                             (glow_size // 2 + i * 5, glow_size // 2 + i * 5), 
+                             glow_size // 2 + i * 5)
+                rings.append(ring)
+            return rings
+        
+        return self.assets.get(('glow', glow_size), build)
+    
+    def overlay(self):
+        """Semi-transparent overlay behind the completion banner"""
+        def build():
+            overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), 
+                                    pygame.SRCALPHA)
+            overlay.fill((0, 0, 0, 150))
+            return overlay
+        
+        return self.assets.get('overlay', build)
+    
+    def draw_grid(self, surface):
+        """Draw the grid lines and the outer frame over the squares"""
+        board_x = self.BOARD_X
+        board_y = self.MARGIN + self.TITLE_HEIGHT + self.BOARD_SPACING
         
         # Grid lines (subtle)
-        for i in range(self.BOARD_SIZE + 1):
+        for i in range(self.BOARD_COLS + 1):
             # Vertical lines
             x = board_x + i * self.CELL_SIZE
-            pygame.draw.line(self.screen, self.GRID_COLOR, 
+            pygame.draw.line(surface, self.GRID_COLOR, 
                            (x, board_y), 
-                           (x, board_y + self.BOARD_SIZE * self.CELL_SIZE), 2)
-            
+                           (x, board_y + self.BOARD_ROWS * self.CELL_SIZE), 2)
+        
+        for i in range(self.BOARD_ROWS + 1):
             # Horizontal lines
             y = board_y + i * self.CELL_SIZE
-            pygame.draw.line(self.screen, self.GRID_COLOR, 
+            pygame.draw.line(surface, self.GRID_COLOR, 
                            (board_x, y), 
-                           (board_x + self.BOARD_SIZE * self.CELL_SIZE, y), 2)
+                           (board_x + self.BOARD_COLS * self.CELL_SIZE, y), 2)
         
         # Outer frame
-        pygame.draw.rect(self.screen, (80, 60, 40), board_rect, 4, border_radius=15)
+        pygame.draw.rect(surface, (80, 60, 40), self.board_rect(), 4, border_radius=15)
+    
+    def invalidate_layers(self):
+        """Drop the cached layers and assets so the next frame rebuilds them (e.g. after a resize)"""
+        self.assets.clear()
+        self.static_layer = None
+        self.step_layer = None
+        self.step_layer_key = None
+    
+    def build_static_layer(self):
+        """
+        Draw everything that never changes once: background, title bar
+        and the empty board with its grid
+        """
+        layer = pygame.Surface(self.screen.get_size(), 0, self.screen)  # screen's pixel format
+        layer.fill(self.BACKGROUND)
+        self.draw_title_bar(layer)
+        
+        pygame.draw.rect(layer, self.BOARD_BACKGROUND, self.board_rect(), border_radius=15)
+        for row in range(self.BOARD_ROWS):
+            for col in range(self.BOARD_COLS):
+                self.draw_square(layer, (row, col), empty=True)
+        self.draw_grid(layer)
+        
+        self.static_layer = layer
+    
+    def build_step_layer(self):
+        """
+        Draw the current step over a copy of the static layer: visited
+        squares with their numbers, the grid on top and the info panel
+        """
+        if self.static_layer is None:
+            self.build_static_layer()
+        
+        layer = self.static_layer.copy()
+        for pos in self.visited_squares:
+            self.draw_square(layer, pos)
+        self.draw_grid(layer)
+        self.draw_info_panel(layer)
+        
+        self.step_layer = layer
+        self.step_layer_key = self.current_step
+    
+    def update_step_layer(self):
+        """
+        Bring the step layer to the current step
+        
+        After a single step forward only the two squares the step touched
+        (the previous and the new position) and the info panel are
+        redrawn; anything else rebuilds the whole layer.
+        
+        Returns:
+            List of the rectangles that changed
+        """
+        key = self.step_layer_key
+        if self.step_layer is not None and key == self.current_step:
+            return []
+        if self.step_layer is None or key is None or key + 1 != self.current_step:
+            self.build_step_layer()
+            return [self.step_layer.get_rect()]
+        
+        layer = self.step_layer
+        dirty = []
+        for pos in (self.knight.path[key], self.knight.path[self.current_step]):
+            rect = self.square_rect(pos)
+            self.draw_square(layer, pos)
+            
+            # Grid lines and frame around the square go back on top
+            rect = rect.inflate(4, 4)
+            layer.set_clip(rect)
+            self.draw_grid(layer)
+            layer.set_clip(None)
+            dirty.append(rect)
+        
+        rect = self.info_rect().inflate(8, 8)
+        layer.blit(self.static_layer, rect, rect)
+        self.draw_info_panel(layer)
+        dirty.append(rect)
+        
+        self.step_layer_key = self.current_step
+        return dirty
     
-    def draw_knight(self):
-        """Draw the knight piece with bounce animation"""
+    def banner_visible(self):
+        """True while the completion banner covers the window"""
+        return self.current_step == len(self.knight.path) - 1 and not self.banner_dismissed
+    
+    def draw_frame(self, advance=1):
+        """Composite one frame: cached layers, the knight and the completion banner"""
+        self.update_step_layer()
+        
+        self.screen.blit(self.step_layer, (0, 0))
+        self.draw_knight(advance)
+        
+        # Show completion message
+        if self.banner_visible():
+            self.draw_completion_banner()
+    
+    def draw_dirty(self, dirty, advance=0):
+        """
+        Redraw only some areas of the window from the step layer, with
+        the knight on top
+        
+        Args:
+            dirty: Rectangles to restore (the knight's area is added)
+            advance: Animation frames to move the knight's effects on by
+            
+        Returns:
+            List of the rectangles to pass to pygame.display.update
+        """
+        dirty = dirty + [self.knight_rect()]
+        for rect in dirty:
+            self.screen.blit(self.step_layer, rect, rect)
+        self.draw_knight(advance)
+        return dirty
+    
+    def knight_rect(self):
+        """Area the knight and its glow can cover on its current square"""
+        center = self.square_rect(self.knight.path[self.current_step]).center
+        reach = int(50 * self.PIECE_SCALE) // 2 + 10 + 4  # glow rings + bounce
+        return pygame.Rect(center[0] - reach, center[1] - reach, 2 * reach, 2 * reach)
+    
+    def draw_knight(self, advance=1):
+        """
+        Draw the knight piece with bounce animation
+        
+        Args:
+            advance: Animation frames to move the bounce and glow on by
+                     (60 per second of animation; 0 = redraw as it is)
+        """
         if self.current_step >= len(self.knight.path):
             return
     
         row, col = self.knight.path[self.current_step]
     
-        board_x = self.MARGIN
+        board_x = self.BOARD_X
         board_y = self.MARGIN + self.TITLE_HEIGHT + self.BOARD_SPACING
     
     # Calculate center of square
@@ -223,30 +505,25 @@ class KnightTourVisualizer:
         center_y = board_y + row * self.CELL_SIZE + self.CELL_SIZE // 2
     
     # Bounce effect
-        self.knight_bounce += 0.15
+        self.knight_bounce += 0.15 * advance
         bounce_offset = int(math.sin(self.knight_bounce) * 3)
     
     # Glow effect
-        self.glow_pulse += 0.1
-        glow_size = int(45 + math.sin(self.glow_pulse) * 5)
+        self.glow_pulse += 0.1 * advance
+        glow_size = int((45 + math.sin(self.glow_pulse) * 5) * self.PIECE_SCALE)
     
-    # Draw glow
-        for i in range(3):
-            alpha_surface = pygame.Surface((glow_size + i * 10, glow_size + i * 10), 
-                                      pygame.SRCALPHA)
-            glow_color = (255, 215, 0, 60 - i * 15)
-            pygame.draw.circle(alpha_surface, glow_color, 
-                         (glow_size // 2 + i * 5, glow_size // 2 + i * 5), 
-                         glow_size // 2 + i * 5)
+    # Draw glow (rings pre-rendered per size of the pulse cycle)
+        for i, alpha_surface in enumerate(self.glow_rings(glow_size)):
             self.screen.blit(alpha_surface, 
                        (center_x - glow_size // 2 - i * 5, 
                         center_y - glow_size // 2 - i * 5 + bounce_offset))
     
     # Draw white background circle
+        radius = int(32 * self.PIECE_SCALE)
         pygame.draw.circle(self.screen, (255, 255, 255), 
-                     (center_x, center_y + bounce_offset), 32)
+                     (center_x, center_y + bounce_offset), radius)
         pygame.draw.circle(self.screen, (139, 69, 19), 
-                     (center_x, center_y + bounce_offset), 32, 3)
+                     (center_x, center_y + bounce_offset), radius, 3)
     
     # Draw knight image or fallback
         if self.has_knight_image:
@@ -255,25 +532,30 @@ class KnightTourVisualizer:
             self.screen.blit(self.knight_image, image_rect)
         else:
         # Fallback: Draw simple horse shape with text
-            knight_font = pygame.font.Font(None, 70)
-            knight_text = knight_font.render('♘', True, (139, 69, 19))
+            knight_text = self.text('♘', int(70 * self.PIECE_SCALE), (139, 69, 19))
             knight_rect = knight_text.get_rect(center=(center_x, center_y + bounce_offset))
             self.screen.blit(knight_text, knight_rect)
 
-    def draw_info_panel(self):
-      """Draw information panel at bottom"""
-      board_y = self.MARGIN + self.TITLE_HEIGHT + self.BOARD_SPACING
-      info_y = board_y + self.BOARD_SIZE * self.CELL_SIZE + self.BOARD_SPACING
-    
-    # Info background with rounded corners
-      info_rect = pygame.Rect(
+    def info_rect(self):
+        """Rectangle of the information panel"""
+        board_y = self.MARGIN + self.TITLE_HEIGHT + self.BOARD_SPACING
+        info_y = board_y + self.BOARD_ROWS * self.CELL_SIZE + self.BOARD_SPACING
+        return pygame.Rect(
             self.MARGIN,
             info_y,
             self.WINDOW_WIDTH - 2 * self.MARGIN,
             self.INFO_HEIGHT - 20  # Reduced padding
         )
-      pygame.draw.rect(self.screen, self.INFO_BG, info_rect, border_radius=12)
-      pygame.draw.rect(self.screen, self.ACCENT_COLOR, info_rect, 3, border_radius=12)
+    
+    def draw_info_panel(self, surface=None):
+      """Draw information panel at bottom"""
+      surface = surface if surface is not None else self.screen
+    
+    # Info background with rounded corners
+      info_rect = self.info_rect()
+      info_y = info_rect.y
+      pygame.draw.rect(surface, self.INFO_BG, info_rect, border_radius=12)
+      pygame.draw.rect(surface, self.ACCENT_COLOR, info_rect, 3, border_radius=12)
     
     # Stats
       stats_y = info_y + 10
@@ -282,14 +564,14 @@ class KnightTourVisualizer:
       move_text = f"Move: {self.current_step + 1} / {len(self.knight.path)}"
       self.draw_text_with_shadow(move_text, self.font_info, 
                                   self.ACCENT_COLOR, 
-                                  self.MARGIN + 20, stats_y)
+                                  self.MARGIN + 20, stats_y, surface=surface)
     
     # Fitness
-      fitness_text = f"Squares Visited: {len(self.visited_squares)} / 64"
+      fitness_text = f"Squares Visited: {len(self.visited_squares)} / {self.board.size}"
       fitness_x = self.WINDOW_WIDTH // 2 + 20
       self.draw_text_with_shadow(fitness_text, self.font_info, 
                                   self.ACCENT_COLOR, 
-                                  fitness_x, stats_y)
+                                  fitness_x, stats_y, surface=surface)
     
     # Progress bar
       progress_y = stats_y + 30
@@ -299,8 +581,8 @@ class KnightTourVisualizer:
     
     # Background
       bar_bg_rect = pygame.Rect(bar_x, progress_y, bar_width, bar_height)
-      pygame.draw.rect(self.screen, (25, 28, 40), bar_bg_rect, border_radius=8)
-      pygame.draw.rect(self.screen, (60, 60, 80), bar_bg_rect, 2, border_radius=8)
+      pygame.draw.rect(surface, (25, 28, 40), bar_bg_rect, border_radius=8)
+      pygame.draw.rect(surface, (60, 60, 80), bar_bg_rect, 2, border_radius=8)
     
     # Progress fill
       if len(self.knight.path) > 1:
@@ -312,11 +594,11 @@ class KnightTourVisualizer:
                                            progress_width, bar_height - 4)
             
             # Gradient progress bar
-                self.draw_gradient_rect(self.screen, 
+                self.draw_gradient_rect(surface, 
                                        self.TITLE_GRADIENT_TOP,
                                        self.ACCENT_COLOR,
                                        progress_rect)
-                pygame.draw.rect(self.screen, self.ACCENT_COLOR, 
+                pygame.draw.rect(surface, self.ACCENT_COLOR, 
                                progress_rect, 2, border_radius=6)
     
         # Instructions - compact
@@ -327,16 +609,14 @@ class KnightTourVisualizer:
       inst_surface = self.font_instructions.render(instructions, True, (180, 180, 200))
       inst_x = (self.WINDOW_WIDTH - inst_surface.get_width()) // 2
       self.draw_text_with_shadow(instructions, self.font_instructions, 
-                                  (180, 180, 200), inst_x, inst_y, shadow=False)
+                                  (180, 180, 200), inst_x, inst_y, shadow=False,
+                                  surface=surface)
 
 
     def draw_completion_banner(self):
         """Draw completion message with close button"""
         # Semi-transparent overlay
-        overlay = pygame.Surface((self.WINDOW_WIDTH, self.WINDOW_HEIGHT), 
-                                pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 150))
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay(), (0, 0))
         
         # Banner
         banner_rect = pygame.Rect(
@@ -359,8 +639,7 @@ class KnightTourVisualizer:
         )
         
         # Draw simple X symbol
-        x_font = pygame.font.Font(None, 32)  # Simple font
-        x_text = x_font.render('×', True, (120, 120, 120))  # Gray X
+        x_text = self.text('×', 32, (120, 120, 120))  # Gray X
         x_rect = x_text.get_rect(center=close_button_rect.center)
         self.screen.blit(x_text, x_rect)
         
@@ -368,16 +647,14 @@ class KnightTourVisualizer:
         self.close_button_rect = close_button_rect
         
         # Text
-        complete_font = pygame.font.Font(None, 48)
         complete_text = " COMPLETE! "
-        text_surf = complete_font.render(complete_text, True, (50, 150, 50))
+        text_surf = self.text(complete_text, 48, (50, 150, 50))
         text_rect = text_surf.get_rect(center=banner_rect.center)
         self.screen.blit(text_surf, text_rect)
         
         # Subtext
-        sub_font = pygame.font.Font(None, 24)
-        sub_text = f"All 64 squares visited in {len(self.knight.path)} moves!"
-        sub_surf = sub_font.render(sub_text, True, (80, 80, 80))
+        sub_text = f"All {self.board.size} squares visited in {len(self.knight.path)} moves!"
+        sub_surf = self.text(sub_text, 24, (80, 80, 80))
         sub_rect = sub_surf.get_rect(center=(banner_rect.centerx, banner_rect.centery + 30))
         self.screen.blit(sub_surf, sub_rect)
 
@@ -397,103 +674,180 @@ class KnightTourVisualizer:
     def restart(self):
         """Restart visualization"""
         self.current_step = 0
-        self.visited_squares = {(0, 0)}
+        self.visited_squares = {self.board.start}
         self.animating = False
     
-    def run(self):
-        """Main game loop"""
+    def handle_event(self, event):
+        """
+        React to one pygame event
+        
+        Returns:
+            False if the window should close
+        """
+        if event.type == pygame.QUIT:
+            return False
+        
+        # ADD THIS NEW SECTION ↓
+        elif event.type == pygame.MOUSEBUTTONDOWN:
+            # Check if clicked on close button when completion banner is shown
+            if self.current_step == len(self.knight.path) - 1:
+                if hasattr(self, 'close_button_rect') and self.close_button_rect.collidepoint(event.pos):
+                    # Hide banner by moving to previous step and back
+                    # This is a trick to dismiss the banner
+                    self.banner_dismissed = True
+        # END NEW SECTION ↑
+        
+        elif event.type == pygame.VIDEORESIZE:
+            # The cached layers no longer match the window
+            self.screen = pygame.display.get_surface()
+            self.invalidate_layers()
+        
+        elif event.type == pygame.KEYDOWN:
+            if event.key == pygame.K_RETURN:  # ENTER
+                self.next_step()
+            
+            elif event.key == pygame.K_SPACE:
+                self.auto_play()
+            
+            elif event.key == pygame.K_r:
+                self.restart()
+            
+            elif event.key == pygame.K_ESCAPE:
+                return False
+        
+        return True
+    
+    def step_animation(self):
+        """Take the next auto-play step when it is due"""
+        if self.animating:
+            current_time = time.time()
+            if current_time - self.last_update >= self.animation_speed:
+                if self.current_step < len(self.knight.path) - 1:
+                    self.next_step()
+                    self.last_update = current_time
+                else:
+                    self.animating = False
+    
+    def run(self, event_driven=True, effects_fps=30):
+        """
+        Main game loop
+        
+        Args:
+            event_driven: Redraw only what changed and sleep until something
+                          happens (see run_event_driven); False redraws the
+                          whole window 60 times per second
+            effects_fps: Frame rate of the knight's bounce and glow in the
+                         event-driven loop (0 = still knight)
+        """
+        if event_driven:
+            self.run_event_driven(effects_fps)
+            pygame.quit()
+            return
+        
         clock = pygame.time.Clock()
         running = True
         
         while running:
             # Event handling
             for event in pygame.event.get():
-                if event.type == pygame.QUIT:
+                if not self.handle_event(event):
                     running = False
-                
-                # ADD THIS NEW SECTION ↓
-                elif event.type == pygame.MOUSEBUTTONDOWN:
-                    # Check if clicked on close button when completion banner is shown
-                    if self.current_step == len(self.knight.path) - 1:
-                        if hasattr(self, 'close_button_rect') and self.close_button_rect.collidepoint(event.pos):
-                            # Hide banner by moving to previous step and back
-                            # This is a trick to dismiss the banner
-                            self.banner_dismissed = True
-                # END NEW SECTION ↑
-                
-                elif event.type == pygame.KEYDOWN:
-                    if event.key == pygame.K_RETURN:  # ENTER
-                        self.next_step()
-                    
-                    elif event.key == pygame.K_SPACE:
-                        self.auto_play()
-                    
-                    elif event.key == pygame.K_r:
-                        self.restart()
-                    
-                    elif event.key == pygame.K_ESCAPE:
-                        running = False
             
             # Animation
-            if self.animating:
-                current_time = time.time()
-                if current_time - self.last_update >= self.animation_speed:
-                    if self.current_step < len(self.knight.path) - 1:
-                        self.next_step()
-                        self.last_update = current_time
-                    else:
-                        self.animating = False
+            self.step_animation()
             
-            # Drawing
-            self.screen.fill(self.BACKGROUND)
-            self.draw_title_bar()
-            self.draw_board()
-            self.draw_knight()
-            self.draw_info_panel()
-            
-            # Show completion message
-            if self.current_step == len(self.knight.path) - 1 and not self.banner_dismissed:
-                self.draw_completion_banner()
+            # Drawing: a few blits of the cached layers, then the knight
+            self.draw_frame()
             
             pygame.display.flip()
             clock.tick(60)
         
         pygame.quit()
+    
+    def run_event_driven(self, effects_fps=30):
+        """
+        Event-driven loop: the window is only redrawn where something
+        changed, and the loop sleeps in pygame.event.wait in between
+        
+        A step redraws the two squares it touched, the info panel and the
+        knight (pygame.display.update with those rectangles). The bounce
+        and glow redraw only the knight's area, effects_fps times per
+        second, and pause while the completion banner is shown. With
+        effects_fps=0 and no auto-play the loop wakes up for input only.
+        
+        Args:
+            effects_fps: Frame rate of the knight's bounce and glow
+        """
+        effects_interval = 1 / effects_fps if effects_fps else None
+        advance = 60 / effects_fps if effects_fps else 0  # keep the 60 FPS speed
+        next_effects = time.time()
+        
+        # Mouse motion would only wake the loop up for nothing
+        pygame.event.set_blocked(pygame.MOUSEMOTION)
+        
+        redraw_all = True
+        running = True
+        
+        while running:
+            if redraw_all:
+                self.draw_frame(advance=0)
+                pygame.display.flip()
+                redraw_all = False
+            
+            # Sleep until an event, the next auto-play step or effects frame
+            wake = []
+            if self.animating:
+                wake.append(self.last_update + self.animation_speed)
+            effects = effects_interval is not None and not self.banner_visible()
+            if effects:
+                wake.append(next_effects)
+            
+            if wake:
+                timeout = int((min(wake) - time.time()) * 1000)
+                events = [pygame.event.wait(timeout)] if timeout > 0 else []
+            else:
+                events = [pygame.event.wait()]
+            events += pygame.event.get()
+            
+            step = self.current_step
+            banner = self.banner_visible()
+            knight_rect = self.knight_rect()
+            
+            for event in events:
+                if not self.handle_event(event):
+                    running = False
+                elif event.type in (pygame.VIDEORESIZE, pygame.VIDEOEXPOSE,
+                                    pygame.WINDOWEXPOSED):
+                    redraw_all = True
+            self.step_animation()
+            
+            if not running:
+                break
+            if redraw_all or self.banner_visible() != banner:
+                redraw_all = True
+                continue
+            
+            # Redraw what the step touched, then the knight's effects
+            now = time.time()
+            if self.current_step != step:
+                dirty = self.update_step_layer() + [knight_rect]
+                pygame.display.update(self.draw_dirty(dirty))
+            elif effects and now >= next_effects:
+                pygame.display.update(self.draw_dirty([], advance))
+                next_effects += effects_interval
+                if next_effects < now:
+                    next_effects = now + effects_interval
 
 
-def visualize_solution(knight):
+def visualize_solution(knight, event_driven=True, effects_fps=30):
     """
     Create and show beautiful visualization
     
     Args:
         knight: Knight object with completed path
+        event_driven: Redraw only what changed (see
+                      KnightTourVisualizer.run_event_driven)
+        effects_fps: Frame rate of the knight's bounce and glow
     """
     visualizer = KnightTourVisualizer(knight)
-    visualizer.run()
-
-
-def print_board(knight):
-    """
-    Print text representation of the board
-    """
-    board = [[' ' for _ in range(8)] for _ in range(8)]
-    
-    for i, (row, col) in enumerate(knight.path):
-        board[row][col] = str(i + 1)
-    
-    print("\n" + "="*70)
-    print("KNIGHT'S TOUR - TEXT REPRESENTATION")
-    print("="*70)
-    print("\n     " + "   ".join([str(i) for i in range(8)]))
-    print("   +" + "-----+" * 8)
-    
-    for i, row in enumerate(board):
-        print(f" {i} |", end="")
-        for cell in row:
-            if cell == ' ':
-                print(f"  .  |", end="")
-            else:
-                print(f" {cell:>2s}  |", end="")
-        print()
-        print("   +" + "-----+" * 8)
-    print()
+    visualizer.run(event_driven, effects_fps)
@@ -1,26 +1,36 @@
-import random
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import math
+import os
+import statistics
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from src.population import Population
 
-def run_single_attempt(max_gen=1000, silent=True):
+def run_single_attempt(max_gen=1000, silent=True, population_size=50, seed=None,
+                       mutation_rate=0.01, tournament_size=3):
     """Run algorithm once and return result"""
-    population = Population(50)
-    
+    population = Population(population_size, mutation_rate=mutation_rate,
+                            tournament_size=tournament_size, seed=seed)
+
     for _ in range(max_gen):
         population.check_population()
         max_fitness, best = population.evaluate()
-        
+
         if not silent and population.generation % 100 == 0:
             print(f"  Gen {population.generation}: Fitness {max_fitness}")
-        
-        if max_fitness == 64:
+
+        if max_fitness == population.board.size:
             return {
                 'success': True,
                 'generations': population.generation,
-                'fitness': 64
+                'fitness': max_fitness
             }
-        
+
         population.create_new_generation()
-    
+
     # Failed - return best achieved
     return {
         'success': False,
@@ -28,67 +38,174 @@ def run_single_attempt(max_gen=1000, silent=True):
         'fitness': max_fitness
     }
 
-def main():
-    """Test success rate over 10 runs"""
-    print("=" * 60)
-    print("TESTING SUCCESS RATE (10 runs)")
-    print("=" * 60)
-    
-    results = []
-    
-    for run in range(1, 11):
-        print(f"\nRun {run}/10:", end=" ")
-        result = run_single_attempt(max_gen=1000, silent=True)
-        results.append(result)
-        
-        if result['success']:
-            print(f"✅ SUCCESS in {result['generations']} generations")
-        else:
-            print(f"❌ FAILED (best fitness: {result['fitness']}/64)")
-    
-    # Statistics
-    print("\n" + "=" * 60)
-    print("RESULTS SUMMARY")
-    print("=" * 60)
-    
+def run_job(job):
+    """Run one seeded attempt (in a worker process) and tag it with its job"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        result = run_single_attempt(
+            max_gen=job['max_gen'],
+            population_size=job['population_size'],
+            seed=job['seed'],
+            mutation_rate=job['mutation_rate'],
+            tournament_size=job['tournament_size'],
+        )
+    result.update(job)
+    return result
+
+def config_key(result):
+    """Parameters identifying a configuration of the sweep"""
+    return (result['population_size'], result['mutation_rate'],
+            result['tournament_size'], result['max_gen'])
+
+def wilson_interval(successes, runs, z=1.96):
+    """95% Wilson score interval for a success rate"""
+    if runs == 0:
+        return 0.0, 0.0
+    rate = successes / runs
+    denominator = 1 + z * z / runs
+    center = (rate + z * z / (2 * runs)) / denominator
+    spread = z * math.sqrt(rate * (1 - rate) / runs + z * z / (4 * runs * runs)) / denominator
+    return max(0.0, center - spread), min(1.0, center + spread)
+
+def load_results(path):
+    """Previously stored results (one JSON object per line)"""
+    if not path or not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return [json.loads(line) for line in f if line.strip()]
+
+def print_summary(results):
+    """Success rate with confidence interval and generations distribution"""
+    population_size, mutation_rate, tournament_size, max_gen = config_key(results[0])
     successes = [r for r in results if r['success']]
     failures = [r for r in results if not r['success']]
-    
-    success_rate = len(successes) / len(results) * 100
-    print(f"\nSuccess Rate: {len(successes)}/10 ({success_rate:.0f}%)")
-    
+    runs = len(results)
+
+    print("\n" + "=" * 60)
+    print(f"Population {population_size} | Mutation {mutation_rate} | "
+          f"Tournament {tournament_size} | Max gen {max_gen}")
+    print("=" * 60)
+
+    low, high = wilson_interval(len(successes), runs)
+    success_rate = len(successes) / runs * 100
+    print(f"Success Rate: {len(successes)}/{runs} ({success_rate:.0f}%), "
+          f"95% CI [{low * 100:.0f}%, {high * 100:.0f}%]")
+
     if successes:
-        avg_gens = sum(r['generations'] for r in successes) / len(successes)
-        min_gens = min(r['generations'] for r in successes)
-        max_gens = max(r['generations'] for r in successes)
-        print(f"\nWhen successful:")
-        print(f"  Average generations: {avg_gens:.1f}")
-        print(f"  Fastest: {min_gens} generations")
-        print(f"  Slowest: {max_gens} generations")
-    
+        gens = sorted(r['generations'] for r in successes)
+        deciles = statistics.quantiles(gens, n=10) if len(gens) > 1 else gens * 9
+        print(f"\nGenerations to full tour:")
+        print(f"  Mean: {statistics.mean(gens):.1f}   Median: {statistics.median(gens):.1f}")
+        print(f"  P10: {deciles[0]:.0f}   P90: {deciles[-1]:.0f}   "
+              f"Fastest: {gens[0]}   Slowest: {gens[-1]}")
+
+        # Text histogram in 10 buckets up to max_gen
+        width = max(1, math.ceil(max_gen / 10))
+        for start in range(0, max_gen, width):
+            count = sum(start < g <= start + width for g in gens)
+            print(f"  {start + 1:5d}-{start + width:<5d} | {'#' * count} {count or ''}")
+
     if failures:
         avg_fitness = sum(r['fitness'] for r in failures) / len(failures)
         print(f"\nWhen failed:")
-        print(f"  Average best fitness: {avg_fitness:.1f}/64")
-        best_failure = max(r['fitness'] for r in failures)
-        print(f"  Closest attempt: {best_failure}/64")
-    
-    print("\n" + "=" * 60)
-    
-    # Recommendation
-    if success_rate >= 80:
-        print("✅ Success rate is good! No changes needed.")
-    elif success_rate >= 50:
-        print("⚠️  Success rate is okay. Consider:")
-        print("   - Increase population_size to 70-100")
-        print("   - Or run multiple attempts")
-    else:
-        print("❌ Success rate is low. Recommend:")
-        print("   - Increase population_size to 100")
-        print("   - Increase max_generations to 2000")
-        print("   - Or increase mutation rate to 0.02")
-    
+        print(f"  Average best fitness: {avg_fitness:.1f}")
+        print(f"  Closest attempt: {max(r['fitness'] for r in failures)}")
+
+def main():
+    """Test success rate over many seeded runs, optionally sweeping parameters"""
+    parser = argparse.ArgumentParser(description="Success-rate harness")
+    parser.add_argument('--runs', type=int, default=10, help="seeded runs per configuration")
+    parser.add_argument('--seed', type=int, default=0, help="first seed")
+    parser.add_argument('--workers', type=int, default=os.cpu_count(),
+                        help="worker processes")
+    parser.add_argument('--max-gen', type=int, default=1000)
+    parser.add_argument('--population-size', type=int, nargs='+', default=[50])
+    parser.add_argument('--mutation-rate', type=float, nargs='+', default=[0.01])
+    parser.add_argument('--tournament-size', type=int, nargs='+', default=[3])
+    parser.add_argument('--results', help="JSONL file to store results in and resume from")
+    args = parser.parse_args()
+
+    # Reject bad configurations before any job runs
+    if args.runs < 1 or args.workers < 1 or args.max_gen < 1:
+        parser.error("--runs, --workers and --max-gen must be at least 1")
+    if min(args.population_size) < 2:
+        parser.error("--population-size must be at least 2")
+    if not all(0 <= rate <= 1 for rate in args.mutation_rate):
+        parser.error("--mutation-rate must be between 0 and 1")
+    if min(args.tournament_size) < 1:
+        parser.error("--tournament-size must be at least 1")
+    if max(args.tournament_size) > min(args.population_size):
+        parser.error(f"--tournament-size {max(args.tournament_size)} is larger than "
+                     f"--population-size {min(args.population_size)}")
+
+    # Every (configuration, seed) pair is one job
+    jobs = [
+        {'population_size': size, 'mutation_rate': rate, 'tournament_size': tournament,
+         'max_gen': args.max_gen, 'seed': seed}
+        for size, rate, tournament in itertools.product(
+            args.population_size, args.mutation_rate, args.tournament_size)
+        for seed in range(args.seed, args.seed + args.runs)
+    ]
+
+    # Resume: skip jobs already in the results file
+    stored = load_results(args.results)
+    done = {config_key(r) + (r['seed'],) for r in stored}
+    pending = [job for job in jobs if config_key(job) + (job['seed'],) not in done]
+    wanted = {config_key(job) + (job['seed'],) for job in jobs}
+    results = [r for r in stored if config_key(r) + (r['seed'],) in wanted]
+
     print("=" * 60)
+    print(f"TESTING SUCCESS RATE ({len(jobs)} runs, {len(pending)} to go, "
+          f"{args.workers} workers)")
+    print("=" * 60)
+
+    store = open(args.results, 'a') if args.results else None
+
+    # Stream results as they finish; a failed job is reported (and left
+    # out of the results file, so a resumed sweep retries it) without
+    # stopping the others
+    errors = []
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        futures = {executor.submit(run_job, job): job for job in pending}
+        for finished, future in enumerate(as_completed(futures), 1):
+            job = futures[future]
+            try:
+                result = future.result()
+            except Exception as error:
+                errors.append((job, error))
+                print(f"[{finished}/{len(pending)}] pop={job['population_size']} "
+                      f"mut={job['mutation_rate']} tour={job['tournament_size']} "
+                      f"seed={job['seed']}: 💥 ERROR {error!r}")
+                continue
+            results.append(result)
+            if store:
+                store.write(json.dumps(result) + "\n")
+                store.flush()
+
+            status = (f"✅ SUCCESS in {result['generations']} generations" if result['success']
+                      else f"❌ FAILED (best fitness: {result['fitness']})")
+            print(f"[{finished}/{len(pending)}] pop={result['population_size']} "
+                  f"mut={result['mutation_rate']} tour={result['tournament_size']} "
+                  f"seed={result['seed']}: {status}")
+
+    if store:
+        store.close()
+
+    # Statistics per configuration
+    configs = {}
+    for result in results:
+        configs.setdefault(config_key(result), []).append(result)
+    for key in sorted(configs):
+        print_summary(configs[key])
+
+    if errors:
+        print("\n" + "=" * 60)
+        print(f"Errors in {len(errors)} of {len(pending)} runs (not stored, "
+              f"retried on resume):")
+        for job, error in errors:
+            print(f"  pop={job['population_size']} mut={job['mutation_rate']} "
+                  f"tour={job['tournament_size']} seed={job['seed']}: {error!r}")
+
+    print("\n" + "=" * 60)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()